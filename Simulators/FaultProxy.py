@@ -0,0 +1,398 @@
+"""
+Fault and latency injecting reverse proxy for the Parabank REST service.
+
+The proxy forwards everything to an upstream Parabank (a real server or Simulators.ParabankMock) over keep-alive
+connections and degrades it per endpoint: added latency drawn from a distribution, a response bandwidth cap,
+connection resets and injected 5xx responses. Point BankAPIBase (PARABANK_BASE_URL) or Locust (--host) at the
+proxy to see how the client's timeouts, retries and connection pools behave when Parabank degrades.
+
+Run from the project root:
+    python -m Simulators.FaultProxy --port 8091 --latency lognormal:40,0.6 --error-rate 0.02 \\
+        --rule "GET /accounts/{accountId}=latency=fixed:2000" --rule "POST /transfer=reset_rate=0.1"
+"""
+import math
+import time
+import random
+import socket
+import struct
+import argparse
+import threading
+import http.client
+from urllib.parse import urlsplit
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from Utils.BankAPIBase import BASE_URL
+from Simulators.ParabankMock import SERVICE_PATH, match_route
+
+# Headers that describe a single connection and are not forwarded
+HOP_HEADERS = frozenset({"connection", "keep-alive", "proxy-connection", "te", "trailer", "transfer-encoding",
+                         "upgrade", "proxy-authenticate", "proxy-authorization"})
+# Methods that may be sent again when a reused connection turns out to be stale (RFC 9110 idempotent methods)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class LatencyDistribution:
+    """
+    Random added latency in milliseconds.
+
+    Kinds and their parameters:
+        fixed:ms                - always ms
+        uniform:low,high        - uniform between low and high
+        normal:mean,stddev      - normal, clamped at 0
+        lognormal:median,sigma  - log-normal (long right tail, like real service latency)
+        exponential:mean        - exponential
+        pareto:scale,alpha      - Pareto (heavy tail; alpha <= 2 gives extreme outliers)
+    """
+
+    KINDS = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exponential": 1, "pareto": 2}
+
+    def __init__(self, kind="fixed", *params):
+        """
+        Args:
+            kind (str): One of KINDS.
+            *params (float): The kind's parameters, in milliseconds where they are times.
+
+        Raises:
+            ValueError: If the kind is unknown or has the wrong number of parameters.
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution '{kind}', expected one of {sorted(self.KINDS)}")
+        params = params or (0.0,) * self.KINDS[kind]
+        if len(params) != self.KINDS[kind]:
+            raise ValueError(f"Latency distribution '{kind}' takes {self.KINDS[kind]} parameter(s)")
+        self.kind = kind
+        self.params = tuple(float(param) for param in params)
+
+    @classmethod
+    def parse(cls, spec):
+        """Parses "kind:p1,p2" (e.g. "lognormal:40,0.6"); a bare number is a fixed latency."""
+        kind, _, params = spec.partition(":")
+        try:
+            return cls("fixed", float(kind))
+        except ValueError:
+            pass
+        try:
+            return cls(kind, *(float(param) for param in params.split(",") if param))
+        except ValueError as e:
+            raise ValueError(f"Invalid latency '{spec}': {e}")
+
+    def sample(self, rng):
+        """Draws one latency in milliseconds from the random.Random rng."""
+        kind, params = self.kind, self.params
+        if kind == "fixed":
+            value = params[0]
+        elif kind == "uniform":
+            value = rng.uniform(*params)
+        elif kind == "normal":
+            value = rng.gauss(*params)
+        elif kind == "lognormal":
+            value = rng.lognormvariate(math.log(params[0]), params[1]) if params[0] > 0 else 0.0
+        elif kind == "exponential":
+            value = rng.expovariate(1 / params[0]) if params[0] > 0 else 0.0
+        else:
+            value = params[0] * rng.paretovariate(params[1])
+        return max(value, 0.0)
+
+    def __repr__(self):
+        return f"{self.kind}:{','.join(f'{param:g}' for param in self.params)}"
+
+
+class Fault:
+    """The degradation applied to one endpoint (or to all of them, as the proxy's default)."""
+
+    FIELDS = ("latency", "bandwidth_kbps", "reset_rate", "error_rate", "error_status")
+
+    def __init__(self, latency=None, bandwidth_kbps=0.0, reset_rate=0.0, error_rate=0.0, error_status=503):
+        """
+        Args:
+            latency (LatencyDistribution | str): Latency added before the request is forwarded.
+            bandwidth_kbps (float): Response body throughput cap in kilobytes per second (0 = unlimited).
+            reset_rate (float): Probability (0-1) that the connection is reset (TCP RST) instead of forwarding.
+            error_rate (float): Probability (0-1) of answering error_status without forwarding.
+            error_status (int): Status of injected errors.
+        """
+        if isinstance(latency, str):
+            latency = LatencyDistribution.parse(latency)
+        self.latency = latency or LatencyDistribution()
+        self.bandwidth_kbps = float(bandwidth_kbps)
+        self.reset_rate = float(reset_rate)
+        self.error_rate = float(error_rate)
+        self.error_status = int(error_status)
+
+    @classmethod
+    def parse(cls, spec, base=None):
+        """
+        Parses "field=value,field=value" (fields as in FIELDS), starting from a copy of base.
+
+        Raises:
+            ValueError: If a field is unknown or a value is invalid.
+        """
+        settings = dict(vars(base)) if base is not None else {}
+        # Split on the commas that start a new "field=", so latency parameters may contain commas
+        parts, current = [], ""
+        for token in spec.split(","):
+            if "=" in token and current:
+                parts.append(current)
+                current = token
+            else:
+                current = f"{current},{token}" if current else token
+        if current:
+            parts.append(current)
+        for part in parts:
+            name, _, value = part.partition("=")
+            name = name.strip()
+            if name not in cls.FIELDS:
+                raise ValueError(f"Unknown fault field '{name}', expected one of {list(cls.FIELDS)}")
+            settings[name] = value.strip()
+        return cls(**settings)
+
+    def __repr__(self):
+        return " ".join(f"{name}={getattr(self, name)}" for name in self.FIELDS)
+
+
+class _Upstream:
+    """Keep-alive connections to the upstream server, one per proxy thread."""
+
+    def __init__(self, url, timeout):
+        parts = urlsplit(url)
+        self.host, self.port = parts.hostname, parts.port or (443 if parts.scheme == "https" else 80)
+        self.connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def request(self, method, target, body, headers):
+        """
+        Forwards one request; a stale keep-alive connection is replaced and the request sent once more.
+
+        Only idempotent methods are resent: the upstream may have processed a POST before the connection dropped,
+        so for other methods the error is raised (and answered with 502) instead of risking a duplicate.
+
+        Returns:
+            tuple: (status, reason, header list, body bytes).
+        """
+        for attempt in range(2):
+            connection = getattr(self._local, "connection", None)
+            fresh = connection is None
+            if fresh:
+                connection = self._local.connection = self.connection_class(self.host, self.port, timeout=self.timeout)
+            try:
+                connection.request(method, target, body=body, headers=headers)
+                response = connection.getresponse()
+                return response.status, response.reason, response.getheaders(), response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                connection.close()
+                self._local.connection = None
+                if fresh or attempt or method not in IDEMPOTENT_METHODS:
+                    raise
+            except Exception:
+                connection.close()
+                self._local.connection = None
+                raise
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server_version = "ParabankFaultProxy"
+    proxy = None  # Set per server class by FaultProxy
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reset(self):
+        # SO_LINGER with a zero timeout makes close() send RST instead of FIN
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        self.connection.close()
+        self.close_connection = True
+
+    def _send(self, status, reason, headers, body, bandwidth_kbps):
+        self.send_response(status, reason)
+        for name, value in headers:
+            if name.lower() not in HOP_HEADERS and name.lower() != "content-length":
+                self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if not bandwidth_kbps:
+            self.wfile.write(body)
+            return
+        # Sends ~20 chunks per second, each held back until the capped rate would have delivered it
+        rate = bandwidth_kbps * 1024
+        chunk = max(int(rate / 20), 1)
+        start = time.perf_counter()
+        for offset in range(0, len(body), chunk):
+            data = body[offset:offset + chunk]
+            delay = (offset + len(data)) / rate - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+            self.wfile.write(data)
+            self.wfile.flush()
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        endpoint, fault, action, delay_ms = self.proxy.decide(self.command, self.path)
+        if delay_ms:
+            time.sleep(delay_ms / 1000)
+        if action == "reset":
+            self._reset()
+            return
+        if action == "error":
+            message = f"Injected {fault.error_status} on {endpoint}".encode()
+            self._send(fault.error_status, None, [("Content-Type", "text/plain")], message, 0)
+            return
+        headers = {name: value for name, value in self.headers.items() if name.lower() not in HOP_HEADERS}
+        headers["Host"] = f"{self.proxy.upstream.host}:{self.proxy.upstream.port}"
+        try:
+            status, reason, response_headers, response_body = self.proxy.upstream.request(
+                self.command, self.path, body, headers
+            )
+        except (OSError, http.client.HTTPException) as e:
+            self.proxy.count("upstream_errors")
+            self._send(502, None, [("Content-Type", "text/plain")], f"Upstream error: {e}".encode(), 0)
+            return
+        self._send(status, reason, response_headers, response_body, fault.bandwidth_kbps)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = _handle
+
+
+class FaultProxy:
+    """
+    Reverse proxy in front of a Parabank base URL that injects latency, bandwidth caps, resets and 5xx errors.
+
+    Faults are chosen per endpoint - the "METHOD /template" names used throughout the framework, e.g.
+    "GET /accounts/{accountId}" - falling back to the default fault; requests outside the API get the default.
+    Rules can be changed while the proxy runs (set_fault), e.g. to degrade Parabank in the middle of a load test.
+    """
+
+    def __init__(self, upstream=None, host="127.0.0.1", port=0, default=None, rules=None, seed=None,
+                 upstream_timeout=60):
+        """
+        Args:
+            upstream (str): Upstream Parabank base URL; defaults to BASE_URL (PARABANK_BASE_URL).
+            host (str): Interface to bind.
+            port (int): Port to bind; 0 picks a free one (see base_url after start()).
+            default (Fault): Fault of endpoints without a rule (none by default).
+            rules (dict): {endpoint: Fault}.
+            seed (int): Seed for reproducible latencies and fault decisions.
+            upstream_timeout (float): Seconds to wait for the upstream server.
+        """
+        self.upstream_url = (upstream or BASE_URL).rstrip("/")
+        self.upstream = _Upstream(self.upstream_url, upstream_timeout)
+        self.host = host
+        self.port = port
+        self.default = default or Fault()
+        self.rules = dict(rules or {})
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = dict.fromkeys(("requests", "delayed", "resets", "errors", "forwarded", "upstream_errors"), 0)
+        self._server = None
+
+    def set_fault(self, endpoint, fault):
+        """Sets (or with fault=None removes) the fault of one endpoint; endpoint None sets the default."""
+        if endpoint is None:
+            self.default = fault or Fault()
+        elif fault is None:
+            self.rules.pop(endpoint, None)
+        else:
+            self.rules[endpoint] = fault
+
+    def count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def decide(self, method, target):
+        """
+        Chooses what happens to one request.
+
+        Returns:
+            tuple: (endpoint, Fault, action "forward" | "reset" | "error", added latency in ms).
+        """
+        path = urlsplit(target).path
+        route, _ = match_route(method, path[len(SERVICE_PATH):]) if path.startswith(SERVICE_PATH) else (None, None)
+        endpoint = route.endpoint if route else f"{method} {path}"
+        fault = self.rules.get(endpoint, self.default)
+        with self._lock:
+            delay_ms = fault.latency.sample(self._random)
+            roll = self._random.random()
+            if roll < fault.reset_rate:
+                action = "reset"
+            elif roll < fault.reset_rate + fault.error_rate:
+                action = "error"
+            else:
+                action = "forward"
+            self.stats["requests"] += 1
+            self.stats["delayed"] += bool(delay_ms)
+            self.stats[{"reset": "resets", "error": "errors", "forward": "forwarded"}[action]] += 1
+        return endpoint, fault, action, delay_ms
+
+    @property
+    def base_url(self):
+        """The upstream base URL as seen through the proxy, e.g. http://127.0.0.1:54321/parabank/services/bank."""
+        return f"http://{self.host}:{self.port}{urlsplit(self.upstream_url).path}"
+
+    def start(self):
+        """Starts proxying in a daemon thread and returns self."""
+        handler = type("ProxyHandler", (_ProxyHandler,), {"proxy": self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name="FaultProxy", daemon=True).start()
+        return self
+
+    def stop(self):
+        """Stops the proxy."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--upstream", default=BASE_URL, help="Upstream Parabank base URL")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8091, help="Port to bind (0 picks a free one)")
+    parser.add_argument("--latency", type=LatencyDistribution.parse, default=LatencyDistribution(),
+                        help="Default added latency, e.g. 50, uniform:10,200 or lognormal:40,0.6")
+    parser.add_argument("--bandwidth-kbps", type=float, default=0.0, help="Default response bandwidth cap (KB/s)")
+    parser.add_argument("--reset-rate", type=float, default=0.0, help="Default connection reset probability")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Default injected error probability")
+    parser.add_argument("--error-status", type=int, default=503, help="Status code of injected errors")
+    parser.add_argument("--rule", action="append", default=[], metavar="'ENDPOINT=field=value,...'",
+                        help="Per-endpoint fault on top of the defaults, e.g. 'POST /transfer=error_rate=0.2' "
+                             "(repeatable)")
+    parser.add_argument("--seed", type=int, help="Seed for reproducible faults")
+    args = parser.parse_args()
+
+    default = Fault(args.latency, args.bandwidth_kbps, args.reset_rate, args.error_rate, args.error_status)
+    rules = {}
+    for rule in args.rule:
+        endpoint, separator, spec = rule.partition("=")
+        if not separator:
+            parser.error(f"--rule '{rule}' is not ENDPOINT=field=value,...")
+        try:
+            rules[endpoint.strip()] = Fault.parse(spec, base=default)
+        except ValueError as e:
+            parser.error(str(e))
+
+    proxy = FaultProxy(args.upstream, args.host, args.port, default, rules, args.seed).start()
+    print(f"Fault proxy {proxy.base_url} -> {proxy.upstream_url}")
+    print(f"  default: {default}")
+    for endpoint, fault in rules.items():
+        print(f"  {endpoint}: {fault}")
+    print(f"export PARABANK_BASE_URL={proxy.base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        proxy.stop()
+        print(f"Proxy stats: {proxy.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,599 @@
+"""
+In-memory stand-in for the Parabank REST service (/parabank/services/bank).
+
+The routes are generated from the operations of Tests/bank_api_swagger.yaml (Utils/ParabankClient.OPERATIONS):
+every operation is dispatched to the MockBank method of the same name as its ParabankClient method, with the
+path and query parameters as snake_case keyword arguments. MockBank keeps customers, accounts, transactions and
+positions in memory with Parabank's semantics (new accounts are funded from the source account, loans create a
+LOAN account, errors are 400 with a text message), so the framework's client, pooling and load generation can be
+run and benchmarked without the Java stack. Latency and error injection are configurable globally and per
+endpoint.
+
+Run from the project root:
+    python -m Simulators.ParabankMock --port 8090 [--latency-ms 5 --jitter-ms 2 --error-rate 0.01]
+and point the suite at it with the printed PARABANK_BASE_URL / PARABANK_TEST_DATA, or start it in-process
+(pytest --mock_parabank, or ParabankMock().start() in a script).
+"""
+import re
+import json
+import time
+import random
+import argparse
+import threading
+from datetime import datetime, timezone
+from urllib.parse import urlsplit, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from Utils.BaseClass import BaseClass
+from Utils.ParabankClient import OPERATIONS
+
+SERVICE_PATH = "/parabank/services/bank"
+ACCOUNT_TYPES = ("CHECKING", "SAVINGS", "LOAN")  # Parabank's account type codes 0, 1, 2
+MONTHS = ("January", "February", "March", "April", "May", "June", "July", "August", "September", "October",
+          "November", "December")
+
+
+class MockBankError(Exception):
+    """An error response of the mock: HTTP status and Parabank-style text message."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _snake_case(name):
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def _now_ms():
+    return int(time.time() * 1000)
+
+
+def _parse_date(value):
+    """Parses Parabank's MM-dd-yyyy path dates into an epoch-millisecond day range [start, end)."""
+    try:
+        day = datetime.strptime(value, "%m-%d-%Y").replace(tzinfo=timezone.utc)
+    except ValueError:
+        raise MockBankError(400, f"Invalid date '{value}', expected MM-dd-yyyy")
+    start = int(day.timestamp() * 1000)
+    return start, start + 86400000
+
+
+def _number(value, name):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise MockBankError(400, f"Invalid or missing parameter '{name}'")
+
+
+def _integer(value, name):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise MockBankError(400, f"Invalid or missing parameter '{name}'")
+
+
+def _amount_text(amount):
+    return f"{amount:.2f}".rstrip("0").rstrip(".")
+
+
+class MockBank:
+    """
+    Thread-safe in-memory Parabank data model; one public method per supported API operation.
+
+    Methods take the operation's parameters as strings (as they arrive in the URL) and return a JSON-serializable
+    object, a text message, or None for an empty 204 response. They raise MockBankError for Parabank's error
+    responses.
+    """
+
+    CUSTOMER_ID = 12212  # John Smith, Parabank's demo customer (login john/demo)
+    FIRST_ACCOUNT_ID = 12345
+    ACCOUNT_ID_STEP = 111  # Parabank's account IDs: 12345, 12456, 12567 ...
+    SEED_ACCOUNTS = 15  # Accounts of the demo customer after initializeDB
+    SEED_BALANCE = 5000.0  # Starting balance of the seeded accounts
+    LOW_BALANCE_ACCOUNT_ID = 13788  # Seeded with LOW_BALANCE (the suite's insufficient-funds cases use it)
+    LOW_BALANCE = 100.0
+    NEW_ACCOUNT_TRANSFER = 100.0  # Moved from the source account into every new account
+    LOAN_PROVIDER = "Parabank Mock"
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.initialize_db()
+
+    # --- Internal helpers ---
+
+    def _account(self, account_id):
+        account = self.accounts.get(_integer(account_id, "accountId"))
+        if account is None:
+            raise MockBankError(400, f"Could not find account #{account_id}")
+        return account
+
+    def _customer(self, customer_id):
+        customer = self.customers.get(_integer(customer_id, "customerId"))
+        if customer is None:
+            raise MockBankError(400, f"Could not find customer #{customer_id}")
+        return customer
+
+    def _new_account(self, customer_id, account_type, balance):
+        account_id = self._next_account_id
+        self._next_account_id += self.ACCOUNT_ID_STEP
+        self.accounts[account_id] = {"id": account_id, "customerId": customer_id, "type": account_type,
+                                     "balance": round(balance, 2)}
+        return self.accounts[account_id]
+
+    def _post(self, account, kind, amount, description):
+        account["balance"] = round(account["balance"] + (amount if kind == "Credit" else -amount), 2)
+        transaction = {"id": self._next_transaction_id, "accountId": account["id"], "type": kind,
+                       "date": _now_ms(), "amount": round(amount, 2), "description": description}
+        self._next_transaction_id += 1
+        self.transactions.append(transaction)
+        return transaction
+
+    def _account_transactions(self, account_id):
+        account = self._account(account_id)
+        return [transaction for transaction in self.transactions if transaction["accountId"] == account["id"]]
+
+    # --- Administration ---
+
+    def initialize_db(self):
+        with self._lock:
+            self.customers = {
+                self.CUSTOMER_ID: {
+                    "id": self.CUSTOMER_ID, "firstName": "John", "lastName": "Smith",
+                    "address": {"street": "1431 Main St", "city": "Beverly Hills", "state": "CA",
+                                "zipCode": "90210"},
+                    "phoneNumber": "310-447-4121", "ssn": "622-11-9999"
+                }
+            }
+            self.credentials = {("john", "demo"): self.CUSTOMER_ID}
+            self.accounts = {}
+            self.transactions = []
+            self.positions = {}
+            self._next_account_id = self.FIRST_ACCOUNT_ID
+            self._next_transaction_id = 14476
+            self._next_position_id = 12345
+            for index in range(self.SEED_ACCOUNTS):
+                account = self._new_account(self.CUSTOMER_ID, "SAVINGS" if index % 3 == 1 else "CHECKING", 0.0)
+                balance = self.LOW_BALANCE if account["id"] == self.LOW_BALANCE_ACCOUNT_ID else self.SEED_BALANCE
+                self._post(account, "Credit", balance, "Funds Transfer Received")
+
+    def clean_db(self):
+        with self._lock:
+            self.initialize_db()
+            # cleanDB drops everything but the demo customer's first account
+            first = self.accounts[self.FIRST_ACCOUNT_ID]
+            self.accounts = {first["id"]: first}
+            self.transactions = [t for t in self.transactions if t["accountId"] == first["id"]]
+
+    def set_parameter(self, name, value):
+        return None
+
+    def startup_jms_listener(self):
+        return None
+
+    def shutdown_jms_listener(self):
+        return None
+
+    # --- Customers ---
+
+    def login(self, username, password):
+        with self._lock:
+            customer_id = self.credentials.get((username, password))
+            if customer_id is None:
+                raise MockBankError(400, "Invalid username and/or password")
+            return self.customers[customer_id]
+
+    def get_customer(self, customer_id):
+        with self._lock:
+            return self._customer(customer_id)
+
+    def update_customer(self, customer_id, first_name=None, last_name=None, street=None, city=None, state=None,
+                        zip_code=None, phone_number=None, ssn=None, username=None, password=None):
+        with self._lock:
+            customer = self._customer(customer_id)
+            customer.update({key: value for key, value in (("firstName", first_name), ("lastName", last_name),
+                                                           ("phoneNumber", phone_number), ("ssn", ssn)) if value})
+            customer["address"].update({key: value for key, value in (("street", street), ("city", city),
+                                                                      ("state", state), ("zipCode", zip_code))
+                                        if value})
+            if username and password:
+                self.credentials[(username, password)] = customer["id"]
+            return "Successfully updated customer profile"
+
+    def get_accounts(self, customer_id):
+        with self._lock:
+            customer = self._customer(customer_id)
+            return [account for account in self.accounts.values() if account["customerId"] == customer["id"]]
+
+    # --- Accounts and money movements ---
+
+    def get_account(self, account_id):
+        with self._lock:
+            return self._account(account_id)
+
+    def create_account(self, customer_id=None, new_account_type=None, from_account_id=None):
+        with self._lock:
+            customer = self._customer(customer_id)
+            account_type = _integer(new_account_type, "newAccountType")
+            if not 0 <= account_type < len(ACCOUNT_TYPES):
+                raise MockBankError(400, f"Invalid account type {new_account_type}")
+            if _integer(from_account_id, "fromAccountId") not in self.accounts:
+                raise MockBankError(400, f"Could not create new account for customer {customer['id']} "
+                                         f"from account #{from_account_id}")
+            source = self.accounts[int(from_account_id)]
+            account = self._new_account(customer["id"], ACCOUNT_TYPES[account_type], 0.0)
+            self._post(source, "Debit", self.NEW_ACCOUNT_TRANSFER, "Funds Transfer Sent")
+            self._post(account, "Credit", self.NEW_ACCOUNT_TRANSFER, "Funds Transfer Received")
+            return account
+
+    def deposit(self, account_id=None, amount=None):
+        with self._lock:
+            account = self._account(account_id)
+            value = _number(amount, "amount")
+            self._post(account, "Credit", value, "Deposit via Web Service")
+            return f"Successfully deposited ${_amount_text(value)} to account #{account['id']}"
+
+    def withdraw(self, account_id=None, amount=None):
+        with self._lock:
+            account = self._account(account_id)
+            value = _number(amount, "amount")
+            self._post(account, "Debit", value, "Withdrawal via Web Service")
+            return f"Successfully withdrew ${_amount_text(value)} from account #{account['id']}"
+
+    def transfer(self, from_account_id=None, to_account_id=None, amount=None):
+        with self._lock:
+            source, target = self._account(from_account_id), self._account(to_account_id)
+            value = _number(amount, "amount")
+            self._post(source, "Debit", value, "Funds Transfer Sent")
+            self._post(target, "Credit", value, "Funds Transfer Received")
+            return (f"Successfully transferred ${_amount_text(value)} from account #{source['id']} "
+                    f"to account #{target['id']}")
+
+    def bill_pay(self, account_id=None, amount=None, body=None):
+        with self._lock:
+            account = self._account(account_id)
+            value = _number(amount, "amount")
+            if not isinstance(body, dict) or not body.get("name"):
+                raise MockBankError(400, "A payee with a name is required")
+            self._post(account, "Debit", value, f"Bill Payment to {body['name']}")
+            return {"payeeName": body["name"], "amount": value, "accountId": account["id"]}
+
+    def request_loan(self, customer_id=None, amount=None, down_payment=None, from_account_id=None):
+        with self._lock:
+            customer = self._customer(customer_id)
+            source = self._account(from_account_id)
+            loan_amount, down = _number(amount, "amount"), _number(down_payment, "downPayment")
+            response = {"responseDate": _now_ms(), "loanProviderName": self.LOAN_PROVIDER, "approved": False,
+                        "message": None, "accountId": None}
+            if down > source["balance"]:
+                response["message"] = "error.insufficient.funds.for.down.payment"
+                return response
+            loan = self._new_account(customer["id"], "LOAN", 0.0)
+            self._post(source, "Debit", down, "Down Payment for Loan")
+            self._post(loan, "Credit", loan_amount, "Funds Transfer Received")
+            response.update(approved=True, accountId=loan["id"])
+            return response
+
+    # --- Transactions ---
+
+    def get_transactions(self, account_id):
+        with self._lock:
+            return self._account_transactions(account_id)
+
+    def get_transaction(self, transaction_id):
+        with self._lock:
+            wanted = _integer(transaction_id, "transactionId")
+            for transaction in self.transactions:
+                if transaction["id"] == wanted:
+                    return transaction
+            raise MockBankError(400, f"Could not find transaction #{transaction_id}")
+
+    def get_transactions_by_amount(self, account_id, amount):
+        with self._lock:
+            value = _number(amount, "amount")
+            return [t for t in self._account_transactions(account_id) if t["amount"] == value]
+
+    def get_transactions_on_date(self, account_id, on_date):
+        start, end = _parse_date(on_date)
+        with self._lock:
+            return [t for t in self._account_transactions(account_id) if start <= t["date"] < end]
+
+    def get_transactions_by_to_from_date(self, account_id, from_date, to_date):
+        start, _ = _parse_date(from_date)
+        _, end = _parse_date(to_date)
+        with self._lock:
+            return [t for t in self._account_transactions(account_id) if start <= t["date"] < end]
+
+    def get_transactions_by_month_and_type(self, account_id, month, type):
+        with self._lock:
+            transactions = self._account_transactions(account_id)
+        if month != "All":
+            number = MONTHS.index(month) + 1 if month in MONTHS else _integer(month, "month")
+            transactions = [t for t in transactions
+                            if datetime.fromtimestamp(t["date"] / 1000, timezone.utc).month == number]
+        if type != "All":
+            transactions = [t for t in transactions if t["type"] == type]
+        return transactions
+
+    # --- Positions ---
+
+    def get_positions(self, customer_id):
+        with self._lock:
+            customer = self._customer(customer_id)
+            return [position for position in self.positions.values() if position["customerId"] == customer["id"]]
+
+    def get_position(self, position_id):
+        with self._lock:
+            position = self.positions.get(_integer(position_id, "positionId"))
+            if position is None:
+                raise MockBankError(400, f"Could not find position #{position_id}")
+            return position
+
+    def get_position_history(self, position_id, start_date, end_date):
+        start, _ = _parse_date(start_date)
+        _, end = _parse_date(end_date)
+        position = self.get_position(position_id)
+        return [{"symbol": position["symbol"], "date": day, "closingPrice": position["purchasePrice"]}
+                for day in range(start, end, 86400000)]
+
+    def buy_position(self, customer_id, account_id=None, name=None, symbol=None, shares=None, price_per_share=None):
+        with self._lock:
+            customer = self._customer(customer_id)
+            account = self._account(account_id)
+            count, price = _integer(shares, "shares"), _number(price_per_share, "pricePerShare")
+            if count * price > account["balance"]:
+                raise MockBankError(400, "Insufficient funds to buy the position")
+            self._post(account, "Debit", count * price, f"Buy {count} shares of {symbol}")
+            position_id = self._next_position_id
+            self._next_position_id += 1
+            self.positions[position_id] = {"positionId": position_id, "customerId": customer["id"], "name": name,
+                                           "symbol": symbol, "shares": count, "purchasePrice": price}
+            return self.get_positions(customer_id)
+
+    def sell_position(self, customer_id, account_id=None, position_id=None, shares=None, price_per_share=None):
+        with self._lock:
+            account = self._account(account_id)
+            position = self.get_position(position_id)
+            count, price = _integer(shares, "shares"), _number(price_per_share, "pricePerShare")
+            if count > position["shares"]:
+                raise MockBankError(400, "Cannot sell more shares than held")
+            position["shares"] -= count
+            if not position["shares"]:
+                del self.positions[position["positionId"]]
+            self._post(account, "Credit", count * price, f"Sell {count} shares of {position['symbol']}")
+            return self.get_positions(customer_id)
+
+    # --- Test data ---
+
+    def test_data(self):
+        """Returns the demo customer's test data in BaseClass.shared_test_data() shape (accounts above MIN_TEST_ACCOUNT_ID)."""
+        with self._lock:
+            account_ids = sorted(account_id for account_id, account in self.accounts.items()
+                                 if account["customerId"] == self.CUSTOMER_ID
+                                 and account_id > BaseClass.MIN_TEST_ACCOUNT_ID)
+        return {"ACCOUNT_ID_LIST": [(account_id,) for account_id in account_ids],
+                "BASE_ACCOUNT_ID": account_ids[0], "CUSTOMER_ID": [(self.CUSTOMER_ID,)]}
+
+
+class Route:
+    """One API operation's method and path template, compiled for matching request paths."""
+
+    __slots__ = ("method", "pattern", "endpoint", "handler", "path_params")
+
+    def __init__(self, operation):
+        self.method = operation.method
+        self.endpoint = operation.endpoint
+        self.handler = operation.name
+        self.path_params = re.findall(r"{(\w+)}", operation.path)
+        regex = re.sub(r"{(\w+)}", r"(?P<\1>[^/]+)", operation.path)  # Templates hold no other regex syntax
+        self.pattern = re.compile(f"^{regex}$")
+
+
+ROUTES = [Route(operation) for operation in OPERATIONS.values()]
+
+
+def match_route(method, path):
+    """
+    Finds the operation serving a request.
+
+    Args:
+        method (str): HTTP method.
+        path (str): Request path below SERVICE_PATH, e.g. "/accounts/13455".
+
+    Returns:
+        tuple: (Route, {path parameter: value}), or (None, None) if no operation matches.
+    """
+    for route in ROUTES:
+        if route.method == method:
+            match = route.pattern.match(path)
+            if match:
+                return route, match.groupdict()
+    return None, None
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, so client connection pooling behaves as against Parabank
+    disable_nagle_algorithm = True
+    wbufsize = 1 << 16  # Send headers and body in one write
+    server_version = "ParabankMock"
+    mock = None  # Set per server class by ParabankMock
+
+    def log_message(self, format, *args):
+        pass
+
+    def _respond(self, status, body=b"", content_type="application/json"):
+        self.send_response(status)
+        if status != 204:
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if status != 204:
+            self.wfile.write(body)
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        status, body, content_type = self.mock.dispatch(self.command, self.path, raw_body)
+        self._respond(status, body, content_type)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+
+class ParabankMock:
+    """
+    Local HTTP server serving MockBank under /parabank/services/bank, with latency and error injection.
+
+    Latency per request is latency_ms + uniform(0, jitter_ms), or the endpoint's entry in endpoint_latency_ms;
+    a request fails with error_status and a text body with probability error_rate (or the endpoint's entry in
+    endpoint_error_rate). Endpoints are the "METHOD /template" names used throughout the framework, e.g.
+    "GET /accounts/{accountId}".
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, error_status=500,
+                 endpoint_latency_ms=None, endpoint_error_rate=None, seed=None):
+        """
+        Args:
+            host (str): Interface to bind.
+            port (int): Port to bind; 0 picks a free one (see base_url after start()).
+            latency_ms (float): Added latency of every request.
+            jitter_ms (float): Upper bound of the uniformly distributed extra latency.
+            error_rate (float): Probability (0-1) that a request fails with error_status.
+            error_status (int): Status of injected errors.
+            endpoint_latency_ms (dict): Per-endpoint latency overriding latency_ms.
+            endpoint_error_rate (dict): Per-endpoint error probability overriding error_rate.
+            seed (int): Seed for reproducible jitter and error injection.
+        """
+        self.bank = MockBank()
+        self.host = host
+        self.port = port
+        self.configure(latency_ms=latency_ms, jitter_ms=jitter_ms, error_rate=error_rate, error_status=error_status,
+                       endpoint_latency_ms=endpoint_latency_ms or {}, endpoint_error_rate=endpoint_error_rate or {})
+        self._random = random.Random(seed)
+        self._server = None
+        self._thread = None
+        self.requests = 0
+        self.injected_errors = 0
+
+    def configure(self, **settings):
+        """Changes latency/error injection settings at runtime (same keyword names as the constructor)."""
+        for name, value in settings.items():
+            if name not in ("latency_ms", "jitter_ms", "error_rate", "error_status", "endpoint_latency_ms",
+                            "endpoint_error_rate"):
+                raise ValueError(f"Unknown mock setting '{name}'")
+            setattr(self, name, value)
+
+    @property
+    def base_url(self):
+        """Base URL of the service, e.g. http://127.0.0.1:54321/parabank/services/bank."""
+        return f"http://{self.host}:{self.port}{SERVICE_PATH}"
+
+    def start(self):
+        """Starts serving in a daemon thread and returns self."""
+        handler = type("MockHandler", (_MockHandler,), {"mock": self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="ParabankMock", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops the server."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def test_data(self):
+        """Returns the seeded test data in BaseClass.shared_test_data() shape."""
+        return self.bank.test_data()
+
+    def bind_test_data(self):
+        """Binds this process's BaseClass test data to the mock's accounts, so no HSQLDB query is made."""
+        data = self.test_data()
+        BaseClass.bind_test_data(data["ACCOUNT_ID_LIST"], data["CUSTOMER_ID"], data["BASE_ACCOUNT_ID"])
+
+    def test_data_env(self):
+        """Returns the test data as the PARABANK_TEST_DATA value for subprocesses (Locust workers ...)."""
+        data = self.test_data()
+        return json.dumps({key: [list(row) for row in value] if isinstance(value, list) else value
+                           for key, value in data.items()})
+
+    def dispatch(self, method, target, raw_body):
+        """
+        Handles one request.
+
+        Returns:
+            tuple: (status, body bytes, content type).
+        """
+        self.requests += 1
+        url = urlsplit(target)
+        if not url.path.startswith(SERVICE_PATH):
+            return 404, b"Not Found", "text/plain"
+        route, path_params = match_route(method, url.path[len(SERVICE_PATH):])
+        if route is None:
+            return 404, b"Not Found", "text/plain"
+
+        delay = self.endpoint_latency_ms.get(route.endpoint, self.latency_ms)
+        if self.jitter_ms:
+            delay += self._random.uniform(0, self.jitter_ms)
+        if delay:
+            time.sleep(delay / 1000)
+        if self._random.random() < self.endpoint_error_rate.get(route.endpoint, self.error_rate):
+            self.injected_errors += 1
+            return self.error_status, f"Injected error on {route.endpoint}".encode(), "text/plain"
+
+        handler = getattr(self.bank, route.handler, None)
+        if handler is None:
+            return 501, f"{route.endpoint} is not implemented by the mock".encode(), "text/plain"
+        kwargs = {_snake_case(name): value for name, value in path_params.items()}
+        kwargs.update({_snake_case(name): values[0] for name, values in parse_qs(url.query).items()})
+        if raw_body:
+            try:
+                kwargs["body"] = json.loads(raw_body)
+            except ValueError:
+                return 400, b"Malformed JSON body", "text/plain"
+        try:
+            result = handler(**kwargs)
+        except MockBankError as e:
+            return e.status, e.message.encode(), "text/plain"
+        except TypeError as e:
+            return 400, f"Bad request for {route.endpoint}: {e}".encode(), "text/plain"
+        if result is None:
+            return 204, b"", None
+        if isinstance(result, str):
+            return 200, result.encode(), "text/plain"
+        return 200, json.dumps(result).encode(), "application/json"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8090, help="Port to bind (0 picks a free one)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform extra latency upper bound")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of an injected error (0-1)")
+    parser.add_argument("--error-status", type=int, default=500, help="Status code of injected errors")
+    parser.add_argument("--seed", type=int, help="Seed for reproducible jitter and errors")
+    args = parser.parse_args()
+
+    mock = ParabankMock(args.host, args.port, args.latency_ms, args.jitter_ms, args.error_rate, args.error_status,
+                        seed=args.seed).start()
+    print(f"Parabank mock serving {len(ROUTES)} operations at {mock.base_url}")
+    print(f"export PARABANK_BASE_URL={mock.base_url}")
+    print(f"export PARABANK_TEST_DATA='{mock.test_data_env()}'")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        mock.stop()
+
+
+if __name__ == "__main__":
+    main()
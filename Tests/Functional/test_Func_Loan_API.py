@@ -36,8 +36,8 @@ class TestBankLoanAPI(BankAPIBase):
         log.info(f"Initial balance for account {self.BASE_ACCOUNT_ID}: {initial_balance}")
 
         # Step 2: Apply for a loan
-        approval_status = self.get_loan_approval(self.CUSTOMER_ID[0][0], loan_amount, down_payment,
-                                                 self.BASE_ACCOUNT_ID)
+        loan_response = self.request_loan(self.CUSTOMER_ID[0][0], loan_amount, down_payment, self.BASE_ACCOUNT_ID)
+        approval_status = loan_response.get('approved', False)
 
         # Assert the loan approval status matches expected approval
         assert approval_status == expected_approval, f"Loan approval status {approval_status} did not match expected {expected_approval}"
@@ -45,7 +45,11 @@ class TestBankLoanAPI(BankAPIBase):
         # If approval is successful, proceed with further assertions
         if approval_status:
             # Step 3: Retrieve the new loan account if loan is approved
-            new_loan_account = self.execute_db_query("SELECT MAX(ID) FROM PUBLIC.ACCOUNT")
+            # (taken from the loan response rather than MAX(ID), which races with parallel workers)
+            new_loan_account_id = loan_response.get('accountId')
+            new_loan_account = self.execute_db_query("SELECT ID FROM PUBLIC.ACCOUNT WHERE ID = ?",
+                                                     (new_loan_account_id,))
+            assert new_loan_account, f"Loan account {new_loan_account_id} was not found in the database"
             log.info(f"New loan account created with ID: {new_loan_account[0][0]}")
 
             # Retrieve the account details and perform assertions
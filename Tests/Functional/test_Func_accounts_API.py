@@ -1,27 +1,28 @@
 import pytest
+from datetime import date, timedelta
 from Utils.BankAPIBase import BankAPIBase
+from Utils.LatencyStats import LatencyStats
+from Utils.ParabankModels import Account
 
 
 class TestBankAccountsAPI(BankAPIBase):
 
     @pytest.fixture
-    def initial_balance(self):
-        """Fixture to get the initial balance of the sample account before each test."""
+    def account_id(self, pooled_account):
+        """Fixture to lease a pre-funded test account from the account pool for the duration of the test."""
+        return pooled_account.account_id
+
+    @pytest.fixture
+    def initial_balance(self, pooled_account):
+        """Fixture to get the initial balance of the leased account, tracked locally by the account pool."""
         log = self.get_logger()
-        try:
-            initial_balance = self.get_account_balance(self.BASE_ACCOUNT_ID)
-            log.info(f"Initial balance for account {self.BASE_ACCOUNT_ID}: {initial_balance}")
-            return initial_balance
-        except ValueError as e:
-            # Log the error when get_account_balance fails
-            log.error(f"Failed to retrieve initial balance: {e}")
-            # Optionally, re-raise the exception if you want the test to fail
-            raise
+        log.info(f"Initial balance for account {pooled_account.account_id}: {pooled_account.balance}")
+        return pooled_account.balance
 
     # @pytest.mark.skip
     @pytest.mark.Sanity
     @pytest.mark.Regression
-    def test_open_new_account(self, initial_balance):
+    def test_open_new_account(self, initial_balance, account_id):
         """
         Test case for creating a new bank account for a specific customer.
 
@@ -46,15 +47,15 @@ class TestBankAccountsAPI(BankAPIBase):
         # Parameters for new account creation
         customer_id = self.CUSTOMER_ID
         account_type = 1  # Assuming 1 represents a specific account type like CHECKING
-        source_account_id = self.BASE_ACCOUNT_ID
+        source_account_id = account_id
 
         log.info("Attempting to create a new account.")
-        log.info(f"Withdrawing $100 from account {self.BASE_ACCOUNT_ID} to allocate to the new account")
+        log.info(f"Withdrawing $100 from account {account_id} to allocate to the new account")
 
         new_account_id = self.create_new_account(self.CUSTOMER_ID[0], account_type, source_account_id)
 
         # Verify updated balance in source account
-        updated_balance = self.get_account_balance(self.BASE_ACCOUNT_ID)
+        updated_balance = self.get_account_balance(account_id)
         new_account_balance = self.get_account_balance(new_account_id)
 
         log.info(f"Updated balance after creating new account: {updated_balance}")
@@ -70,6 +71,78 @@ class TestBankAccountsAPI(BankAPIBase):
         log.info(
             f"New account created successfully with ID: {new_account_id} and balance of ${int(new_account_balance)}")
 
+    @pytest.mark.Regression
+    def test_balances_concurrent_fan_out(self, async_bank_api):
+        """
+        Test case for fetching the balances of every test account concurrently with the async client.
+
+        Steps:
+        1. Fan out `get_account_balance` over ACCOUNT_ID_LIST with bounded concurrency.
+        2. Assert a numeric balance was returned for every account.
+        3. Assert the base account's balance matches the one returned by the sync client.
+        """
+        log = self.get_logger()
+
+        balances = async_bank_api.run(async_bank_api.get_balances(self.ACCOUNT_ID_LIST))
+        log.info(f"Fetched {len(balances)} balances concurrently")
+
+        assert len(balances) == len(self.ACCOUNT_ID_LIST), "Not every account balance was fetched"
+        assert all(isinstance(balance, (int, float)) for balance in balances.values()), \
+            f"Non numeric balance returned: {balances}"
+        assert balances[self.BASE_ACCOUNT_ID] == self.get_account_balance(self.BASE_ACCOUNT_ID), \
+            "Async and sync clients returned different balances for the base account"
+
+    @pytest.mark.Regression
+    def test_async_client_models_and_latency(self, request, async_bank_api):
+        """
+        Test case for the async client's decoding and latency recording.
+
+        Steps:
+        1. Fetch the base account with the async client and assert it is the same Account model the sync client
+           returns.
+        2. Assert the request was recorded under this test with the sync client's endpoint name.
+        3. Fetch it again inside LatencyStats.unattributed() and assert the test's count did not change.
+        """
+        endpoint = "GET /accounts/{accountId}"
+
+        def test_count():
+            stats = LatencyStats.test_stats(request.node.nodeid).get(endpoint)
+            return stats.count if stats is not None else 0
 
+        before = test_count()
+        account = async_bank_api.run(async_bank_api.get_account_by_id(self.BASE_ACCOUNT_ID))
+        assert isinstance(account, Account), f"Async client returned {type(account).__name__}, not Account"
+        assert account == self.get_account_by_id(self.BASE_ACCOUNT_ID), "Async and sync clients decoded differently"
+        assert test_count() == before + 2, "Async request was not recorded under the running test"
 
+        with LatencyStats.unattributed():
+            async_bank_api.run(async_bank_api.get_account_by_id(self.BASE_ACCOUNT_ID))
+        assert test_count() == before + 2, "Unattributed async request was recorded under the running test"
 
+    @pytest.mark.Regression
+    def test_stream_transaction_history(self, pooled_account):
+        """
+        Test case for streaming transaction history in date windows.
+
+        Steps:
+        1. Deposit a distinctive amount into a pooled account.
+        2. Stream the last 90 days of its history in 7-day windows and find the deposit.
+        3. Stream every test account's history concurrently and assert each record belongs to its account.
+        """
+        log = self.get_logger()
+        amount = 13.37
+        self.deposit_to_account(pooled_account.account_id, amount)
+
+        start = date.today() - timedelta(days=90)
+        history = list(self.iter_transactions(pooled_account.account_id, start, window_days=7))
+        log.info(f"Streamed {len(history)} transactions of account {pooled_account.account_id}")
+
+        assert any(t.amount == amount and t.type == "Credit" for t in history), \
+            f"Deposit of {amount} missing from the streamed history"
+        assert len({t.id for t in history}) == len(history), "A transaction was yielded by two windows"
+
+        streamed = 0
+        for account_id, transaction in self.iter_accounts_transactions(self.ACCOUNT_ID_LIST, start, window_days=30):
+            assert transaction.account_id == account_id, f"Transaction {transaction.id} yielded for {account_id}"
+            streamed += 1
+        log.info(f"Streamed {streamed} transactions of {len(self.ACCOUNT_ID_LIST)} accounts concurrently")
@@ -1,22 +1,37 @@
 import pytest
-from faker import Faker
 from Utils.BankAPIBase import BankAPIBase
+from Utils.BalanceLedger import BalanceMismatchError
 
 
 class TestBankCustomersAPI(BankAPIBase):
     @pytest.fixture()
-    def initial_balance(self):
-        """Fixture to get the initial balance of the sample account before each test.
+    def account_id(self, pooled_account):
+        """Fixture to lease a pre-funded test account from the account pool for the duration of the test."""
+        return pooled_account.account_id
+
+    @pytest.fixture()
+    def initial_balance(self, pooled_account):
+        """Fixture to get the initial balance of the leased account before each test.
 
         Steps:
-        1. Retrieve the account balance using `get_account_balance`.
-        2. Return the balance for use in tests.
+        1. Lease a funded account from the account pool.
+        2. Return its balance, tracked locally by the pool (no HTTP round trip before the test).
         """
         log = self.get_logger()
-        # Get initial balance of the account and log the information
-        init_balance = self.get_account_balance(self.BASE_ACCOUNT_ID)
-        log.info(f"Initial balance for account {self.BASE_ACCOUNT_ID}: {init_balance}")
-        return init_balance
+        # Log the initial balance of the leased account
+        log.info(f"Initial balance for account {pooled_account.account_id}: {pooled_account.balance}")
+        return pooled_account.balance
+
+    @pytest.fixture()
+    def ledgered_account(self, pooled_account, balance_ledger, billpay_payloads):
+        """Fixture to lease a funded account tracked by the balance ledger, plus a pre-generated billpay payee.
+
+        Steps:
+        1. Lease a funded account from the account pool; the ledger starts from its locally known balance.
+        2. Take the next fake payee (JSON bytes) from the billpay payload pool.
+        3. Return (account ID, ledger, payee).
+        """
+        return pooled_account.account_id, balance_ledger, billpay_payloads.next()
 
     #@pytest.mark.skip
     @pytest.mark.Regression
@@ -44,7 +59,7 @@ class TestBankCustomersAPI(BankAPIBase):
     # @pytest.mark.skip
     @pytest.mark.Sanity
     @pytest.mark.Regression
-    def test_deposit_and_balance_update(self, initial_balance):
+    def test_deposit_and_balance_update(self, initial_balance, account_id):
         """
         Tests deposit functionality and verifies the balance is updated correctly.
         Ensures the updated balance matches the expected amount after deposit.
@@ -58,12 +73,12 @@ class TestBankCustomersAPI(BankAPIBase):
         deposit_amount = 5000
 
         # Log deposit attempt
-        log.info(f"Depositing {deposit_amount} to account {self.BASE_ACCOUNT_ID}")
+        log.info(f"Depositing {deposit_amount} to account {account_id}")
         # Perform deposit
-        self.deposit_to_account(self.BASE_ACCOUNT_ID, deposit_amount)
+        self.deposit_to_account(account_id, deposit_amount)
 
         # Verify updated balance
-        updated_balance = self.get_account_balance(self.BASE_ACCOUNT_ID)
+        updated_balance = self.get_account_balance(account_id)
         log.info(f"Updated balance after deposit: {updated_balance}")
 
         # Assert that the updated balance is correct
@@ -73,7 +88,7 @@ class TestBankCustomersAPI(BankAPIBase):
     #@pytest.mark.skip
     @pytest.mark.Sanity
     @pytest.mark.Regression
-    def test_withdrawal_and_balance_update(self, initial_balance):
+    def test_withdrawal_and_balance_update(self, initial_balance, account_id):
         """
         Tests withdrawal functionality and verifies the balance is updated correctly.
         Ensures the updated balance matches the expected amount after withdrawal.
@@ -87,12 +102,12 @@ class TestBankCustomersAPI(BankAPIBase):
         withdraw_amount = 200
 
         # Log withdrawal attempt
-        log.info(f"Withdrawing {withdraw_amount} from account {self.BASE_ACCOUNT_ID}")
+        log.info(f"Withdrawing {withdraw_amount} from account {account_id}")
         # Perform withdrawal
-        self.withdraw_from_account(self.BASE_ACCOUNT_ID, withdraw_amount)
+        self.withdraw_from_account(account_id, withdraw_amount)
 
         # Verify updated balance
-        updated_balance = self.get_account_balance(self.BASE_ACCOUNT_ID)
+        updated_balance = self.get_account_balance(account_id)
         log.info(f"Updated balance after withdrawal: {updated_balance}")
 
         # Assert that the updated balance is correct
@@ -101,7 +116,7 @@ class TestBankCustomersAPI(BankAPIBase):
 
     #@pytest.mark.skip
     @pytest.mark.Regression
-    def test_deposit_and_withdrawal(self, initial_balance):
+    def test_deposit_and_withdrawal(self, initial_balance, account_id):
         """
         Tests a sequence of deposit and withdrawal, ensuring the balance reflects both transactions.
         Validates the final balance after deposit and withdrawal.
@@ -117,13 +132,13 @@ class TestBankCustomersAPI(BankAPIBase):
         withdraw_amount = 200
 
         # Log deposit and withdrawal attempts
-        log.info(f"Depositing {deposit_amount} to account {self.BASE_ACCOUNT_ID}")
-        self.deposit_to_account(self.BASE_ACCOUNT_ID, deposit_amount)
-        log.info(f"Withdrawing {withdraw_amount} from account {self.BASE_ACCOUNT_ID}")
-        self.withdraw_from_account(self.BASE_ACCOUNT_ID, withdraw_amount)
+        log.info(f"Depositing {deposit_amount} to account {account_id}")
+        self.deposit_to_account(account_id, deposit_amount)
+        log.info(f"Withdrawing {withdraw_amount} from account {account_id}")
+        self.withdraw_from_account(account_id, withdraw_amount)
 
         # Verify final balance
-        final_balance = self.get_account_balance(self.BASE_ACCOUNT_ID)
+        final_balance = self.get_account_balance(account_id)
         expected_balance = initial_balance + deposit_amount - withdraw_amount
 
         log.info(f"Final balance after deposit and withdrawal: {final_balance}")
@@ -133,46 +148,33 @@ class TestBankCustomersAPI(BankAPIBase):
 
     #@pytest.mark.skip
     @pytest.mark.Regression
-    def test_pay_bill(self, initial_balance):
+    def test_pay_bill(self, ledgered_account):
         """
         Tests a sequence of bill payment with fake data.
         Verifies that the bill payment process works and the final balance is updated correctly.
 
         Steps:
-        1. Generate fake user data using `Faker`.
-        2. Call `billpay` with the generated fake data and account information.
-        3. Retrieve the approval response and assert that the payee name matches the generated name.
-        4. Calculate the expected balance: initial balance - bill amount.
-        5. Retrieve the final balance after payment.
-        6. Assert that the final balance matches the expected balance.
-        """
-        fake = Faker()  # Generate fake data for testing
+        1. Call `billpay_payload` through the ledger with the leased account and a pre-generated payee.
+        2. Retrieve the approval response and assert that the payee name matches the generated name.
+        3. Read the final balance back and assert it matches the ledger's expected balance
+           (initial balance - bill amount).
+        """
         log = self.get_logger()
+        account_id, balance_ledger, payload = ledgered_account
         bill_amount = 350  # Amount for the bill payment
-
-        # Generate fake user data
-        name = fake.name()
-        street = fake.street_address()
-        city = fake.city()
-        state = fake.state()
-        zip_code = fake.zipcode()
-        phone_number = fake.phone_number()
-        account_number = fake.random_int(15000, 30000)
-        expected_balance = initial_balance - bill_amount
+        expected_balance = balance_ledger.expected_balance(account_id) - bill_amount
 
         # Log the payment attempt
-        log.info(f"Paying {bill_amount} from account {self.BASE_ACCOUNT_ID} to {name}")
+        log.info(f"Paying {bill_amount} from account {account_id} to {payload.name}")
 
         # Perform bill payment
-        approval = self.billpay(self.BASE_ACCOUNT_ID, bill_amount,
-                                name, street, city, state, zip_code,
-                                phone_number, account_number)
+        approval = balance_ledger.billpay_payload(account_id, bill_amount, payload)
         payee = approval.get("payeeName")
-        assert payee == name
+        assert payee == payload.name
         log.info(f"Bill was paid to {payee}")
 
         # Verify final balance after bill payment
-        final_balance = self.get_account_balance(self.BASE_ACCOUNT_ID)
+        final_balance = balance_ledger.verify(account_id)
         log.info(f"Final balance after paying the bill: {final_balance}")
         assert final_balance == expected_balance, "Final balance is incorrect after bill payment"
 
@@ -180,33 +182,67 @@ class TestBankCustomersAPI(BankAPIBase):
         log.info(f"Payment approved: {approval}")
 
     @pytest.mark.parametrize(
-        "source_account, pos_name, pos_symbol, number_of_shares, share_price",
+        "pos_name, pos_symbol, number_of_shares, share_price",
         [
-            (13455, 'Apple', 'AAPL', 225, 5),  # Sufficient funds for purchase
-            pytest.param(13788, 'Apple', 'AAPL', 225, 100,
+            ('Apple', 'AAPL', 225, 5),  # Sufficient funds for purchase
+            pytest.param('Apple', 'AAPL', 225, 100,  # 22,500 exceeds the pooled account's funding
                          marks=pytest.mark.xfail(reason="Expected to fail due to insufficient funds", strict=False)),
         ]
     )
     #@pytest.mark.skip
     @pytest.mark.Regression
-    def test_buy_position(self,source_account, pos_name, pos_symbol, number_of_shares, share_price):
+    def test_buy_position(self, account_id, initial_balance, pos_name, pos_symbol, number_of_shares, share_price):
         """
         Tests the ability to buy a position.
 
         Steps:
-        1. Calculate the expected cost of the position.
-        2. Attempt to buy the position using the provided account and details.
+        1. Lease a funded account of this test process, so no other worker moves its balance meanwhile.
+        2. Attempt to buy the position using the leased account and details.
         3. Retrieve and assert the final account balance matches the expected value.
         """
         log = self.get_logger()
-        initial_balance = self.get_account_balance(source_account)
+        log.info(f"Buying {number_of_shares} {pos_symbol} at {share_price} from account {account_id}")
 
         # Perform the action
-        self.buy_position(source_account, pos_name, pos_symbol, number_of_shares, share_price)
+        self.buy_position(account_id, pos_name, pos_symbol, number_of_shares, share_price)
 
         # Validate the final balance
-        final_balance = self.get_account_balance(source_account)
+        final_balance = self.get_account_balance(account_id)
         expected_balance = initial_balance - (number_of_shares * share_price)
         assert final_balance == expected_balance, (
             f"Final balance is incorrect. Expected: {expected_balance}, Got: {final_balance}"
         )
+
+    @pytest.mark.Regression
+    def test_ledgered_transaction_sequence(self, ledgered_account):
+        """
+        Tests a long sequence of deposits and withdrawals tracked by the balance ledger.
+        Expected balances are computed locally; how often the real balance is read back is set by --ledger_verify.
+
+        Steps:
+        1. Perform alternating deposits and withdrawals through the ledger.
+        2. Read the real balance back and assert it matches the starting balance plus the sum of all operations.
+        3. Deposit out of band (bypassing the ledger) and assert the ledger flags the drift.
+        4. Re-track the account so the teardown verification starts from its real balance.
+        """
+        log = self.get_logger()
+        account_id, balance_ledger, _ = ledgered_account
+        initial_balance = balance_ledger.expected_balance(account_id)
+        operations = [(100 + step * 10, 50 + step * 5) for step in range(20)]
+
+        for deposit_amount, withdraw_amount in operations:
+            balance_ledger.deposit(account_id, deposit_amount)
+            balance_ledger.withdraw(account_id, withdraw_amount)
+
+        # Verify the final balance against the API regardless of the configured policy
+        final_balance = balance_ledger.verify(account_id)
+        log.info(f"Final balance after {len(operations) * 2} operations: {final_balance}, "
+                 f"ledger stats: {balance_ledger.stats}")
+        assert final_balance == initial_balance + sum(d - w for d, w in operations), \
+            "Final balance does not match the sum of the operations"
+
+        # A change the ledger did not make must be reported as drift
+        self.deposit_to_account(account_id, 25)
+        with pytest.raises(BalanceMismatchError, match=str(account_id)):
+            balance_ledger.verify(account_id)
+        balance_ledger.track(account_id)
@@ -1,9 +1,10 @@
-import time
 import pytest
 from Utils.BankAPIBase import BankAPIBase
+from Utils.Readiness import Readiness
 from PageObjects.HomePage import HomePage
 
 
+@pytest.mark.usefixtures("restore_db")
 class TestBankDBAPI(BankAPIBase):
     """
     Test class for Bank Database API interactions.
@@ -15,11 +16,13 @@ class TestBankDBAPI(BankAPIBase):
 
         Steps:
         1. Call `clean_database` to clean the database.
+        2. Wait until Parabank and HSQLDB answer again (the known-good dataset is restored after the module).
         """
         log = self.get_logger()
         # Perform database cleanup
         self.clean_database()
         log.info("Database cleaned successfully.")
 
-        time.sleep(10)   # Sleep until DB is initialized
+        waited = Readiness.wait_for_parabank()
+        log.info(f"Parabank ready {waited:.2f}s after the cleanup")
 
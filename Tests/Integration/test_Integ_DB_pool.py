@@ -0,0 +1,71 @@
+import jaydebeapi
+from Utils.BaseClass import BaseClass
+from Utils.DBConnectionPool import DBConnectionPool, missing_jaydebeapi_internals
+
+
+class TestDBConnectionPool(BaseClass):
+    """
+    Integration tests of the pooled JDBC access against HSQLDB.
+    """
+
+    def _new_pool(self):
+        return DBConnectionPool(self.JDBC_DRIVER, self.JDBC_URL, [self.USERNAME, self.PASSWORD],
+                                self.JDBC_DRIVER_PATH, max_size=2)
+
+    def test_jaydebeapi_internals_available(self):
+        """
+        Verifies the installed jaydebeapi still has the private members CachingCursor builds on.
+
+        Assertions:
+        - No module, Cursor or live Connection member listed in JAYDEBEAPI_INTERNALS is missing.
+        - A query through the caching cursor returns rows.
+        """
+        pool = self._new_pool()
+        try:
+            with pool.connection() as conn:
+                missing = missing_jaydebeapi_internals(conn)
+            assert not missing, f"jaydebeapi {getattr(jaydebeapi, '__version__', '?')} lacks {missing}; " \
+                                f"update CachingCursor or pin the version it was written for"
+
+            with pool.cursor() as cursor:
+                cursor.execute("SELECT COUNT(*) FROM PUBLIC.ACCOUNT")
+                assert cursor.fetchall()[0][0] > 0, "No accounts returned through the caching cursor"
+        finally:
+            pool.close_all()
+
+    def test_close_all_closes_borrowed_connections(self):
+        """
+        Calls close_all() while a connection is borrowed and verifies it is closed on release, not pooled.
+
+        Assertions:
+        - The borrowed connection is closed once it is released.
+        - The pool holds no open or idle connections afterwards.
+        """
+        pool = self._new_pool()
+        with pool.connection() as conn:
+            pool.close_all()
+        assert conn._closed, "Connection borrowed during close_all() was returned to the pool"
+
+        metrics = pool.metrics()
+        assert metrics["open"] == 0 and metrics["idle"] == 0, f"Connections left open: {metrics}"
+
+    def test_fetch_size_not_kept_on_cached_statement(self):
+        """
+        Runs a query through a streaming cursor, then the same query through a plain cursor on the same connection.
+
+        Assertions:
+        - The plain cursor reuses the cached statement.
+        - The streaming cursor's fetch size is not left on it.
+        """
+        pool = self._new_pool()
+        query = "SELECT ID FROM PUBLIC.ACCOUNT"
+        try:
+            with pool.cursor(fetch_size=500) as cursor:
+                cursor.execute(query)
+                assert cursor._prep.getFetchSize() == 500
+            with pool.cursor() as cursor:
+                cursor.execute(query)
+                assert pool.metrics()["statement_cache_hits"] == 1, "The statement was not reused"
+                assert cursor._prep.getFetchSize() == 0, "The streaming fetch size stuck to the cached statement"
+        finally:
+            pool.close_all()
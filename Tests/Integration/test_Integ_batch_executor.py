@@ -0,0 +1,115 @@
+import pytest
+from Utils.BankAPIBase import BankAPIBase
+from Utils.BatchExecutor import BatchExecutor, BatchOp
+from Simulators.ParabankMock import ParabankMock
+
+
+@pytest.fixture
+def parabank_mock():
+    """Points this process's API calls at a private ParabankMock with jittered latency, so lanes interleave."""
+    upstream = BankAPIBase.base_url
+    with ParabankMock(jitter_ms=3, seed=1) as mock:
+        BankAPIBase.use_base_url(mock.base_url)
+        try:
+            yield mock
+        finally:
+            BankAPIBase.use_base_url(upstream)
+
+
+class TestBatchExecutor(BankAPIBase):
+    """
+    Runs BatchExecutor batches against a private ParabankMock and checks the order and number of the operations
+    the mock received.
+    """
+
+    @staticmethod
+    def _history(mock, account_id):
+        """(type, amount) of every transaction the mock recorded for the account, in the order they were posted."""
+        return [(transaction["type"], transaction["amount"])
+                for transaction in mock.bank._account_transactions(account_id)]
+
+    def test_operations_ordered_on_both_transfer_accounts(self, parabank_mock):
+        """
+        Interleaves transfers into one account with withdrawals from it, spread over many lanes.
+
+        Assertions:
+        - Every operation succeeds.
+        - The destination account's transactions follow the input order, although the transfers run on their
+          source accounts' lanes.
+        - String and integer IDs of the same account are sequenced as one account.
+        - stats counts this run's operations only.
+        """
+        data = parabank_mock.test_data()
+        target = data["ACCOUNT_ID_LIST"][0][0]
+        sources = [row[0] for row in data["ACCOUNT_ID_LIST"][1:9]]
+        operations, expected = [], []
+        for round_number in range(5):
+            for number, source in enumerate(sources):
+                amount = round_number * 10 + number + 1
+                operations.append(BatchOp("transfer", source, amount, target))
+                operations.append(BatchOp("withdraw", str(target) if number % 2 else target, amount))
+                expected += [("Credit", amount), ("Debit", amount)]
+        executor = BatchExecutor(workers=8)
+        before = len(self._history(parabank_mock, target))
+
+        results = executor.execute(operations)
+
+        assert all(result.ok for result in results), [result.error for result in results if not result.ok]
+        assert self._history(parabank_mock, target)[before:] == expected, "Operations on the account overtook"
+        assert executor.stats["submitted"] == executor.stats["succeeded"] == len(operations)
+
+        executor.execute([BatchOp("deposit", target, 1)])
+        assert executor.stats["submitted"] == executor.stats["succeeded"] == 1, f"Stats leaked: {executor.stats}"
+
+    def test_early_close_stops_execution(self, parabank_mock):
+        """
+        Closes the result stream after a few results of a long batch on one account.
+
+        Assertions:
+        - Operations still queued when the stream closes are not executed.
+        - The operations generator is no longer consumed.
+        """
+        parabank_mock.configure(latency_ms=5)
+        account_id = parabank_mock.test_data()["BASE_ACCOUNT_ID"]
+        before = len(self._history(parabank_mock, account_id))
+        consumed = []
+
+        def operations():
+            for number in range(1000):
+                consumed.append(number)
+                yield BatchOp("deposit", account_id, 1)
+
+        executor = BatchExecutor(workers=4)
+        results = executor.run(operations())
+        for _ in range(5):
+            assert next(results).ok
+        results.close()
+        executed = len(self._history(parabank_mock, account_id)) - before
+        parabank_mock.configure(latency_ms=0)
+        self.get_account_balance(account_id)  # Lets a request that was in flight at close() finish
+
+        assert len(self._history(parabank_mock, account_id)) - before <= executed + 1, \
+            "Operations kept running after the results were closed"
+        assert len(consumed) < 1000, "The generator was drained after the results were closed"
+
+    @pytest.mark.parametrize("invalid", [
+        BatchOp("refund", 12345, 1),
+        BatchOp("transfer", 12345, 1),
+        BatchOp("deposit", "12a45", 1)
+    ], ids=["unknown_kind", "transfer_without_destination", "non_numeric_id"])
+    def test_invalid_operation_stops_the_batch(self, parabank_mock, invalid):
+        """
+        Puts a malformed operation after valid ones.
+
+        Assertions:
+        - run() raises ValueError.
+        - No operation after the malformed one is executed.
+        """
+        account_id = parabank_mock.test_data()["BASE_ACCOUNT_ID"]
+        before = len(self._history(parabank_mock, account_id))
+        operations = [BatchOp("deposit", account_id, 1)] * 3 + [invalid] + [BatchOp("deposit", account_id, 1)] * 3
+
+        with pytest.raises(ValueError):
+            BatchExecutor(workers=2).execute(operations)
+
+        assert len(self._history(parabank_mock, account_id)) - before <= 3, "Operations after the invalid one ran"
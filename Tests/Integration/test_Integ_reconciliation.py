@@ -0,0 +1,105 @@
+import pytest
+from decimal import Decimal
+from Utils import Reconciliation as reconciliation_module
+from Utils.Reconciliation import Reconciliation
+
+
+class _TableReconciliation(Reconciliation):
+    """Reconciliation over in-memory ACCOUNT and TRANSACTION rows instead of HSQLDB."""
+
+    def __init__(self, accounts, transactions, batch_size=2):
+        super().__init__(batch_size=batch_size)
+        self.tables = {self.ACCOUNT_QUERY: accounts, self.TRANSACTION_QUERY: transactions}
+
+    def iter_db_query(self, query, params=None, batch_size=1000):
+        return iter(self.tables[query])
+
+
+ACCOUNTS = [(12345, Decimal("-2300.00")), (12456, Decimal("10.45")), (12567, Decimal("100.00"))]
+TRANSACTIONS = [
+    (12345, Reconciliation.CREDIT, Decimal("100.00")),
+    (12345, Reconciliation.DEBIT, Decimal("2500.00")),
+    (12456, Reconciliation.CREDIT, Decimal("10.45")),
+    (99999, Reconciliation.CREDIT, Decimal("5.00")),  # No such account
+    (12567, Reconciliation.DEBIT, Decimal("0.50"))
+]
+
+
+class TestReconciliation:
+    """
+    Checks the Reconciliation ledger and its checks on fixed tables, with numpy and with the typed-array fallback.
+    """
+
+    @pytest.fixture(params=["numpy", "array"])
+    def summing(self, request, monkeypatch):
+        """Runs the test once with numpy (skipped when it is not installed) and once with the array fallback."""
+        if request.param == "numpy":
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(reconciliation_module, "numpy", None)
+        return request.param
+
+    def test_numpy_and_array_ledgers_match(self, monkeypatch):
+        """
+        Builds the same ledger with both summing paths.
+
+        Assertions:
+        - IDs, balances, net sums, transaction counts and orphans are identical.
+        """
+        pytest.importorskip("numpy")
+        with_numpy = _TableReconciliation(ACCOUNTS, TRANSACTIONS).ledger()
+        monkeypatch.setattr(reconciliation_module, "numpy", None)
+        without_numpy = _TableReconciliation(ACCOUNTS, TRANSACTIONS).ledger()
+
+        for field in ("ids", "balances", "net", "counts"):
+            assert list(getattr(with_numpy, field)) == list(getattr(without_numpy, field)), f"{field} differ"
+        assert with_numpy.orphans == without_numpy.orphans
+
+    def test_ledger_sums_and_offsets(self, summing):
+        """
+        Assertions:
+        - Every account's net sum and transaction count matches the TRANSACTION rows.
+        - The transaction of an unknown account is counted as an orphan, not added to any account.
+        - offset is balance minus net transactions.
+        """
+        ledger = _TableReconciliation(ACCOUNTS, TRANSACTIONS).ledger()
+
+        assert list(ledger.ids) == [12345, 12456, 12567]
+        assert list(ledger.net) == [-2400.0, 10.45, -0.5]
+        assert list(ledger.counts) == [2, 1, 1]
+        assert ledger.orphans == 1
+        assert ledger.offsets() == {12345: 100.0, 12456: 0.0, 12567: 100.5}
+
+    def test_empty_tables(self, summing):
+        """
+        Assertions:
+        - Empty tables give an empty ledger without orphans.
+        - With no accounts at all, every transaction is an orphan.
+        """
+        empty = _TableReconciliation([], []).ledger()
+        assert len(empty) == 0 and empty.orphans == 0 and empty.offsets() == {}
+
+        no_accounts = _TableReconciliation([], TRANSACTIONS).ledger()
+        assert len(no_accounts) == 0 and no_accounts.orphans == len(TRANSACTIONS)
+
+    def test_check_ledger_flags_changed_offsets(self, summing):
+        """
+        Takes the offsets as the `before` snapshot, changes the tables and checks them again.
+
+        Assertions:
+        - A deposit written with its transaction keeps the offset and is not reported.
+        - A balance changed without a transaction is reported as "ledger" with both offsets.
+        - An account removed from ACCOUNT is reported as "missing".
+        """
+        reconciliation = _TableReconciliation(ACCOUNTS, TRANSACTIONS)
+        before = reconciliation.ledger().offsets()
+
+        reconciliation.tables[Reconciliation.ACCOUNT_QUERY] = [
+            (12345, Decimal("-2250.00")),  # Deposit of 50 below, with its transaction
+            (12456, Decimal("20.45"))  # 10 more without a transaction
+        ]
+        reconciliation.tables[Reconciliation.TRANSACTION_QUERY] = \
+            TRANSACTIONS + [(12345, Reconciliation.CREDIT, Decimal("50.00"))]
+        mismatches = reconciliation.check_ledger(reconciliation.ledger(), before)
+
+        assert sorted(mismatches) == [(12456, "ledger", 0.0, 10.0), (12567, "missing", 100.5, None)]
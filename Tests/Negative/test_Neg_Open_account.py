@@ -70,3 +70,14 @@ class TestBankAccountsNegativeAPI(BankAPIBase):
         log.info(f"Account creation failed as expected with {result['error']} and details are:"
                  f"{result['details']}")
 
+    @pytest.mark.Negative
+    @pytest.mark.parametrize("method", ["get_account_balance", "get_account_by_id", "get_customer_details"])
+    def test_non_numeric_id_rejected(self, method):
+        """
+        Passes a non-numeric ID to the ID lookups and verifies they fail before any request is sent.
+
+        Assertions:
+        - The documented ValueError is raised (not an UnboundLocalError from the error handler).
+        """
+        with pytest.raises(ValueError, match="No request was sent"):
+            getattr(self, method)("not-an-id")
@@ -0,0 +1,67 @@
+import time
+import pytest
+import requests
+from Utils.BankAPIBase import BankAPIBase
+from Utils.HTTPClient import HTTPClient
+from Simulators.FaultProxy import Fault
+
+
+class TestFaultInjectionNegativeAPI(BankAPIBase):
+
+    @pytest.mark.Negative
+    def test_get_retries_injected_503(self, fault_proxy):
+        """
+        Injects 503 on every account read and verifies the client retries the idempotent GET before failing.
+
+        Assertions:
+        - get_account_balance raises an HTTPError once the retries are exhausted.
+        - The proxy saw the first attempt plus HTTPClient.RETRY_TOTAL retries.
+        """
+        log = self.get_logger()
+        fault_proxy.set_fault("GET /accounts/{accountId}", Fault(error_rate=1.0, error_status=503))
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            self.get_account_balance(self.BASE_ACCOUNT_ID)
+
+        log.info(f"Proxy stats after injected 503s: {fault_proxy.stats}")
+        assert fault_proxy.stats["errors"] == HTTPClient.RETRY_TOTAL + 1, \
+            f"Expected {HTTPClient.RETRY_TOTAL + 1} attempts, proxy saw {fault_proxy.stats['errors']}"
+
+    @pytest.mark.Negative
+    def test_deposit_not_retried_after_reset(self, fault_proxy):
+        """
+        Resets the connection of a deposit and verifies the non-idempotent POST is neither retried nor applied.
+
+        Assertions:
+        - deposit_to_account fails.
+        - The proxy reset exactly one connection.
+        - The account balance is unchanged.
+        """
+        initial_balance = self.get_account_balance(self.BASE_ACCOUNT_ID)
+        fault_proxy.set_fault("POST /deposit", Fault(reset_rate=1.0))
+
+        with pytest.raises(Exception):
+            self.deposit_to_account(self.BASE_ACCOUNT_ID, 25)
+
+        assert fault_proxy.stats["resets"] == 1, f"POST was retried: {fault_proxy.stats}"
+        fault_proxy.set_fault("POST /deposit", None)
+        assert self.get_account_balance(self.BASE_ACCOUNT_ID) == initial_balance, \
+            "Balance changed although the deposit never reached Parabank"
+
+    @pytest.mark.Negative
+    def test_read_timeout_on_slow_endpoint(self, fault_proxy, http_client_settings):
+        """
+        Delays account reads beyond the client's read timeout and verifies the call fails in bounded time.
+
+        Assertions:
+        - get_account_balance fails instead of waiting for the slow response.
+        - The failure arrives well before the injected latency (times the retry attempts) would elapse.
+        """
+        HTTPClient.configure(read_timeout=0.5, retries=0)
+        fault_proxy.set_fault("GET /accounts/{accountId}", Fault(latency="fixed:3000"))
+        start = time.perf_counter()
+        with pytest.raises(Exception, match="timed out"):
+            self.get_account_balance(self.BASE_ACCOUNT_ID)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 2, f"Timed out after {elapsed:.1f}s, expected about 0.5s"
@@ -0,0 +1,68 @@
+import pytest
+import requests
+from urllib.parse import urlsplit
+from Utils.BankAPIBase import BankAPIBase
+from Utils.HTTPClient import HTTPClient
+from Simulators.FaultProxy import Fault
+
+
+class TestHTTPClientNegativeAPI(BankAPIBase):
+    """
+    Checks the retry and connection pool configuration of the shared HTTPClient through a FaultProxy.
+    """
+
+    @pytest.mark.Negative
+    def test_post_not_retried_on_503(self, fault_proxy):
+        """
+        Injects 503 on deposits and verifies the non-idempotent POST is sent exactly once.
+
+        Assertions:
+        - deposit_to_account raises an HTTPError.
+        - The proxy saw a single attempt.
+        - The account balance is unchanged.
+        """
+        initial_balance = self.get_account_balance(self.BASE_ACCOUNT_ID)
+        fault_proxy.set_fault("POST /deposit", Fault(error_rate=1.0, error_status=503))
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            self.deposit_to_account(self.BASE_ACCOUNT_ID, 25)
+
+        assert fault_proxy.stats["errors"] == 1, f"POST was retried: {fault_proxy.stats}"
+        fault_proxy.set_fault("POST /deposit", None)
+        assert self.get_account_balance(self.BASE_ACCOUNT_ID) == initial_balance, \
+            "Balance changed although the deposit was rejected"
+
+    @pytest.mark.Negative
+    def test_retry_count_follows_configuration(self, fault_proxy, http_client_settings):
+        """
+        Reconfigures the client with a single retry and verifies an idempotent GET is attempted twice.
+
+        Assertions:
+        - get_account_balance raises an HTTPError once the retry is exhausted.
+        - The proxy saw the first attempt plus one retry.
+        """
+        HTTPClient.configure(retries=1, backoff_factor=0)
+        fault_proxy.set_fault("GET /accounts/{accountId}", Fault(error_rate=1.0, error_status=503))
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            self.get_account_balance(self.BASE_ACCOUNT_ID)
+
+        assert fault_proxy.stats["errors"] == 2, f"Expected 2 attempts, proxy saw {fault_proxy.stats['errors']}"
+
+    @pytest.mark.Negative
+    def test_keep_alive_connection_reused(self, fault_proxy, http_client_settings):
+        """
+        Sends several sequential reads through a fresh client and verifies they share one pooled connection.
+
+        Assertions:
+        - Every read reached the proxy.
+        - The client opened a single connection to the proxy host.
+        """
+        client = HTTPClient.configure(**http_client_settings)
+        for _ in range(5):
+            self.get_account_balance(self.BASE_ACCOUNT_ID)
+
+        proxy = urlsplit(fault_proxy.base_url)
+        pool = client.stats()["pools"][f"http://{proxy.hostname}:{proxy.port}"]
+        assert fault_proxy.stats["forwarded"] == 5, f"Reads did not reach the proxy: {fault_proxy.stats}"
+        assert pool["connections_opened"] == 1, f"Connections were not reused: {pool}"
@@ -0,0 +1,66 @@
+"""
+Benchmark of seeding operations one at a time versus through the BatchExecutor.
+
+Runs the same deposit/withdraw mix over the test accounts, first with a plain loop over BankAPIBase (the way
+scenarios were seeded before) and then with BatchExecutor lanes, and prints operations per second and the
+executor's latency percentiles. It moves money on the target Parabank: run it against a disposable instance, e.g.
+the local mock (python -m Simulators.ParabankMock and export the printed variables).
+
+Run from the project root:
+    python -m Tests.Performance.benchmarks.bench_batch_executor [--ops 2000 --workers 16 --rate 0]
+"""
+import time
+import argparse
+from Utils.BankAPIBase import BankAPIBase
+from Utils.BatchExecutor import BatchExecutor, BatchOp
+from Utils.LatencyHistogram import LatencyHistogram
+
+
+def operations(account_ids, count):
+    """Alternating deposits and withdrawals of the same amount, so balances end where they started."""
+    for index in range(count):
+        account_id = account_ids[index % len(account_ids)]
+        yield BatchOp("deposit" if index // len(account_ids) % 2 == 0 else "withdraw", account_id, 1)
+
+
+def run_loop(api, ops):
+    start = time.perf_counter()
+    for op in ops:
+        if op.kind == "deposit":
+            api.deposit_to_account(op.account_id, op.amount)
+        else:
+            api.withdraw_from_account(op.account_id, op.amount)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ops", type=int, default=2000, help="Operations per run")
+    parser.add_argument("--loop-ops", type=int, default=200, help="Operations of the sequential baseline run")
+    parser.add_argument("--workers", type=int, default=BatchExecutor.WORKERS, help="Executor lanes")
+    parser.add_argument("--rate", type=float, default=0, help="Executor rate limit in ops/s (0 = unlimited)")
+    args = parser.parse_args()
+
+    api = BankAPIBase()
+    account_ids = [row[0] for row in api.ACCOUNT_ID_LIST]
+    loop_seconds = run_loop(api, operations(account_ids, args.loop_ops))
+
+    executor = BatchExecutor(api, workers=args.workers, rate=args.rate or None)
+    histogram = LatencyHistogram()
+    start = time.perf_counter()
+    failed = 0
+    for result in executor.run(operations(account_ids, args.ops)):
+        histogram.record(result.latency_ms)
+        failed += not result.ok
+    batch_seconds = time.perf_counter() - start
+
+    loop_rate, batch_rate = args.loop_ops / loop_seconds, args.ops / batch_seconds
+    print(f"Loop:     {args.loop_ops} ops in {loop_seconds:.2f}s = {loop_rate:.0f} ops/s")
+    print(f"Executor: {args.ops} ops in {batch_seconds:.2f}s = {batch_rate:.0f} ops/s "
+          f"({args.workers} lanes, {failed} failed, {batch_rate / loop_rate:.1f}x)")
+    print("Executor latency (ms): " + ", ".join(f"{label} {value:.1f}"
+                                              for label, value in histogram.percentiles().items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Micro-benchmark for BaseClass.get_logger().
+
+Compares the per-call overhead of the previous implementation (inspect.stack() + a new RotatingFileHandler on
+every call) with the cached implementation. Logs are written to a temporary directory.
+
+Run from the project root:
+    python -m Tests.Performance.benchmarks.bench_get_logger [--calls 5000]
+"""
+import os
+import time
+import inspect
+import logging
+import argparse
+import tempfile
+from logging.handlers import RotatingFileHandler
+from Utils.BaseClass import BaseClass
+
+
+def legacy_get_logger() -> logging.Logger:
+    """The get_logger() implementation before loggers were cached, kept here as the benchmark baseline."""
+    logger_name = inspect.stack()[1][3]
+    logger = logging.getLogger(logger_name)
+    if logger.hasHandlers():
+        for handler in logger.handlers:
+            handler.close()  # The original leaked these; closed here so the benchmark doesn't run out of fds
+        logger.handlers.clear()
+    os.makedirs('Logs', exist_ok=True)
+    file_handler = RotatingFileHandler('Logs/logfile.log', maxBytes=10 * 1024 * 1024, backupCount=5)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s :%(levelname)s : %(name)s : %(message)s'))
+    logger.addHandler(file_handler)
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def _api_method_legacy():
+    return legacy_get_logger()
+
+
+def _api_method_cached():
+    return BaseClass.get_logger()
+
+
+def measure(func, calls):
+    """Returns the mean time per call in microseconds."""
+    func()  # Warm up (first call creates the logger/handler)
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=5000, help="get_logger() calls per implementation")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        BaseClass.LOG_FILE = os.path.join(workdir, 'Logs', 'logfile.log')
+
+        legacy = measure(_api_method_legacy, args.calls)
+        cached = measure(_api_method_cached, args.calls)
+
+    print(f"get_logger() per-call overhead over {args.calls} calls")
+    print(f"  {'legacy (inspect.stack + new handler)':<42}{legacy:10.2f} us")
+    print(f"  {'cached (frame lookup + shared handler)':<42}{cached:10.2f} us")
+    print(f"  speed-up: {legacy / cached:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Micro-benchmark for decoding API responses.
+
+Compares the previous path (requests' response.json(): decode the body to text, json.loads into nested dicts,
+ad hoc key checks) with JSONDecoder + the generated, validating __slots__ models, on a synthetic
+/accounts/{accountId}/transactions payload. Reports the time per response and the memory kept by the result.
+
+Run from the project root:
+    python -m Tests.Performance.benchmarks.bench_json_decoding [--transactions 2000] [--repeat 50]
+"""
+import gc
+import json
+import time
+import random
+import argparse
+import tracemalloc
+from Utils.JSONDecoder import JSONDecoder, orjson
+from Utils.ParabankModels import Transaction
+
+
+def make_payload(count, seed=7):
+    """Builds a JSON array shaped like Parabank's transaction list."""
+    rng = random.Random(seed)
+    transactions = [
+        {
+            "id": 14000 + i,
+            "accountId": 13344,
+            "type": rng.choice(("Credit", "Debit")),
+            "date": 1700000000000 + i * 86400000,
+            "amount": round(rng.uniform(1, 5000), 2),
+            "description": rng.choice(("Funds Transfer Received", "Bill Payment to Acme", "Deposit via Web Service"))
+        }
+        for i in range(count)
+    ]
+    return json.dumps(transactions).encode("utf-8")
+
+
+def legacy_decode(body):
+    """The decoding done before JSONDecoder: text decode, json.loads, ad hoc key checks."""
+    transactions = json.loads(body.decode("utf-8"))
+    for transaction in transactions:
+        if 'amount' not in transaction:
+            raise ValueError("Amount key not found in the response.")
+    return transactions
+
+
+def model_decode(decoder):
+    def decode(body):
+        return Transaction.from_json_list(decoder(body))
+    return decode
+
+
+def measure(func, body, repeat, rounds=5):
+    """Returns (milliseconds per call in the fastest round, bytes retained by one result)."""
+    func(body)  # Warm up
+    elapsed = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func(body)
+        elapsed = min(elapsed, (time.perf_counter() - start) / repeat * 1000)
+
+    gc.collect()
+    tracemalloc.start()
+    result = func(body)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return elapsed, retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transactions", type=int, default=2000, help="Transactions in the synthetic response")
+    parser.add_argument("--repeat", type=int, default=50, help="Decodes per timing round")
+    args = parser.parse_args()
+
+    body = make_payload(args.transactions)
+    candidates = [
+        ("response.json() + key checks (dicts)", legacy_decode),
+        ("json + validated models", model_decode(json.loads))
+    ]
+    if orjson is not None:
+        candidates.append(("orjson + validated models", model_decode(orjson.loads)))
+
+    print(f"Decoding {args.transactions} transactions ({len(body) / 1024:.0f} KiB), "
+          f"best of 5 x {args.repeat} runs, default decoder: {JSONDecoder.name}")
+    baseline = None
+    for label, func in candidates:
+        elapsed, retained = measure(func, body, args.repeat)
+        baseline = baseline or elapsed
+        print(f"  {label:<40}{elapsed:9.2f} ms  {retained / 1024:9.0f} KiB retained  {baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
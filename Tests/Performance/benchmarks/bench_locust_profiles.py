@@ -0,0 +1,80 @@
+"""
+Side-by-side throughput benchmark of the Locust user profiles (HttpUser vs FastHttpUser).
+
+Each profile runs the same task mix from load_response_time.py without wait time, in its own process (one core),
+against the same host. Reports requests/sec and requests per CPU second - the number that decides how many
+worker cores a target load needs.
+
+Run from the project root (Parabank must be running, test data comes from the cache/HSQLDB or
+PARABANK_TEST_DATA):
+    python -m Tests.Performance.benchmarks.bench_locust_profiles [--users 20] [--duration 30] [--host URL]
+"""
+import sys
+import json
+import argparse
+import subprocess
+
+PROFILES = ("http", "fast")
+
+
+def run_profile(profile, users, duration, host):
+    """
+    Runs one profile headless in this process with Locust's library API.
+
+    Returns:
+        dict: Request and failure counts, wall and CPU seconds of the measured window.
+    """
+    import time
+    import gevent
+    from locust import constant
+    from locust.env import Environment
+    from Tests.Performance.locust import load_response_time
+
+    user_class = type(f"Benchmark{load_response_time.PROFILES[profile].__name__}",
+                      (load_response_time.PROFILES[profile],), {"wait_time": constant(0), "abstract": False})
+    user_class.ACCOUNT_ID_LIST  # Load the test data before the clock starts
+
+    environment = Environment(user_classes=[user_class], host=host)
+    runner = environment.create_local_runner()
+    runner.start(users, spawn_rate=users)
+    gevent.sleep(1)  # Let all users spawn and connections open before measuring
+    environment.stats.reset_all()
+    wall, cpu = time.perf_counter(), time.process_time()
+    gevent.sleep(duration)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    total = environment.stats.total
+    result = {"requests": total.num_requests, "failures": total.num_failures, "wall": wall, "cpu": cpu}
+    runner.quit()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=20, help="Concurrent users per profile")
+    parser.add_argument("--duration", type=float, default=30, help="Measured seconds per profile")
+    parser.add_argument("--host", default="http://localhost:8090", help="Parabank host")
+    parser.add_argument("--profile", choices=PROFILES, help=argparse.SUPPRESS)  # Child process mode
+    args = parser.parse_args()
+
+    if args.profile:
+        print(json.dumps(run_profile(args.profile, args.users, args.duration, args.host)))
+        return
+
+    print(f"{args.users} users per profile, {args.duration:.0f} s each, no wait time, one process, host {args.host}")
+    baseline = None
+    for profile in PROFILES:
+        # Separate processes, so each profile starts from a clean interpreter and its own CPU clock
+        output = subprocess.run(
+            [sys.executable, "-m", "Tests.Performance.benchmarks.bench_locust_profiles", "--profile", profile,
+             "--users", str(args.users), "--duration", str(args.duration), "--host", args.host],
+            check=True, capture_output=True, text=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        per_core = result["requests"] / result["cpu"] if result["cpu"] else 0.0
+        baseline = baseline or per_core
+        print(f"  {profile:<6}{result['requests'] / result['wall']:10.1f} req/s  {per_core:10.1f} req/CPU-s  "
+              f"{result['failures']:7d} failures  {per_core / baseline if baseline else 0:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
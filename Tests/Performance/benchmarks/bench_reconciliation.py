@@ -0,0 +1,86 @@
+"""
+Benchmark of building the Reconciliation ledger with numpy and with the typed-array fallback.
+
+Feeds a synthetic ACCOUNT and TRANSACTION table (default 100k accounts and 1M transactions, 1% of them orphaned)
+through Reconciliation.ledger() in place of HSQLDB, so only the batching and summing is timed, not the JDBC
+fetch. Both ledgers are compared before the timings are printed.
+
+Run from the project root:
+    python -m Tests.Performance.benchmarks.bench_reconciliation [--accounts 100000 --transactions 1000000]
+"""
+import time
+import random
+import argparse
+from decimal import Decimal
+from Utils import Reconciliation as reconciliation_module
+from Utils.Reconciliation import Reconciliation
+
+
+class SyntheticReconciliation(Reconciliation):
+    """Reconciliation that reads pre-generated rows instead of querying the DB."""
+
+    def __init__(self, accounts, transactions, batch_size=None):
+        super().__init__(batch_size=batch_size)
+        self.tables = {self.ACCOUNT_QUERY: accounts, self.TRANSACTION_QUERY: transactions}
+
+    def iter_db_query(self, query, params=None, batch_size=1000):
+        return iter(self.tables[query])
+
+
+def synthetic_tables(account_count, transaction_count, seed=1):
+    """Rows shaped like the JDBC results: int IDs and TYPE codes, Decimal amounts."""
+    rng = random.Random(seed)
+    ids = [12345 + 111 * index for index in range(account_count)]
+    accounts = [(account_id, Decimal(rng.randint(0, 10 ** 6)) / 100) for account_id in ids]
+    transactions = [
+        (rng.choice(ids) if rng.random() > 0.01 else -1, rng.randint(0, 1), Decimal(rng.randint(1, 10 ** 5)) / 100)
+        for _ in range(transaction_count)
+    ]
+    return accounts, transactions
+
+
+def timed_ledger(reconciliation, repeat):
+    best, ledger = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ledger = reconciliation.ledger()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, ledger
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--accounts", type=int, default=100000, help="Rows in the synthetic ACCOUNT table")
+    parser.add_argument("--transactions", type=int, default=1000000, help="Rows in the synthetic TRANSACTION table")
+    parser.add_argument("--batch-size", type=int, default=Reconciliation.BATCH_SIZE, help="Rows per batch")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant; the best is reported")
+    args = parser.parse_args()
+
+    accounts, transactions = synthetic_tables(args.accounts, args.transactions)
+    reconciliation = SyntheticReconciliation(accounts, transactions, batch_size=args.batch_size)
+    print(f"{args.accounts} accounts, {args.transactions} transactions, batches of {args.batch_size}")
+
+    numpy = reconciliation_module.numpy
+    results = {}
+    if numpy is not None:
+        results["numpy"] = timed_ledger(reconciliation, args.repeat)
+    reconciliation_module.numpy = None
+    try:
+        results["array"] = timed_ledger(reconciliation, args.repeat)
+    finally:
+        reconciliation_module.numpy = numpy
+
+    if "numpy" in results:
+        vectorized, fallback = results["numpy"][1], results["array"][1]
+        assert list(vectorized.counts) == list(fallback.counts) and vectorized.orphans == fallback.orphans
+        assert all(abs(a - b) < 0.005 for a, b in zip(vectorized.net, fallback.net)), "Net sums differ"
+    else:
+        print("numpy is not installed; only the array fallback was timed")
+    for name, (seconds, ledger) in results.items():
+        print(f"{name:<6} {seconds:.2f}s ({args.transactions / seconds:,.0f} transactions/s, "
+              f"{ledger.orphans} orphans)")
+
+
+if __name__ == "__main__":
+    main()
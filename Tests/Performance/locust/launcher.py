@@ -0,0 +1,179 @@
+"""
+Runs the Locust load test distributed over a master and N local worker processes.
+
+The test data (account and customer IDs) is loaded once here - from the test data cache or HSQLDB - and handed
+to every process through PARABANK_TEST_DATA, so workers never query the database. Each worker gets its own
+round-robin slice of ACCOUNT_ID_LIST, which spreads the load over the accounts and keeps workers from
+contending for the same rows. The master aggregates the workers' statistics into one CSV/HTML report.
+
+Run from the project root:
+    python -m Tests.Performance.locust.launcher --workers 4 --users 200 --spawn-rate 20 --run-time 5m
+
+Options the launcher does not know (load shape and pacing options such as --target-rps) are passed to the master.
+"""
+import os
+import sys
+import csv
+import time
+import argparse
+import subprocess
+from datetime import datetime
+from Utils.BaseClass import BaseClass
+from Utils.Reconciliation import Reconciliation
+from Tools.merge_latency_histograms import collect_paths, merge_files, format_table
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+LOCUSTFILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "load_response_time.py")
+DEFAULT_HOST = "http://localhost:8090"
+PROFILE_ENV = "LOCUST_USER_PROFILE"  # Read by the locust file: "http" or "fast"
+MASTER_PORT = 5557
+WORKER_EXIT_TIMEOUT = 15  # Seconds workers get to exit after the master finished
+
+
+def partition_accounts(account_id_list, workers):
+    """
+    Splits the account rows round-robin into one slice per worker.
+
+    Workers whose slice would be empty (fewer accounts than workers) share the full list instead.
+
+    Returns:
+        list: One list of account rows per worker.
+    """
+    return [account_id_list[index::workers] or list(account_id_list) for index in range(workers)]
+
+
+def _environment(test_data, profile):
+    env = dict(os.environ)
+    env[BaseClass.TEST_DATA_ENV] = test_data
+    env[PROFILE_ENV] = profile
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get("PYTHONPATH")]))
+    return env
+
+
+def start_master(args, report_prefix):
+    """Starts the headless Locust master, which waits for all workers before spawning users."""
+    command = [
+        sys.executable, "-m", "locust", "-f", args.locustfile, "--master", "--headless",
+        "--master-bind-port", str(args.master_port),
+        "--expect-workers", str(args.workers),
+        "--host", args.host,
+        "--users", str(args.users),
+        "--spawn-rate", str(args.spawn_rate),
+        "--csv", report_prefix,
+        "--html", f"{report_prefix}.html",
+        "--histogram-dir", f"{report_prefix}_histograms"  # Forwarded to the workers, one file each
+    ]
+    if args.run_time:
+        command += ["--run-time", args.run_time]
+    command += args.locust_args  # e.g. --target-rps 400; Locust forwards custom options to the workers
+    env = _environment(BaseClass.shared_test_data_env(), args.profile)
+    return subprocess.Popen(command, cwd=PROJECT_ROOT, env=env)
+
+
+def start_workers(args, partitions):
+    """Starts one Locust worker process per account partition."""
+    workers = []
+    for partition in partitions:
+        command = [
+            sys.executable, "-m", "locust", "-f", args.locustfile, "--worker",
+            "--master-host", "127.0.0.1", "--master-port", str(args.master_port)
+        ]
+        env = _environment(BaseClass.shared_test_data_env(partition), args.profile)
+        workers.append(subprocess.Popen(command, cwd=PROJECT_ROOT, env=env))
+    return workers
+
+
+def stop(processes, timeout):
+    """Waits for the processes to exit and terminates the ones that do not."""
+    deadline = time.monotonic() + timeout
+    for process in processes:
+        try:
+            process.wait(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            process.terminate()
+            process.wait()
+
+
+def summarize(report_prefix):
+    """
+    Reads the aggregated statistics the master wrote.
+
+    Returns:
+        dict: The "Aggregated" row of <prefix>_stats.csv, or None if it is missing.
+    """
+    try:
+        with open(f"{report_prefix}_stats.csv", newline="") as stats_file:
+            for row in csv.DictReader(stats_file):
+                if row.get("Name") == "Aggregated":
+                    return row
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (default: cores)")
+    parser.add_argument("--users", type=int, default=100, help="Total simulated users across all workers")
+    parser.add_argument("--spawn-rate", type=float, default=10, help="Users started per second")
+    parser.add_argument("--run-time", default="5m", help="Test duration, e.g. 90s, 5m, 1h")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Parabank host")
+    parser.add_argument("--locustfile", default=LOCUSTFILE, help="Locust file to run")
+    parser.add_argument("--profile", choices=("http", "fast"), default=os.environ.get(PROFILE_ENV, "http"),
+                        help="User profile: requests-based HttpUser or geventhttpclient-based FastHttpUser")
+    parser.add_argument("--master-port", type=int, default=MASTER_PORT, help="Port the master listens on")
+    parser.add_argument("--report-dir", default="Reports", help="Directory for the aggregated CSV/HTML report")
+    parser.add_argument("--reconcile", action="store_true",
+                        help="Snapshot the DB ledger before the run and reconcile DB and API state after it")
+    parser.add_argument("--reconcile-sample", type=int, default=Reconciliation.SAMPLE_SIZE,
+                        help="Accounts whose API balance is checked by --reconcile")
+    args, args.locust_args = parser.parse_known_args()
+
+    log = BaseClass.get_logger()
+    test_data = BaseClass.shared_test_data()
+    if not test_data["ACCOUNT_ID_LIST"]:
+        sys.exit("No test accounts found; is Parabank running and the database reachable?")
+    partitions = partition_accounts(test_data["ACCOUNT_ID_LIST"], args.workers)
+
+    os.makedirs(os.path.join(PROJECT_ROOT, args.report_dir), exist_ok=True)
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    report_prefix = os.path.join(PROJECT_ROOT, args.report_dir, f"Locust_{timestamp}")
+
+    reconciliation = Reconciliation() if args.reconcile else None
+    before = reconciliation.ledger().offsets() if reconciliation else None
+
+    log.info(f"Starting Locust master and {args.workers} '{args.profile}' workers; accounts per worker: "
+             f"{[len(partition) for partition in partitions]}")
+    master = start_master(args, report_prefix)
+    workers = start_workers(args, partitions)
+    try:
+        master.wait()
+    except KeyboardInterrupt:
+        master.terminate()
+        master.wait()
+    finally:
+        stop(workers, WORKER_EXIT_TIMEOUT)
+
+    summary = summarize(report_prefix)
+    if summary is None:
+        sys.exit(master.returncode or 1)
+    print(f"Aggregated over {args.workers} workers: {summary['Request Count']} requests, "
+          f"{summary['Failure Count']} failures, {float(summary['Requests/s']):.1f} req/s, "
+          f"median {summary['Median Response Time']} ms, p95 {summary['95%']} ms")
+    print(f"Report: {report_prefix}.html")
+    histogram_dir = f"{report_prefix}_histograms"
+    histogram_paths = collect_paths([histogram_dir]) if os.path.isdir(histogram_dir) else []
+    if histogram_paths:
+        histograms, _ = merge_files(histogram_paths)
+        print(f"Latency percentiles (ms) merged from {len(histogram_paths)} worker histograms:")
+        print(format_table(histograms))
+    if reconciliation is not None:
+        report = reconciliation.run(before=before, sample_size=args.reconcile_sample)
+        print(report.summary())
+        if not report.ok:
+            sys.exit(master.returncode or 1)
+    sys.exit(master.returncode)
+
+
+if __name__ == "__main__":
+    main()
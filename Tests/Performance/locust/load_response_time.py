@@ -1,16 +1,65 @@
+"""
+Locust load test for the Parabank API.
+
+Two user profiles run the same task mix:
+    http - BankAPIPerformance, Locust's requests-based HttpUser (default).
+    fast - FastBankAPIPerformance, the geventhttpclient-based FastHttpUser with the JSON headers set once on the
+           session and the per-user URLs built once; about twice the requests per CPU second.
+
+Select the profile with LOCUST_USER_PROFILE=http|fast (the other class is marked abstract). Compare both with
+    python -m Tests.Performance.benchmarks.bench_locust_profiles
+
+Load shapes (LOCUST_LOAD_SHAPE=step|spike|soak) and constant-throughput pacing (--target-rps, --endpoint-rps)
+are described in load_shapes.py, e.g.
+    LOCUST_LOAD_SHAPE=step locust -f Tests/Performance/locust/load_response_time.py --headless --users 200
+        --spawn-rate 10 --step-users 20 --step-time 2m --target-rps 400
+
+--baseline NAME compares the run's per-endpoint p50/p95/p99, req/s and error rate with
+Tests/Performance/baselines/NAME.<target>.json when Locust quits, where the target is the --host (or
+--baseline-target, e.g. "mock"). It exits with code 1 on a regression or a missing baseline (--update-baseline
+records the run instead); the fixed regression scenario is python -m Tests.Performance.locust.regression.
+
+--histogram-dir DIR makes every process write its per-endpoint LatencyHistogram file there on quit; merge them
+with python -m Tools.merge_latency_histograms DIR.
+
+Before the users start, the master (or the single local process) waits for Parabank with backoff and sends
+--warmup-burst rounds of read-only BankAPIBase calls (add --warmup-db to also wait for HSQLDB and warm the JDBC
+pool). --warmup-time 30s additionally discards the statistics and histograms of the run's first 30 seconds, so
+ramp-up traffic does not skew the percentiles.
+"""
+import os
+import time
+import gevent
 from Utils.BaseClass import BaseClass
-from locust import HttpUser, task, between
-from faker import Faker
+from Utils.ParabankClient import ParabankClient, JSON_HEADERS
+from Utils.PayloadPool import PayloadPool
+from Utils.PerfBaseline import PerfBaseline, PerfRegressionError, PerfBaselineMissingError
+from Utils.LatencyHistogram import LatencyHistogram
+from Utils.BankAPIBase import BankAPIBase
+from Utils.Warmup import Warmup
+from locust import User, HttpUser, FastHttpUser, task, between, events
+from locust.runners import WorkerRunner
+from locust.util.timespan import parse_timespan
+from Tests.Performance.locust import load_shapes
+from Tests.Performance.locust.load_shapes import StepLoadShape, SpikeLoadShape, SoakLoadShape  # Found by Locust here
 import random
 
-BASE_URL = "http://localhost:8090/parabank/services/bank"
+HOST = "http://localhost:8090"  # Default for --host
+BASE_PATH = "/parabank/services/bank"  # Relative to the host, so --host points the whole test elsewhere
+PROFILE_ENV = "LOCUST_USER_PROFILE"  # "http" or "fast"
 
 
-class BankAPIPerformance(HttpUser, BaseClass):
+class BankUser(User, BaseClass):
     """
-    Locust class to load test the BankAPIBase methods, inheriting reusable data and logic from BaseClass.
+    Task mix shared by the Locust user profiles, inheriting reusable data and logic from BaseClass.
+
+    Subclasses add the HTTP client by also deriving from a Locust user class (listed after BankUser, so the client
+    exists once BankUser.__init__ builds the API client on top of it).
     """
-    wait_time = between(1, 5)  # Wait between requests (randomized to simulate real users)
+    abstract = True
+    host = HOST
+    think_time = between(1, 5)  # Wait between requests without pacing (randomized to simulate real users)
+    request_headers = JSON_HEADERS  # Headers sent with every request, None when the session already sets them
 
     def __init__(self, *args, **kwargs):
         # Initialize the customer_id, account_id, and source_account_id from BaseClass class-level attributes
@@ -18,115 +67,219 @@ class BankAPIPerformance(HttpUser, BaseClass):
         self.customer_id = self.CUSTOMER_ID[0][0]  # Assuming the first customer ID
         self.account_id = random.choice(self.ACCOUNT_ID_LIST)[0]  # Random account ID from the list
         self.source_account_id = random.choice(self.ACCOUNT_ID_LIST)[0]  # Random source account ID from the list
+        # Same generated client as BankAPIBase; Locust groups its statistics by the endpoint template ("name")
+        self.api = ParabankClient(self.client, BASE_PATH, tag_kwarg="name", headers=self.request_headers or {},
+                                  tag_method=False)
+        # The IDs are fixed per user, so the URLs of the parameterless GETs are built once
+        self.account_url = f"{BASE_PATH}/accounts/{self.account_id}"
+        self.customer_url = f"{BASE_PATH}/customers/{self.customer_id}"
+        self.transactions_url = f"{self.account_url}/transactions"
+        self.positions_url = f"{self.customer_url}/positions"
+        self.payloads = PayloadPool.shared()  # Billpay payees, generated once per process
+        self._next_start = None
+        options = self.environment.parsed_options
+        if options is not None and getattr(options, "endpoint_rps", ""):
+            self.tasks = _weighted_tasks(type(self), options.endpoint_rps)
+
+    def wait_time(self):
+        """
+        Think time between tasks, or constant-throughput pacing when --target-rps/--endpoint-rps is set.
+
+        With pacing every user starts a task every 1 / user_rps seconds on a fixed schedule (the first start is
+        randomly offset so users do not fire in lockstep); a task that overruns its slot starts the next at once
+        without trying to catch up.
+        """
+        user_rps = getattr(self.environment.parsed_options, "user_rps", 0)
+        if not user_rps:
+            return self.think_time()
+        interval = 1 / user_rps
+        now = time.perf_counter()
+        if self._next_start is None:
+            self._next_start = now + random.uniform(0, interval)
+        else:
+            self._next_start = max(self._next_start + interval, now)
+        return self._next_start - now
+
+    def _get(self, url, name):
+        return self.client.request("GET", url, name=name, headers=self.request_headers)
 
     @task(3)
     def get_account_balance(self):
-        self.client.get(f"{BASE_URL}/accounts/{self.account_id}", headers={
-            "accept": "application/json",
-            "Content-Type": "application/json"
-        })
+        self._get(self.account_url, "/accounts/{accountId}")
 
     @task(1)
     def create_new_account(self):
-        self.client.post(
-            f"{BASE_URL}/createAccount",
-            headers={
-                "accept": "application/json",
-                "Content-Type": "application/json"
-            },
-            params={
-                "customerId": self.customer_id,
-                "newAccountType": 1,  # Assuming 1 is CHECKING
-                "fromAccountId": self.source_account_id
-            }
-        )
+        self.api.create_account(self.customer_id, 1, self.source_account_id)  # Assuming 1 is CHECKING
 
     @task(3)
     def deposit_to_account(self):
-        self.client.post(
-            f"{BASE_URL}/deposit",
-            headers={
-                "accept": "application/json",
-                "Content-Type": "application/json"
-            },
-            params={
-                "accountId": self.account_id,
-                "amount": random.randint(100, 1000)  # Random deposit amount
-            }
-        )
+        self.api.deposit(self.account_id, random.randint(100, 1000))  # Random deposit amount
 
     @task(2)
     def withdraw_from_account(self):
-        self.client.post(
-            f"{BASE_URL}/withdraw",
-            headers={
-                "accept": "application/json",
-                "Content-Type": "application/json"
-            },
-            params={
-                "accountId": self.account_id,
-                "amount": random.randint(50, 500) # Random withdrawal amount
-            }
-        )
+        self.api.withdraw(self.account_id, random.randint(50, 500))  # Random withdrawal amount
 
     @task(1)
     def billpay(self):
-
-        fake = Faker()
-        name = fake.name()
-        street = fake.street_address()
-        city = fake.city()
-        state = fake.state()
-        zip_code = fake.zipcode()
-        phone_number = fake.phone_number()
-        account_number = fake.random_int(15000, 30000)
-
-        self.client.post(
-            f"{BASE_URL}/billpay",
-            headers={
-                "accept": "application/json",
-                "Content-Type": "application/json"
-            },
-            params={"accountId": self.account_id, "amount": random.randint(100, 500)},
-            json={
-                "name": name,
-                "address": {
-                    "street": street,
-                    "city": city,
-                    "state": state,
-                    "zipCode": zip_code
-                },
-                "phoneNumber": phone_number,
-                "accountNumber": account_number
-            }
-        )
+        # Pre-generated, pre-serialized payee from the shared ring instead of a new Faker() per task
+        self.api.bill_pay(self.account_id, random.randint(100, 500), self.payloads.next().body)
 
     @task(2)
     def get_customer_details(self):
-        self.client.get(f"{BASE_URL}/customers/{self.customer_id}", headers={
-            "accept": "application/json",
-            "Content-Type": "application/json"
-        })
+        self._get(self.customer_url, "/customers/{customerId}")
 
     @task(1)
     def get_account_by_id(self):
-        self.client.get(f"{BASE_URL}/accounts/{self.account_id}", headers={
-            "accept": "application/json",
-            "Content-Type": "application/json"
-        })
+        self._get(self.account_url, "/accounts/{accountId}")
 
     @task(1)
     def get_loan_approval(self):
-        self.client.post(
-            f"{BASE_URL}/requestLoan",
-            headers={
-                "accept": "application/json",
-                "Content-Type": "application/json"
-            },
-            params={
-                "customerId": self.customer_id,
-                "amount": 200,
-                "downPayment": 20,
-                "fromAccountId": self.source_account_id
-            }
-        )
+        self.api.request_loan(self.customer_id, 200, 20, self.source_account_id)
+
+    @task(1)
+    def transfer(self):
+        self.api.transfer(self.source_account_id, self.account_id, random.randint(1, 50))
+
+    @task(1)
+    def get_transactions(self):
+        self._get(self.transactions_url, "/accounts/{accountId}/transactions")
+
+    @task(1)
+    def get_positions(self):
+        self._get(self.positions_url, "/customers/{customerId}/positions")
+
+
+class BankAPIPerformance(BankUser, HttpUser):
+    """Load test profile on Locust's requests-based HttpUser."""
+
+
+class FastBankAPIPerformance(BankUser, FastHttpUser):
+    """
+    High-throughput load test profile on geventhttpclient (FastHttpUser).
+
+    The JSON headers are session defaults, so requests pass no per-request headers for FastHttpSession to copy.
+    """
+    default_headers = JSON_HEADERS
+    request_headers = None
+
+
+PROFILES = {"http": BankAPIPerformance, "fast": FastBankAPIPerformance}
+
+
+def select_profile(profile):
+    """
+    Marks every profile but the selected one abstract, so Locust only spawns the selected user class.
+
+    Raises:
+        ValueError: If the profile name is unknown.
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown {PROFILE_ENV} '{profile}', expected one of {sorted(PROFILES)}")
+    for name, user_class in PROFILES.items():
+        user_class.abstract = name != profile
+
+
+_task_weights = {}
+
+
+def _weighted_tasks(user_class, endpoint_rps):
+    # Built once per user class and --endpoint-rps value, shared by all users of the process
+    key = (user_class, endpoint_rps)
+    if key not in _task_weights:
+        _task_weights[key] = load_shapes.weighted_tasks(load_shapes.parse_endpoint_rps(endpoint_rps, user_class))
+    return _task_weights[key]
+
+
+@events.init_command_line_parser.add_listener
+def _add_arguments(parser):
+    load_shapes.add_arguments(parser)
+    group = parser.add_argument_group("Parabank performance baseline")
+    group.add_argument("--baseline", default="", help="Scenario name to check against its stored baseline on quit")
+    group.add_argument("--update-baseline", action="store_true", default=False,
+                       help="Record this run as the scenario's new baseline instead of checking it")
+    group.add_argument("--baseline-target", default="",
+                       help="Baseline target name, e.g. 'mock' (default: the --host, e.g. localhost_8090)")
+    group.add_argument("--regression-threshold", action="append", default=[], metavar="METRIC=FRACTION",
+                       type=PerfBaseline.parse_threshold,
+                       help="Override a regression threshold, e.g. p95_ms=0.5 (repeatable)")
+    group.add_argument("--histogram-dir", default="",
+                       help="Write each process's per-endpoint latency histograms to this directory on quit")
+    group = parser.add_argument_group("Parabank readiness and warmup")
+    group.add_argument("--warmup-burst", type=int, default=0,
+                       help="Rounds of read-only API calls sent before the users start (0 only waits for readiness)")
+    group.add_argument("--warmup-db", action="store_true", default=False,
+                       help="Also wait for HSQLDB and warm the JDBC pool before the users start")
+    group.add_argument("--warmup-time", default="0",
+                       help="Discard the statistics of the run's first period, e.g. 30s (default 0 keeps all)")
+
+
+@events.test_start.add_listener
+def _configure_pacing(environment, **kwargs):
+    load_shapes.configure_pacing(environment, BankUser)
+
+
+_histograms = {}  # "METHOD name" -> LatencyHistogram of this process (gevent: no locking needed)
+
+
+@events.test_start.add_listener
+def _warmup(environment, **kwargs):
+    options = environment.parsed_options
+    if options is None:
+        return
+    if not isinstance(environment.runner, WorkerRunner):
+        # Once per run: the master (or the local process) checks readiness and warms Parabank for all workers
+        BankAPIBase.use_base_url(f"{(environment.host or HOST).rstrip('/')}{BASE_PATH}")
+        Warmup().run(burst=options.warmup_burst, database=options.warmup_db)
+    warmup_seconds = parse_timespan(options.warmup_time)
+    if warmup_seconds:
+        gevent.spawn_later(warmup_seconds, _end_warmup, environment)
+
+
+def _end_warmup(environment):
+    # Workers drop their histograms; the master (or the local process) holds the statistics to reset
+    _histograms.clear()
+    if not isinstance(environment.runner, WorkerRunner):
+        environment.runner.stats.reset_all()
+        BaseClass.get_logger().info("Warmup period over, statistics reset")
+
+
+@events.request.add_listener
+def _record_latency(request_type, name, response_time, **kwargs):
+    histogram = _histograms.get((request_type, name))
+    if histogram is None:
+        histogram = _histograms[(request_type, name)] = LatencyHistogram()
+    histogram.record(response_time)
+
+
+@events.quitting.add_listener
+def _write_histograms(environment, **kwargs):
+    directory = getattr(environment.parsed_options, "histogram_dir", "")
+    if not directory or not _histograms:
+        return
+    source = environment.runner.client_id if isinstance(environment.runner, WorkerRunner) else "local"
+    os.makedirs(directory, exist_ok=True)
+    LatencyHistogram.dump_endpoints(
+        os.path.join(directory, f"{source}.json"),
+        {f"{method} {name}": histogram for (method, name), histogram in _histograms.items()},
+        [f"locust:{source}"]
+    )
+
+
+@events.quitting.add_listener
+def _check_baseline(environment, **kwargs):
+    # Only the master (or a single local process) holds the aggregated statistics
+    options = environment.parsed_options
+    if not getattr(options, "baseline", "") or isinstance(environment.runner, WorkerRunner):
+        return
+    target = options.baseline_target or PerfBaseline.target_of(environment.host or HOST)
+    baseline = PerfBaseline(options.baseline, target, thresholds=dict(options.regression_threshold))
+    log = BaseClass.get_logger()
+    try:
+        log.info(baseline.check(PerfBaseline.from_locust(environment.stats), update=options.update_baseline or None))
+    except (PerfRegressionError, PerfBaselineMissingError) as e:
+        log.error(str(e))
+        environment.process_exit_code = 1
+
+
+select_profile(os.environ.get(PROFILE_ENV, "http"))
+load_shapes.select_shape(os.environ.get(load_shapes.SHAPE_ENV))
@@ -0,0 +1,175 @@
+"""
+Load shapes and constant-throughput pacing for the Locust suite.
+
+Shapes (select with LOCUST_LOAD_SHAPE=step|spike|soak; without it Locust runs the plain --users/--spawn-rate test):
+    step  - adds --step-users every --step-time until --users is reached.
+    spike - holds --users, jumps to --spike-users at --spike-at for --spike-time, then recovers.
+    soak  - ramps to --users at --spawn-rate and holds it for --soak-time.
+
+Pacing (open model): --target-rps fixes the arrival rate at peak load - every user starts a task every
+peak_users / target_rps seconds, whatever the response time, so a slower Parabank shows up as higher latency
+instead of lower throughput. --endpoint-rps "get_account_balance=30,deposit_to_account=10" sets per-task targets:
+the task weights follow the targets and --target-rps defaults to their sum.
+"""
+import math
+from abc import abstractmethod
+from locust import LoadTestShape
+from locust.runners import WorkerRunner
+from locust.util.timespan import parse_timespan
+
+SHAPE_ENV = "LOCUST_LOAD_SHAPE"  # "step", "spike" or "soak"
+
+
+def add_arguments(parser):
+    """Adds the shape and pacing options to Locust's command line (and web UI)."""
+    group = parser.add_argument_group("Parabank load shapes and pacing")
+    group.add_argument("--target-rps", type=float, default=0,
+                       help="Open model: total requests/sec at peak users (0 keeps the random think time)")
+    group.add_argument("--endpoint-rps", default="",
+                       help="Per-task targets, e.g. 'get_account_balance=30,deposit_to_account=10'")
+    group.add_argument("--step-users", type=int, default=10, help="step: users added per step")
+    group.add_argument("--step-time", type=parse_timespan, default="60s", help="step: duration of each step")
+    group.add_argument("--spike-users", type=int, default=0, help="spike: users during the spike (default 5x --users)")
+    group.add_argument("--spike-at", type=parse_timespan, default="60s", help="spike: start of the spike")
+    group.add_argument("--spike-time", type=parse_timespan, default="30s", help="spike: duration of the spike")
+    group.add_argument("--spike-recovery", type=parse_timespan, default="60s",
+                       help="spike: time at --users after the spike")
+    group.add_argument("--soak-time", type=parse_timespan, default="1h", help="soak: time at --users after the ramp")
+
+
+def parse_endpoint_rps(spec, user_class):
+    """
+    Parses --endpoint-rps against the user's tasks.
+
+    Args:
+        spec (str): Comma-separated task=rps pairs.
+        user_class (type): Locust user class whose task names are valid keys.
+
+    Returns:
+        dict: Task function -> target requests/sec (empty for an empty spec).
+
+    Raises:
+        ValueError: If a pair is malformed, names an unknown task, or has a non-positive rate.
+    """
+    tasks = {task.__name__: task for task in user_class.tasks}
+    targets = {}
+    for pair in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, rps = pair.partition("=")
+        if name.strip() not in tasks:
+            raise ValueError(f"Unknown task '{name.strip()}' in --endpoint-rps, expected one of {sorted(tasks)}")
+        try:
+            rate = float(rps)
+        except ValueError:
+            raise ValueError(f"Invalid rate in --endpoint-rps pair '{pair}'")
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive in --endpoint-rps pair '{pair}'")
+        targets[tasks[name.strip()]] = rate
+    return targets
+
+
+def weighted_tasks(targets, resolution=100):
+    """
+    Builds a Locust task list whose weights follow the per-task rates.
+
+    Returns:
+        list: Task functions repeated in proportion to their rate (rounded to 1/resolution of the smallest).
+    """
+    smallest = min(targets.values())
+    weights = {task: max(1, round(rate / smallest * resolution)) for task, rate in targets.items()}
+    divisor = math.gcd(*weights.values())
+    return [task for task, weight in weights.items() for _ in range(weight // divisor)]
+
+
+def peak_users(environment):
+    """Highest user count of the run: the shape's peak, or --users without a shape."""
+    options = environment.parsed_options
+    if environment.shape_class is not None:
+        return environment.shape_class.peak_users(options)
+    return options.num_users or 1
+
+
+def configure_pacing(environment, user_class):
+    """
+    Resolves the per-user task rate for the run and stores it as parsed_options.user_rps.
+
+    Runs on the master (or the single local process) at test start; Locust forwards custom options to the
+    workers with every spawn message, so the workers' users pace themselves from the same value.
+    """
+    if isinstance(environment.runner, WorkerRunner) or environment.parsed_options is None:
+        return
+    options = environment.parsed_options
+    target_rps = options.target_rps or sum(parse_endpoint_rps(options.endpoint_rps, user_class).values())
+    options.user_rps = target_rps / peak_users(environment) if target_rps else 0
+
+
+class _ParabankLoadShape(LoadTestShape):
+    abstract = True
+    use_common_options = True  # --users and --spawn-rate define the base load
+
+    def tick(self):
+        options = self.runner.environment.parsed_options
+        return self.users_at(self.get_run_time(), options)
+
+    @abstractmethod
+    def users_at(self, run_time, options):
+        """
+        Returns:
+            tuple: (user_count, spawn_rate) at run_time seconds, or None once the shape is finished.
+        """
+
+    @staticmethod
+    def peak_users(options):
+        return options.num_users or 1
+
+
+class StepLoadShape(_ParabankLoadShape):
+    """Adds --step-users every --step-time until --users is reached, then stops after the last step."""
+
+    def users_at(self, run_time, options):
+        steps = math.ceil(self.peak_users(options) / options.step_users)
+        step = int(run_time // options.step_time)
+        if step >= steps:
+            return None
+        return min((step + 1) * options.step_users, self.peak_users(options)), options.spawn_rate
+
+
+class SpikeLoadShape(_ParabankLoadShape):
+    """Holds --users, spikes to --spike-users for --spike-time at --spike-at, then recovers for --spike-recovery."""
+
+    def users_at(self, run_time, options):
+        if run_time >= options.spike_at + options.spike_time + options.spike_recovery:
+            return None
+        if options.spike_at <= run_time < options.spike_at + options.spike_time:
+            # Spawn the whole spike within a second, that is what makes it a spike
+            return self.peak_users(options), self.peak_users(options)
+        return options.num_users or 1, options.spawn_rate
+
+    @staticmethod
+    def peak_users(options):
+        return options.spike_users or 5 * (options.num_users or 1)
+
+
+class SoakLoadShape(_ParabankLoadShape):
+    """Ramps to --users at --spawn-rate and holds it for --soak-time."""
+
+    def users_at(self, run_time, options):
+        users = self.peak_users(options)
+        if run_time >= users / options.spawn_rate + options.soak_time:
+            return None
+        return users, options.spawn_rate
+
+
+SHAPES = {"step": StepLoadShape, "spike": SpikeLoadShape, "soak": SoakLoadShape}
+
+
+def select_shape(name):
+    """
+    Marks the named shape as the only concrete one, so Locust picks it up; None or "" runs without a shape.
+
+    Raises:
+        ValueError: If the shape name is unknown.
+    """
+    if name and name not in SHAPES:
+        raise ValueError(f"Unknown {SHAPE_ENV} '{name}', expected one of {sorted(SHAPES)}")
+    for shape_name, shape_class in SHAPES.items():
+        shape_class.abstract = shape_name != name
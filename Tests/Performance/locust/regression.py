@@ -0,0 +1,66 @@
+"""
+Runs the fixed Locust regression scenario and checks it against its stored baseline.
+
+The scenario is pinned so runs are comparable: FastHttpUser profile, SCENARIO users at a constant arrival rate
+(open model, so a slower Parabank shows up as latency), a seeded billpay payload pool and a fixed duration.
+Locust exits with code 1 and logs a per-endpoint diff when p50/p95/p99, req/s or the error rate regressed beyond
+the thresholds stored in Tests/Performance/baselines/<name>.<target>.json (target: the host, or --target), or when
+the target has no baseline yet.
+
+Run from the project root (Parabank must be running):
+    python -m Tests.Performance.locust.regression [--update] [--threshold p95_ms=0.5]
+"""
+import os
+import sys
+import argparse
+import subprocess
+from Utils.PerfBaseline import PerfBaseline
+from Tests.Performance.locust.launcher import LOCUSTFILE, PROJECT_ROOT, DEFAULT_HOST, PROFILE_ENV
+
+BASELINE = "locust_mixed_load"
+# Fixed scenario; changing any of these values invalidates the stored baseline (record a new one with --update)
+SCENARIO = {
+    "profile": "fast",
+    "users": 20,
+    "spawn_rate": 20,
+    "run_time": "2m",
+    "target_rps": 40,
+    "payload_seed": 1234
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Parabank host")
+    parser.add_argument("--baseline", default=BASELINE, help="Baseline (scenario) name")
+    parser.add_argument("--target", default="", help="Baseline target name, e.g. 'mock' (default: the host)")
+    parser.add_argument("--update", action="store_true", help="Record this run as the new baseline")
+    parser.add_argument("--threshold", action="append", default=[], metavar="METRIC=FRACTION",
+                        type=PerfBaseline.parse_threshold, help="Override a regression threshold (repeatable)")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env[PROFILE_ENV] = SCENARIO["profile"]
+    env["PARABANK_PAYLOAD_SEED"] = str(SCENARIO["payload_seed"])
+    env.pop("LOCUST_LOAD_SHAPE", None)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get("PYTHONPATH")]))
+    command = [
+        sys.executable, "-m", "locust", "-f", LOCUSTFILE, "--headless", "--only-summary",
+        "--host", args.host,
+        "--users", str(SCENARIO["users"]),
+        "--spawn-rate", str(SCENARIO["spawn_rate"]),
+        "--run-time", SCENARIO["run_time"],
+        "--target-rps", str(SCENARIO["target_rps"]),
+        "--baseline", args.baseline
+    ]
+    if args.target:
+        command += ["--baseline-target", args.target]
+    if args.update:
+        command.append("--update-baseline")
+    for metric, fraction in args.threshold:
+        command += ["--regression-threshold", f"{metric}={fraction}"]
+    sys.exit(subprocess.call(command, cwd=PROJECT_ROOT, env=env))
+
+
+if __name__ == "__main__":
+    main()
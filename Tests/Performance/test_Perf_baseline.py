@@ -0,0 +1,37 @@
+import time
+import pytest
+from Utils.BankAPIBase import BankAPIBase
+from Utils.LatencyStats import LatencyStats
+from Utils.PerfBaseline import PerfBaseline
+
+
+class TestPerfBaseline(BankAPIBase):
+    ITERATIONS = 50  # Rounds of the fixed call sequence; every endpoint gets this many samples
+
+    @pytest.mark.Performance
+    def test_api_latency_baseline(self, request, pooled_account, perf_baseline):
+        """
+        Runs a fixed, balance-neutral API scenario and compares its latency and throughput with the stored baseline.
+
+        Steps:
+        1. Lease a funded account from the account pool.
+        2. Repeat ITERATIONS times: read the balance, deposit and withdraw the same amount, read the customer
+           and the transactions.
+        3. Build per-endpoint p50/p95/p99 and requests/sec from the latencies recorded for this test.
+        4. Check them against Tests/Performance/baselines/pytest_api.<target>.json (recorded with
+           --update_baseline); a regression beyond the thresholds fails with a diff, a missing baseline skips.
+        """
+        log = self.get_logger()
+        account_id = pooled_account.account_id
+
+        start = time.perf_counter()
+        for _ in range(self.ITERATIONS):
+            self.get_account_balance(account_id)
+            self.deposit_to_account(account_id, 100)
+            self.withdraw_from_account(account_id, 100)
+            self.get_customer_details(self.CUSTOMER_ID[0][0])
+            self.get_transactions(account_id)
+        duration = time.perf_counter() - start
+
+        results = PerfBaseline.from_latency_stats(LatencyStats.test_stats(request.node.nodeid), duration)
+        log.info(perf_baseline("pytest_api", results))
@@ -0,0 +1,588 @@
+"""
+Generates Utils/ParabankClient.py and Utils/ParabankModels.py from the Parabank OpenAPI description
+(Tests/bank_api_swagger.yaml).
+
+The generated modules are committed, so nothing is parsed at test or load-test time: every operation becomes a
+method with its URL template compiled into an f-string and its query parameters bound to precompiled
+serializers, and every schema becomes a compact tuple-backed model class with unrolled validation.
+Regenerate after changing the swagger file, and use --check in CI to catch stale modules.
+
+Run from the project root:
+    python -m Tools.generate_parabank_client [--spec Tests/bank_api_swagger.yaml]
+    python -m Tools.generate_parabank_client --check
+"""
+import re
+import sys
+import keyword
+import argparse
+from urllib.parse import quote
+import yaml
+
+SPEC_PATH = "Tests/bank_api_swagger.yaml"
+OUTPUT_PATH = "Utils/ParabankClient.py"
+MODELS_OUTPUT_PATH = "Utils/ParabankModels.py"
+
+# OpenAPI parameter type -> serializer defined in the generated module
+SERIALIZERS = {
+    "integer": "_integer",
+    "number": "_number",
+    "boolean": "_boolean",
+    "string": "_string"
+}
+
+PATH_PARAM = re.compile(r"\{(\w+)\}")
+
+HEADER = '''"""
+Typed Parabank REST client generated from Tests/bank_api_swagger.yaml.
+
+DO NOT EDIT - regenerate with `python -m Tools.generate_parabank_client`.
+
+Every operation method builds its URL from a precompiled template, serializes its parameters with the
+serializer of their declared type and sends the request through the given HTTP session. The session only needs
+a requests-style `request(method, url, **kwargs)`, so the same client runs on HTTPClient (pytest) and on a
+Locust HttpUser's client. Methods return the raw response; extra keyword arguments are passed through.
+"""
+from collections import namedtuple
+from decimal import Decimal
+from urllib.parse import quote
+
+Operation = namedtuple("Operation", "method path name endpoint response_schema")
+
+JSON_HEADERS = {{
+    "accept": "application/json",
+    "Content-Type": "application/json"
+}}
+
+_SEQUENCES = (list, tuple)
+
+
+def _integer(value):
+    """Serializes an integer parameter; rejects floats with a fractional part."""
+    if type(value) is int:
+        return str(value)
+    number = int(value)
+    if isinstance(value, float) and number != value:
+        raise ValueError(f"Expected an integer, got {{value!r}}")
+    return str(number)
+
+
+def _number(value):
+    """Serializes a number parameter."""
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return str(value)
+    return str(float(value))
+
+
+def _boolean(value):
+    """Serializes a boolean parameter."""
+    return "true" if value else "false"
+
+
+def _string(value):
+    """Serializes and percent-encodes a string parameter."""
+    return quote(str(value), safe="")
+
+
+def _query(spec, values):
+    """
+    Builds a query string from precompiled (encoded key, serializer) pairs.
+
+    None values are omitted; list/tuple values repeat the key, as requests does.
+    """
+    parts = []
+    for (key, serialize), value in zip(spec, values):
+        if value is None:
+            continue
+        if type(value) in _SEQUENCES:
+            parts.extend(key + serialize(item) for item in value)
+        else:
+            parts.append(key + serialize(value))
+    return "?" + "&".join(parts) if parts else ""
+
+
+OPERATIONS = {{
+{operations}
+}}
+
+{query_specs}
+
+
+class ParabankClient:
+    """
+    Parabank REST client with one method per OpenAPI operation.
+
+    Args:
+        http: Object with a requests-style `request(method, url, **kwargs)` (HTTPClient, requests.Session,
+            Locust's HttpSession).
+        base_url (str): Service root, e.g. "http://localhost:8090/parabank/services/bank".
+        tag_kwarg (str): Keyword used to pass each operation's endpoint name to the session ("endpoint" for
+            HTTPClient, "name" for Locust), so statistics group by template instead of by concrete URL. None to
+            send no tag.
+        headers (dict): Default headers for every request.
+        tag_method (bool): Whether the tag starts with the HTTP method ("GET /accounts/{{accountId}}"). Locust
+            already reports the method separately, so its user passes False ("/accounts/{{accountId}}").
+    """
+
+    def __init__(self, http, base_url, tag_kwarg="endpoint", headers=None, tag_method=True):
+        self.http = http
+        self.base_url = base_url.rstrip("/")
+        self.tag_kwarg = tag_kwarg
+        self.headers = JSON_HEADERS if headers is None else headers
+        self.tag_method = tag_method
+
+    def _send(self, method, url, endpoint, body, kwargs):
+        kwargs.setdefault("headers", self.headers)
+        if self.tag_kwarg:
+            kwargs.setdefault(self.tag_kwarg, endpoint if self.tag_method else endpoint[len(method) + 1:])
+        if body is not None:
+            # Pre-serialized payloads are sent as-is, anything else is JSON-encoded by the session
+            kwargs["data" if isinstance(body, (bytes, str)) else "json"] = body
+        return self.http.request(method, url, **kwargs)
+'''
+
+METHOD = '''
+    def {name}(self{signature}, **kwargs):
+        """
+        {method} {path} ({operation_id}){summary}
+
+        Args:
+{args}
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response{returns}.
+        """
+        return self._send("{method}", f"{{self.base_url}}{url}"{query}, "{endpoint}", {body}, kwargs)
+'''
+
+
+def snake_case(name):
+    """Converts an OpenAPI identifier (camelCase) into a Python identifier."""
+    name = re.sub(r"(?<=[a-z0-9])([A-Z])", r"_\1", name).lower()
+    return name + "_" if keyword.iskeyword(name) else name
+
+
+def _schema_name(schema):
+    if not schema:
+        return None
+    if "$ref" in schema:
+        return schema["$ref"].rsplit("/", 1)[-1]
+    if schema.get("type") == "array" and "$ref" in schema.get("items", {}):
+        return "list[" + schema["items"]["$ref"].rsplit("/", 1)[-1] + "]"
+    return None
+
+
+def _response_schema(operation):
+    for response in operation.get("responses", {}).values():
+        schema = response.get("content", {}).get("application/json", {}).get("schema")
+        name = _schema_name(schema)
+        if name:
+            return name
+    return None
+
+
+def _param_type(param):
+    return (param.get("schema") or param).get("type", "string")
+
+
+def load_operations(spec):
+    """
+    Flattens the spec's paths into operation descriptions, sorted by operationId.
+
+    Returns:
+        list: One dict per operation with method, path, operation_id, name, params, body and response schema.
+    """
+    operations = []
+    for path, methods in spec["paths"].items():
+        for method, operation in methods.items():
+            if not isinstance(operation, dict) or "operationId" not in operation:
+                continue
+            params = []
+            for param in operation.get("parameters", []):
+                if param.get("in") not in ("path", "query"):
+                    continue
+                param_type = _param_type(param)
+                if param_type not in SERIALIZERS:
+                    raise ValueError(f"Unsupported type '{param_type}' for parameter {param['name']} of {path}")
+                params.append({
+                    "name": param["name"],
+                    "arg": snake_case(param["name"]),
+                    "in": param["in"],
+                    "type": param_type,
+                    "required": param.get("required", param["in"] == "path")
+                })
+            body = operation.get("requestBody")
+            operations.append({
+                "method": method.upper(),
+                "path": path,
+                "operation_id": operation["operationId"],
+                "name": snake_case(operation["operationId"]),
+                "summary": operation.get("summary") or operation.get("description") or "",
+                "params": params,
+                "body": _schema_name(body["content"].get("application/json", {}).get("schema")) if body else None,
+                "body_required": bool(body and body.get("required")),
+                "response_schema": _response_schema(operation)
+            })
+    return sorted(operations, key=lambda op: op["operation_id"])
+
+
+def _render_method(op):
+    by_name = {p["name"]: p for p in op["params"]}
+
+    def path_arg(match):
+        param = by_name[match.group(1)]
+        return "{" + f"{SERIALIZERS[param['type']]}({param['arg']})" + "}"
+
+    url = PATH_PARAM.sub(path_arg, op["path"])
+
+    required = [p for p in op["params"] if p["required"]]
+    optional = [p for p in op["params"] if not p["required"]]
+    signature = "".join(f", {p['arg']}" for p in required)
+    if op["body"]:
+        signature += ", body" if op["body_required"] else ", body=None"
+    signature += "".join(f", {p['arg']}=None" for p in optional)
+
+    query_params = [p for p in op["params"] if p["in"] == "query"]
+    query = ""
+    if query_params:
+        values = ", ".join(p["arg"] for p in query_params) + ("," if len(query_params) == 1 else "")
+        query = f" + _query({_query_spec_name(op)}, ({values}))"
+
+    args = [f"            {p['arg']} ({p['type']}): {p['in']} parameter '{p['name']}'." for p in op["params"]]
+    if op["body"]:
+        args.append(f"            body (dict | bytes): {op['body']} request body (bytes/str are sent pre-serialized).")
+
+    return METHOD.format(
+        name=op["name"],
+        signature=signature,
+        method=op["method"],
+        path=op["path"],
+        operation_id=op["operation_id"],
+        summary=f" - {op['summary']}" if op["summary"] else "",
+        args="\n".join(args) if args else "            None.",
+        returns=f" ({op['response_schema']} JSON)" if op["response_schema"] else "",
+        url=url,
+        query=query,
+        endpoint=f"{op['method']} {op['path']}",
+        body="body" if op["body"] else "None"
+    )
+
+
+def _query_spec_name(op):
+    return "_" + op["name"].upper() + "_QUERY"
+
+
+def render(spec):
+    """Renders the client module source for a parsed OpenAPI spec."""
+    operations = load_operations(spec)
+
+    operation_lines = [
+        f'    "{op["operation_id"]}": Operation("{op["method"]}", "{op["path"]}", "{op["name"]}", '
+        f'"{op["method"]} {op["path"]}", {op["response_schema"]!r}),'
+        for op in operations
+    ]
+    query_specs = []
+    for op in operations:
+        query_params = [p for p in op["params"] if p["in"] == "query"]
+        if query_params:
+            pairs = ", ".join(
+                f'("{quote(p["name"], safe="")}=", {SERIALIZERS[p["type"]]})' for p in query_params
+            )
+            query_specs.append(f"{_query_spec_name(op)} = ({pairs}{',' if len(query_params) == 1 else ''})")
+
+    source = HEADER.format(operations="\n".join(operation_lines), query_specs="\n".join(query_specs))
+    source += "".join(_render_method(op) for op in operations)
+    return source
+
+
+MODELS_HEADER = '''"""
+Response models generated from the components/schemas of Tests/bank_api_swagger.yaml.
+
+DO NOT EDIT - regenerate with `python -m Tools.generate_parabank_client`.
+
+Each schema is a compact, immutable tuple-backed class (`__slots__ = ()`, fields exposed as properties, like a
+namedtuple). from_json() validates a decoded JSON object field by field (types, enums, required fields, nested
+objects) while building the instance; from_json_list() reads every object of a JSON array with one itemgetter
+call, validates each column with one set comparison and builds the rows at C speed, so large lists such as
+account transactions are checked and converted without per-field Python code. Models also support the dict-style reads existing callers use
+(`model.get("balance")`, `model["id"]`), keyed by the JSON field names.
+"""
+from itertools import repeat
+from operator import itemgetter
+
+
+class SchemaValidationError(ValueError):
+    """Raised when a response does not match its OpenAPI schema."""
+
+
+# Accepted value classes per OpenAPI type; the _OR_NULL variants are used for optional fields
+_NULL = type(None)
+_INTEGER = frozenset((int,))
+_NUMBER = frozenset((int, float))
+_STRING = frozenset((str,))
+_BOOLEAN = frozenset((bool,))
+_DATE_TIME = frozenset((str, int))  # Parabank serializes date-time fields as epoch milliseconds
+_INTEGER_OR_NULL = _INTEGER | {_NULL}
+_NUMBER_OR_NULL = _NUMBER | {_NULL}
+_STRING_OR_NULL = _STRING | {_NULL}
+_BOOLEAN_OR_NULL = _BOOLEAN | {_NULL}
+_DATE_TIME_OR_NULL = _DATE_TIME | {_NULL}
+_OBJECTS = frozenset((dict,))
+
+_new = tuple.__new__
+
+
+def _not_an_object(model, data):
+    raise SchemaValidationError(f"{model}: expected an object, got {type(data).__name__}")
+
+
+def _reject(model, data):
+    """
+    Slow path of from_json(), taken only when the combined fast check failed: finds the first invalid field
+    and raises a descriptive error.
+    """
+    for key, accepted, expected, required, is_enum in model._RULES:
+        value = data.get(key)
+        if value is None:
+            if required:
+                raise SchemaValidationError(f"{model.__name__}.{key}: required field is missing")
+            continue
+        if accepted is not None and (value if is_enum else value.__class__) not in accepted:
+            raise SchemaValidationError(f"{model.__name__}.{key}: expected {expected}, got {value!r}")
+    raise SchemaValidationError(f"{model.__name__}: invalid object {data!r}")
+
+
+class _Model(tuple):
+    """Base class of the generated models."""
+
+    __slots__ = ()
+    _FIELDS = {}  # JSON field name -> position
+    _KEYS = ()  # JSON field names in position order
+    _GETTER = None  # itemgetter(*_KEYS): reads every field of a JSON object into a tuple in one C call
+    _RULES = ()  # (JSON field name, accepted classes or enum values, expected, required, is enum) per position
+    _NESTED = False  # Whether any field holds another model (validated per object instead of per column)
+
+    @classmethod
+    def from_json(cls, data):
+        """Validates a decoded JSON object and builds the model; every generated model defines its own."""
+        raise NotImplementedError(f"{cls.__name__} has no generated from_json()")
+
+    @classmethod
+    def from_json_list(cls, data):
+        """Validates a JSON array of objects and builds one model per element."""
+        if data.__class__ is not list:
+            raise SchemaValidationError(f"list[{cls.__name__}]: expected an array, got {type(data).__name__}")
+        if cls._NESTED or cls._GETTER is None or not set(map(type, data)) <= _OBJECTS:
+            from_json = cls.from_json
+            return [from_json(item) for item in data]
+
+        try:
+            rows = list(map(cls._GETTER, data))
+        except KeyError:
+            keys = cls._KEYS  # Some objects omit optional fields
+            rows = [tuple(map(item.get, keys)) for item in data]
+
+        columns = zip(*rows)
+        for column, (_, accepted, _, _, is_enum) in zip(columns, cls._RULES):
+            if accepted is not None and not (set(column) if is_enum else set(map(type, column))) <= accepted:
+                for item in data:
+                    cls.from_json(item)  # Raises the descriptive error for the first invalid element
+        return list(map(_new, repeat(cls), rows))
+
+    def get(self, key, default=None):
+        """Dict-style read by JSON field name; missing and null fields return the default."""
+        position = self._FIELDS.get(key)
+        value = None if position is None else tuple.__getitem__(self, position)
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        if key.__class__ is int or key.__class__ is slice:
+            return tuple.__getitem__(self, key)
+        position = self._FIELDS.get(key)
+        if position is None:
+            raise KeyError(key)
+        return tuple.__getitem__(self, position)
+
+    def __contains__(self, key):
+        position = self._FIELDS.get(key)
+        return position is not None and tuple.__getitem__(self, position) is not None
+
+    def __eq__(self, other):
+        return type(other) is type(self) and tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = tuple.__hash__
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+    def to_dict(self):
+        """Converts the model back to its JSON representation (None fields omitted)."""
+        result = {}
+        for key, value in zip(self._KEYS, self):
+            if value is not None:
+                if isinstance(value, _Model):
+                    value = value.to_dict()
+                elif value.__class__ is list:
+                    value = [item.to_dict() if isinstance(item, _Model) else item for item in value]
+                result[key] = value
+        return result
+
+    def __repr__(self):
+        names = (name for name, value in type(self).__dict__.items() if isinstance(value, property))
+        return f"{type(self).__name__}({', '.join(f'{name}={value!r}' for name, value in zip(names, self))})"
+'''
+
+TYPE_SETS = {"integer": "_INTEGER", "number": "_NUMBER", "string": "_STRING", "boolean": "_BOOLEAN"}
+
+
+def _field_rule(schema_name, json_name, prop, required, enums):
+    """
+    Describes how one property is validated.
+
+    Returns:
+        tuple: (from_json() condition that is true for an invalid value or None, _RULES entry source, nested
+            model name or None, whether the nested value is a list).
+    """
+    local = snake_case(json_name)
+    ref = _schema_name(prop)
+    if ref:
+        many = ref.startswith("list[")
+        model = ref[5:-1] if many else ref
+        condition = f"{local} is None" if required else None
+        return condition, f'("{json_name}", None, "{model}", {required}, False)', model, many
+
+    if "enum" in prop:
+        accepted = f"_{snake_case(schema_name).upper()}_{snake_case(json_name).upper()}_ENUM"
+        enums.append(f"{accepted} = frozenset({tuple(prop['enum'])!r})")
+        enums.append(f"{accepted}_OR_NULL = {accepted} | {{None}}")
+        accepted += "" if required else "_OR_NULL"
+        expected = "one of " + "/".join(prop["enum"])
+        return f"{local} not in {accepted}", f'("{json_name}", {accepted}, "{expected}", {required}, True)', None, False
+
+    prop_type = prop.get("type", "string")
+    if prop_type == "string" and prop.get("format") == "date-time":
+        accepted, expected = "_DATE_TIME", "date-time"
+    elif prop_type in TYPE_SETS:
+        accepted, expected = TYPE_SETS[prop_type], prop_type
+    else:
+        condition = f"{local} is None" if required else None
+        return condition, f'("{json_name}", None, "{prop_type}", {required}, False)', None, False
+    accepted += "" if required else "_OR_NULL"
+    return f"{local}.__class__ not in {accepted}", f'("{json_name}", {accepted}, "{expected}", {required}, False)', None, False
+
+
+def _schema_order(schemas):
+    """Orders schemas so nested models are defined before the models referencing them."""
+    ordered = []
+
+    def visit(name):
+        if name in ordered:
+            return
+        for prop in schemas[name].get("properties", {}).values():
+            ref = _schema_name(prop)
+            if ref:
+                visit(ref[5:-1] if ref.startswith("list[") else ref)
+        ordered.append(name)
+
+    for name in sorted(schemas):
+        visit(name)
+    return ordered
+
+
+def render_models(spec):
+    """Renders the models module source for a parsed OpenAPI spec."""
+    schemas = spec["components"]["schemas"]
+    enums = []
+    classes = []
+    for name in _schema_order(schemas):
+        schema = schemas[name]
+        properties = schema.get("properties", {})
+        required = set(schema.get("required", []))
+        attributes = [snake_case(json_name) for json_name in properties]
+        rules = [_field_rule(name, json_name, prop, json_name in required, enums)
+                 for json_name, prop in properties.items()]
+        conditions = [rule[0] for rule in rules if rule[0]]
+        trailing = "," if len(attributes) == 1 else ""
+
+        body = [
+            "",
+            "",
+            f"class {name}(_Model):",
+            f'    """{name} schema."""',
+            "",
+            "    __slots__ = ()",
+            "    _FIELDS = {" + ", ".join(f'"{j}": {i}' for i, j in enumerate(properties)) + "}",
+            "    _KEYS = (" + ", ".join(f'"{j}"' for j in properties) + trailing + ")",
+            "    _GETTER = itemgetter(*_KEYS)" if len(attributes) > 1 else "    _GETTER = None",
+            "    _RULES = (",
+            *[f"        {rule[1]}," for rule in rules],
+            "    )",
+            f"    _NESTED = {any(rule[2] for rule in rules)}",
+            "",
+            *[f"    {a} = property(itemgetter({i}))" for i, a in enumerate(attributes)],
+            "",
+            "    def __new__(cls, " + ", ".join(f"{a}=None" for a in attributes) + "):",
+            f"        return _new(cls, ({', '.join(attributes)}{trailing}))",
+            "",
+            "    @classmethod",
+            "    def from_json(cls, data):",
+            f'        """Validates a decoded JSON object against the {name} schema and builds the model."""',
+            "        if data.__class__ is not dict:",
+            f'            _not_an_object("{name}", data)',
+            f"        {', '.join(attributes)}{trailing} = map(data.get, cls._KEYS)"
+        ]
+        if conditions:
+            body.append(f"        if ({conditions[0]}")
+            body += [f"                or {condition}" for condition in conditions[1:]]
+            body[-1] += "):"
+            body.append("            _reject(cls, data)")
+        for attribute, (_, _, model, many) in zip(attributes, rules):
+            if model:
+                method = "from_json_list" if many else "from_json"
+                body += [f"        if {attribute} is not None:", f"            {attribute} = {model}.{method}({attribute})"]
+        body.append(f"        return _new(cls, ({', '.join(attributes)}{trailing}))")
+        classes.append("\n".join(body))
+
+    return MODELS_HEADER + ("\n\n" + "\n".join(enums) if enums else "") + "\n" + "\n".join(classes) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--spec", default=SPEC_PATH, help="OpenAPI YAML file")
+    parser.add_argument("--output", default=OUTPUT_PATH, help="Generated client module path")
+    parser.add_argument("--models-output", default=MODELS_OUTPUT_PATH, help="Generated models module path")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 if an output is out of date")
+    args = parser.parse_args()
+
+    with open(args.spec, encoding="utf-8") as f:
+        spec = yaml.safe_load(f)
+    outputs = {args.output: render(spec), args.models_output: render_models(spec)}
+
+    if args.check:
+        stale = []
+        for path, source in outputs.items():
+            try:
+                with open(path, encoding="utf-8") as f:
+                    current = f.read()
+            except FileNotFoundError:
+                current = None
+            if current != source:
+                stale.append(path)
+        if stale:
+            print(f"{', '.join(stale)} out of date; run python -m Tools.generate_parabank_client")
+            sys.exit(1)
+        print("Generated modules are up to date")
+        return
+
+    for path, source in outputs.items():
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            f.write(source)
+    print(f"Wrote {args.output} ({len(load_operations(spec))} operations) and "
+          f"{args.models_output} ({len(spec['components']['schemas'])} schemas)")
+
+
+if __name__ == "__main__":
+    main()
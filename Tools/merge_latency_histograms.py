@@ -0,0 +1,71 @@
+"""
+Merges per-endpoint latency histogram files (LatencyHistogram.dump_endpoints) into one and prints percentiles.
+
+Each Locust worker (--histogram-dir) and each pytest process (Reports/Report_<timestamp>_<worker>_histograms.json)
+writes its own file. Histograms merge by adding bucket counts, so the merged percentiles are exact to the histogram's
+precision - unlike averaging per-worker percentiles - and files from different runs can be merged the same way.
+
+Run from the project root:
+    python -m Tools.merge_latency_histograms Reports/Locust_<timestamp>_histograms [more files/dirs] -o merged.json
+"""
+import os
+import argparse
+from Utils.LatencyHistogram import LatencyHistogram
+
+
+def collect_paths(inputs):
+    """Expands directories into the .json files they contain."""
+    paths = []
+    for path in inputs:
+        if os.path.isdir(path):
+            paths += sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith(".json"))
+        else:
+            paths.append(path)
+    return paths
+
+
+def merge_files(paths):
+    """
+    Loads and merges histogram files.
+
+    Returns:
+        tuple: ({endpoint: LatencyHistogram}, sources of all inputs).
+    """
+    histogram_sets, sources = [], []
+    for path in paths:
+        histograms, file_sources = LatencyHistogram.load_endpoints(path)
+        histogram_sets.append(histograms)
+        sources += file_sources or [os.path.basename(path)]
+    return LatencyHistogram.merge_endpoints(histogram_sets), sources
+
+
+def format_table(histograms):
+    """Renders per-endpoint count, mean and percentiles as a text table."""
+    labels = [f"p{pct:g}" for pct in LatencyHistogram.PERCENTILES]
+    lines = [f"{'Endpoint':<44}{'Count':>9}{'Mean':>9}" + "".join(f"{label:>9}" for label in labels) + f"{'Max':>9}"]
+    for endpoint, histogram in sorted(histograms.items()):
+        percentiles = histogram.percentiles()
+        lines.append(f"{endpoint:<44}{histogram.count:>9}{histogram.mean:>9.1f}"
+                     + "".join(f"{percentiles[label]:>9.1f}" for label in labels) + f"{histogram.max:>9.1f}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("inputs", nargs="+", help="Histogram files or directories of them")
+    parser.add_argument("-o", "--output", help="Write the merged histograms to this file")
+    args = parser.parse_args()
+
+    paths = collect_paths(args.inputs)
+    if not paths:
+        parser.error("no histogram files found")
+    histograms, sources = merge_files(paths)
+    print(f"Merged {len(paths)} file(s) from {len(sources)} source(s), latencies in ms")
+    print(format_table(histograms))
+    if args.output:
+        LatencyHistogram.dump_endpoints(args.output, histograms, sources)
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
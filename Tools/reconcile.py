@@ -0,0 +1,43 @@
+"""
+Checks HSQLDB and API consistency after a load run (Utils/Reconciliation.py).
+
+Take a snapshot before the run and check against it afterwards:
+    python -m Tools.reconcile snapshot -o Reports/ledger_before.json
+    ... run the load test ...
+    python -m Tools.reconcile check --before Reports/ledger_before.json --sample 500
+
+Without --before only the API balances are cross-checked. Exits 1 when a mismatch is found.
+"""
+import sys
+import argparse
+from Utils.Reconciliation import Reconciliation
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    snapshot = commands.add_parser("snapshot", help="Record every account's ledger offset")
+    snapshot.add_argument("-o", "--output", required=True, help="Snapshot file to write")
+    check = commands.add_parser("check", help="Reconcile the DB against a snapshot and the API")
+    check.add_argument("--before", help="Snapshot taken before the run")
+    check.add_argument("--sample", type=int, default=Reconciliation.SAMPLE_SIZE,
+                       help="Accounts whose API balance is checked (0 skips the API check)")
+    check.add_argument("--seed", type=int, help="Seed of the account sample")
+    for command in (snapshot, check):
+        command.add_argument("--batch-size", type=int, default=Reconciliation.BATCH_SIZE, help="Rows per DB batch")
+    args = parser.parse_args()
+
+    reconciliation = Reconciliation(batch_size=args.batch_size)
+    if args.command == "snapshot":
+        ledger = reconciliation.ledger()
+        Reconciliation.save_offsets(args.output, ledger)
+        print(f"Snapshot of {len(ledger)} accounts written to {args.output}")
+        return
+    before = Reconciliation.load_offsets(args.before) if args.before else None
+    report = reconciliation.run(before=before, sample_size=args.sample, seed=args.seed)
+    print(report.summary())
+    sys.exit(0 if report.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
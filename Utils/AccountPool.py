@@ -0,0 +1,175 @@
+import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from Utils.WorkerAccounts import WorkerAccounts
+from Utils.LatencyStats import LatencyStats
+
+
+class AccountLease:
+    """An account handed out by the AccountPool for the duration of one test."""
+
+    __slots__ = ("account_id", "balance", "verified_balance")
+
+    def __init__(self, account_id, balance):
+        self.account_id = account_id
+        self.balance = balance  # Balance known when the account was leased (tracked locally, not re-read)
+        self.verified_balance = None  # Set when a BalanceLedger verified the final balance during the lease
+
+    def __repr__(self):
+        return f"AccountLease(account_id={self.account_id}, balance={self.balance})"
+
+
+class AccountPool(WorkerAccounts):
+    """
+    Pool of pre-provisioned, funded accounts that are leased to tests and recycled afterwards.
+
+    fill() creates all accounts up front in parallel, so tests get an account with a locally known balance
+    without any setup round trip. Released accounts go through a background recycler that re-reads the balance
+    (unless the caller reports it) and tops the account back up before it is leased again. An account the
+    recycler still cannot read or top up after RECYCLE_ATTEMPTS is replaced by a newly provisioned one, so the
+    pool does not shrink; stats count the failures.
+    """
+
+    POOL_SIZE = 4  # Accounts provisioned per process
+    FUNDING = 10000  # Starting balance of every pooled account
+    MIN_BALANCE = 2000  # Recycled accounts below this balance are topped back up to FUNDING
+    PROVISION_WORKERS = 8  # Concurrent provisioning requests during fill()
+    LEASE_TIMEOUT = 60  # Seconds to wait for a recycled account when every account is leased
+    RECYCLE_ATTEMPTS = 3  # Tries to re-read/top up a released account before it is replaced by a new one
+    RECYCLE_RETRY_DELAY = 0.5  # Seconds between recycle attempts
+
+    def __init__(self, size=None, funding=None, min_balance=None):
+        """
+        Args:
+            size (int): Number of accounts to provision.
+            funding (float): Starting balance of every account.
+            min_balance (float): Balance below which a recycled account is topped up.
+        """
+        self.size = size or self.POOL_SIZE
+        self.funding = funding or self.FUNDING
+        self.min_balance = self.MIN_BALANCE if min_balance is None else min_balance
+
+        self._available = queue.Queue()
+        self._recycle = queue.Queue()
+        self._leased = {}
+        self._lock = threading.Lock()
+        self._recycler = None
+        self.stats = {"leases": 0, "recycled": 0, "balance_reads": 0, "top_ups": 0, "recycle_failures": 0,
+                      "replaced": 0, "lost": 0}
+
+    def fill(self):
+        """
+        Provisions the pool's accounts concurrently and starts the recycler.
+
+        Returns:
+            list: IDs of the provisioned accounts.
+        """
+        log = self.get_logger()
+        with ThreadPoolExecutor(max_workers=min(self.PROVISION_WORKERS, self.size)) as executor:
+            account_ids = list(executor.map(self._provision_one, range(self.size)))
+
+        for account_id in account_ids:
+            self._available.put(AccountLease(account_id, self.funding))
+
+        self._recycler = threading.Thread(target=self._recycle_loop, name="account-pool-recycler", daemon=True)
+        self._recycler.start()
+        log.info(f"Account pool filled with {len(account_ids)} accounts of {self.funding}: {account_ids}")
+        return account_ids
+
+    def _provision_one(self, _):
+        # Pool setup runs inside whichever test first needs an account; keep it out of that test's latencies
+        with LatencyStats.unattributed():
+            return self.provision(1, self.funding)[0]
+
+    def lease(self):
+        """
+        Leases an account.
+
+        Returns:
+            AccountLease: The account ID and its known balance.
+
+        Raises:
+            TimeoutError: If no account is returned to the pool within LEASE_TIMEOUT.
+        """
+        try:
+            lease = self._available.get(timeout=self.LEASE_TIMEOUT)
+        except queue.Empty:
+            raise TimeoutError(f"No pooled account became available within {self.LEASE_TIMEOUT}s "
+                               f"(pool of {self.size}, {self.stats['lost']} account(s) lost to recycle failures)")
+        with self._lock:
+            self._leased[lease.account_id] = lease
+            self.stats["leases"] += 1
+        return lease
+
+    def release(self, lease, balance=None):
+        """
+        Returns a leased account to the pool.
+
+        Args:
+            lease (AccountLease): The lease to return.
+            balance (float): The account's balance if the caller tracked it; when omitted the recycler
+                re-reads it in the background, off the test's critical path.
+        """
+        with self._lock:
+            self._leased.pop(lease.account_id, None)
+        lease.balance = balance
+        lease.verified_balance = None
+        self._recycle.put(lease)
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _recycle_loop(self):
+        log = self.get_logger()
+        with LatencyStats.unattributed():  # Background reads and top-ups belong to no test
+            while True:
+                lease = self._recycle.get()
+                if lease is None:
+                    return
+                for attempt in range(1, self.RECYCLE_ATTEMPTS + 1):
+                    try:
+                        self._recycle_one(lease)
+                        self._available.put(lease)
+                        break
+                    except Exception as e:
+                        lease.balance = None  # A failed top-up may still have reached the server; re-read it
+                        self._count("recycle_failures")
+                        log.warning(f"Recycling pooled account {lease.account_id} failed "
+                                    f"(attempt {attempt}/{self.RECYCLE_ATTEMPTS}): {e}")
+                        time.sleep(self.RECYCLE_RETRY_DELAY)
+                else:
+                    self._replace(lease)
+
+    def _recycle_one(self, lease):
+        """Re-reads the balance if it is unknown and tops the account up below min_balance."""
+        if lease.balance is None:
+            lease.balance = self.get_account_balance(lease.account_id)
+            self._count("balance_reads")
+        if lease.balance < self.min_balance:
+            self.deposit_to_account(lease.account_id, self.funding - lease.balance)
+            lease.balance = self.funding
+            self._count("top_ups")
+        self._count("recycled")
+
+    def _replace(self, lease):
+        """Provisions a new account in place of one whose balance could not be established, so the pool keeps
+        its size; an account is only counted as lost when provisioning fails too."""
+        log = self.get_logger()
+        try:
+            account_id = self.provision(1, self.funding)[0]
+        except Exception as e:
+            self._count("lost")
+            log.error(f"Pooled account {lease.account_id} dropped and no replacement could be provisioned: {e}")
+            return
+        self._count("replaced")
+        log.warning(f"Pooled account {lease.account_id} replaced by {account_id} after failed recycling")
+        self._available.put(AccountLease(account_id, self.funding))
+
+    def close(self):
+        """Stops the recycler thread."""
+        if self._recycler is not None:
+            self._recycle.put(None)
+            self._recycler.join(timeout=5)
+            self._recycler = None
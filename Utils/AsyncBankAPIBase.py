@@ -0,0 +1,433 @@
+import time
+import asyncio
+import json
+import aiohttp
+import requests
+from Utils.BaseClass import BaseClass
+from Utils.BankAPIBase import BankAPIBase, HEADERS
+from Utils.LatencyStats import LatencyStats
+from Utils.ParabankModels import Account, Customer, Position, BillPayResult, LoanResponse
+
+
+class AsyncHTTPError(requests.exceptions.HTTPError, aiohttp.ClientError):
+    """
+    4xx/5xx response of the async client.
+
+    A requests HTTPError like the ones BankAPIBase raises, so assertions shared by both clients catch the same type;
+    also an aiohttp.ClientError, so it is handled like any other aiohttp failure.
+    """
+
+
+class AsyncBankAPIBase(BaseClass):
+    """
+    Asyncio counterpart of BankAPIBase.
+
+    Every API method is a coroutine and all of them share one aiohttp connection pool. The number of requests
+    in flight is capped by a semaphore, so fan-outs across hundreds of accounts stay within MAX_CONCURRENCY.
+    Responses are decoded into the same ParabankModels classes as BankAPIBase returns, and every request is
+    recorded in LatencyStats under the same endpoint names.
+    """
+
+    # --- Pool / Concurrency Settings ---
+    POOL_LIMIT = 100  # Total simultaneous connections kept by the connector
+    POOL_LIMIT_PER_HOST = 50  # Simultaneous connections to the Parabank host
+    KEEPALIVE_TIMEOUT = 30  # Seconds an idle connection is kept open
+    MAX_CONCURRENCY = 50  # Requests allowed in flight at once
+    TIMEOUT = 30  # Total seconds allowed per request
+
+    def __init__(self, max_concurrency=None, pool_limit=None, pool_limit_per_host=None):
+        """
+        Args:
+            max_concurrency (int): Maximum number of requests in flight at once.
+            pool_limit (int): Maximum number of pooled connections.
+            pool_limit_per_host (int): Maximum number of pooled connections per host.
+        """
+        self.max_concurrency = max_concurrency or self.MAX_CONCURRENCY
+        self.pool_limit = pool_limit or self.POOL_LIMIT
+        self.pool_limit_per_host = pool_limit_per_host or self.POOL_LIMIT_PER_HOST
+        self._session = None
+        self._semaphore = None
+        self._loop = None
+
+    # --- Session Lifecycle ---
+    async def open(self):
+        """Creates the shared connection pool. Must be awaited inside the loop that will use the client."""
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_limit,
+                limit_per_host=self.pool_limit_per_host,
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.TIMEOUT),
+                trace_configs=[self._connect_timer()]
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def close(self):
+        """Closes the shared connection pool."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    # --- Synchronous Bridge (for the existing sync test classes) ---
+    def start(self):
+        """Creates a private event loop and opens the pool on it, so sync code can drive the client via run()."""
+        self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(self.open())
+        return self
+
+    def run(self, coro):
+        """
+        Runs a coroutine of this client to completion on the private loop created by start().
+
+        Args:
+            coro (coroutine): e.g. `api.get_balances(account_ids)`.
+
+        Returns:
+            The coroutine's result.
+        """
+        return self._loop.run_until_complete(coro)
+
+    def stop(self):
+        """Closes the pool and the private event loop created by start()."""
+        if self._loop is not None:
+            self._loop.run_until_complete(self.close())
+            self._loop.close()
+            self._loop = None
+
+    # --- Request Plumbing ---
+    @staticmethod
+    def _connect_timer():
+        """TraceConfig that adds the time spent opening connections to the request's timing context."""
+        async def on_start(session, context, params):
+            context.trace_request_ctx["connect_start"] = time.perf_counter()
+
+        async def on_end(session, context, params):
+            timing = context.trace_request_ctx
+            timing["connect"] += time.perf_counter() - timing.pop("connect_start")
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_start.append(on_start)
+        trace_config.on_connection_create_end.append(on_end)
+        return trace_config
+
+    async def _request(self, method, path, endpoint, params=None, payload=None):
+        """
+        Sends a request through the shared pool, bounded by the concurrency semaphore, and records its latency in
+        LatencyStats.
+
+        Args:
+            method (str): HTTP method.
+            path (str): Path below the base URL.
+            endpoint (str): Name the sample is aggregated under, the same as the sync client's, e.g.
+                "GET /accounts/{accountId}".
+            params (dict): Query parameters.
+            payload (dict): JSON request body, serialized here so its size can be recorded.
+
+        Returns:
+            tuple: (status, reason, body bytes)
+        """
+        if self._session is None:
+            raise RuntimeError("AsyncBankAPIBase is not open; use 'async with' or call open()/start() first.")
+        data = None if payload is None else json.dumps(payload).encode()
+        async with self._semaphore:
+            url = f"{BankAPIBase.base_url}{path}"
+            timing = {"connect": 0.0}
+            start = time.perf_counter()
+            try:
+                async with self._session.request(method, url, params=params, data=data,
+                                                 trace_request_ctx=timing) as response:
+                    headers_at = time.perf_counter()
+                    body = await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                LatencyStats.record(endpoint, 0, timing["connect"] * 1000, elapsed_ms, elapsed_ms, 0, 0)
+                raise
+            total_ms = (time.perf_counter() - start) * 1000
+            connect_ms = timing["connect"] * 1000
+            ttfb_ms = max((headers_at - start) * 1000 - connect_ms, 0.0)
+            LatencyStats.record(endpoint, response.status, connect_ms, ttfb_ms, total_ms,
+                                len(data) if data else 0, len(body))
+            return response.status, response.reason, body
+
+    @staticmethod
+    def _raise_for_status(status, reason, action):
+        """Raises AsyncHTTPError for 4xx/5xx statuses, worded like the BankAPIBase HTTP errors."""
+        if status >= 400:
+            kind = "Client" if status < 500 else "Server"
+            raise AsyncHTTPError(f"HTTP error occurred {action}: {status} {kind} Error: {reason}")
+
+    # --- Fan-out Helpers ---
+    async def gather_bounded(self, func, items, return_exceptions=False):
+        """
+        Runs `func(item)` for every item concurrently; the shared semaphore keeps at most
+        MAX_CONCURRENCY requests in flight.
+
+        Args:
+            func (callable): Coroutine function taking a single item (e.g. self.get_account_balance).
+            items (iterable): Items to fan out over.
+            return_exceptions (bool): Collect exceptions as results instead of raising the first one.
+
+        Returns:
+            list: Results in the same order as items.
+        """
+        return await asyncio.gather(*(func(item) for item in items), return_exceptions=return_exceptions)
+
+    async def get_balances(self, account_ids):
+        """
+        Fetches balances for many accounts concurrently.
+
+        Args:
+            account_ids (iterable): Account IDs, or rows such as BaseClass.ACCOUNT_ID_LIST ((id,), ...).
+
+        Returns:
+            dict: Mapping of account ID to balance.
+        """
+        ids = [row[0] if isinstance(row, (tuple, list)) else row for row in account_ids]
+        balances = await self.gather_bounded(self.get_account_balance, ids)
+        return dict(zip(ids, balances))
+
+    # --- API Methods ---
+    async def get_account_balance(self, account_id):
+        """
+        Fetches account balance for the specified account.
+
+        Args:
+            account_id (int): The ID of the account to fetch balance for.
+
+        Returns:
+            float: The account balance.
+
+        Raises:
+            HTTPError: If there is an HTTP error while fetching the account balance.
+            ValueError: If the balance is missing or the response does not match the Account schema.
+        """
+        status, reason, body = await self._request("GET", f"/accounts/{account_id}", "GET /accounts/{accountId}")
+        self._raise_for_status(status, reason, "while fetching the account balance")
+        account = BankAPIBase.decode(body, Account)
+        if account.balance is None:
+            raise ValueError(f"Failed to retrieve account balance: Balance key not found in the response. "
+                             f"Response: {body.decode()}")
+        return account.balance
+
+    async def create_new_account(self, customer_id, account_type, source_account_id):
+        """
+        Creates a new account for a given customer.
+
+        Args:
+            customer_id (int): ID of the customer requesting the account creation.
+            account_type (int): Type of account to create (e.g., 1 for CHECKING, 2 for SAVINGS).
+            source_account_id (int): ID of the funding source account.
+
+        Returns:
+            dict: On error, a dictionary with "error" and "details" keys (same shape as BankAPIBase).
+            int: On success, the ID of the newly created account.
+
+        Raises:
+            ValueError: If the response does not contain an account ID or does not match the Account schema.
+        """
+        log = self.get_logger()
+        status, reason, body = await self._request("POST", "/createAccount", "POST /createAccount", params={
+            "customerId": customer_id,
+            "newAccountType": account_type,
+            "fromAccountId": source_account_id
+        })
+        if status >= 400:
+            kind = "Client" if status < 500 else "Server"
+            details = body.decode() or "No additional details."
+            log.error(f"HTTP error occurred during account creation: {status} {reason}. Details: {details}")
+            return {"error": f"{status} {kind} Error", "details": details}
+
+        account_id = BankAPIBase.decode(body, Account).id
+        if account_id is None:
+            log.error("Failed to create account: 'id' field missing in response.")
+            raise ValueError("Account ID missing in response")
+        log.info(f"New account created with ID: {account_id}")
+        return account_id
+
+    async def deposit_to_account(self, account_id, amount):
+        """
+        Performs deposit operation on specified account.
+
+        Args:
+            account_id (int): The ID of the account to deposit into.
+            amount (float): The amount to deposit.
+
+        Returns:
+            str: The response text from the deposit operation.
+
+        Raises:
+            HTTPError: If the deposit request fails.
+        """
+        status, reason, body = await self._request("POST", "/deposit", "POST /deposit",
+                                                    params={"accountId": account_id, "amount": amount})
+        self._raise_for_status(status, reason, "during deposit")
+        return body.decode()
+
+    async def withdraw_from_account(self, account_id, amount):
+        """
+        Performs withdrawal operation on specified account.
+
+        Args:
+            account_id (int): The ID of the account to withdraw from.
+            amount (float): The amount to withdraw.
+
+        Returns:
+            str: The response text from the withdrawal operation.
+
+        Raises:
+            HTTPError: If the withdrawal request fails.
+        """
+        status, reason, body = await self._request("POST", "/withdraw", "POST /withdraw",
+                                                    params={"accountId": account_id, "amount": amount})
+        self._raise_for_status(status, reason, "during withdrawal")
+        return body.decode()
+
+    async def billpay(self, account_id, amount, name, street, city, state, zip_code, phone_number, account_number):
+        """
+        Performs billpay operation on the specified account.
+
+        Args:
+            account_id (int): The account ID for the bill payment.
+            amount (float): The amount to pay.
+            name (str): The name of the bill recipient.
+            street (str): The street address of the recipient.
+            city (str): The city of the recipient.
+            state (str): The state of the recipient.
+            zip_code (str): The zip code of the recipient.
+            phone_number (str): The phone number of the recipient.
+            account_number (str): The account number for the payment.
+
+        Returns:
+            BillPayResult: The bill payment result (also readable dict-style, e.g. result.get("payeeName")).
+
+        Raises:
+            HTTPError: If the billpay request fails.
+            ValueError: If the response does not match the BillPayResult schema.
+        """
+        data = {
+            "name": name,
+            "address": {
+                "street": street,
+                "city": city,
+                "state": state,
+                "zipCode": zip_code
+            },
+            "phoneNumber": phone_number,
+            "accountNumber": account_number
+        }
+        status, reason, body = await self._request("POST", "/billpay", "POST /billpay",
+                                                    params={'accountId': account_id, 'amount': amount}, payload=data)
+        self._raise_for_status(status, reason, "during billpay")
+        return BankAPIBase.decode(body, BillPayResult)
+
+    async def get_customer_details(self, account_id):
+        """
+        Fetches customer details based on account ID.
+
+        Args:
+            account_id (int): The ID of the account whose customer details are to be fetched (same parameter as
+                BankAPIBase.get_customer_details; Parabank resolves it as the customer ID).
+
+        Returns:
+            Customer: The customer details (also readable dict-style, e.g. customer.get("firstName")).
+
+        Raises:
+            HTTPError: If the request to fetch customer details fails.
+            ValueError: If customer details are not found or do not match the Customer schema.
+        """
+        status, reason, body = await self._request("GET", f"/customers/{account_id}", "GET /customers/{customerId}")
+        self._raise_for_status(status, reason, "while retrieving customer details")
+        customer_info = BankAPIBase.decode(body, Customer)
+        if customer_info.id is None:
+            raise ValueError(f"Failed to retrieve customer details. Response: {body.decode()}")
+        return customer_info
+
+    async def get_account_by_id(self, account_id):
+        """
+        Fetches account details by account ID.
+
+        Args:
+            account_id (int): The ID of the account to fetch.
+
+        Returns:
+            Account: The account details (also readable dict-style, e.g. account.get("balance")).
+
+        Raises:
+            HTTPError: If the request to fetch account details fails.
+            ValueError: If account details are not found or do not match the Account schema.
+        """
+        status, reason, body = await self._request("GET", f"/accounts/{account_id}", "GET /accounts/{accountId}")
+        self._raise_for_status(status, reason, "while retrieving account")
+        account_info = BankAPIBase.decode(body, Account)
+        if account_info.id is None:
+            raise ValueError(f"Failed to retrieve account details: Accounts not found in the response. "
+                             f"Response: {body.decode()}")
+        return account_info
+
+    async def get_loan_approval(self, customer_id, amount, down_payment, source_account_id):
+        """
+        Requests a loan approval for the customer.
+
+        Args:
+            customer_id (int): The ID of the customer requesting the loan.
+            amount (float): The loan amount requested.
+            down_payment (float): The down payment for the loan.
+            source_account_id (int): The account ID from which the loan payment is funded.
+
+        Returns:
+            bool: Whether the loan was approved.
+
+        Raises:
+            HTTPError: If the loan request fails.
+            ValueError: If the response does not match the LoanResponse schema.
+        """
+        status, reason, body = await self._request("POST", "/requestLoan", "POST /requestLoan", params={
+            "customerId": customer_id,
+            "amount": amount,
+            "downPayment": down_payment,
+            "fromAccountId": source_account_id
+        })
+        self._raise_for_status(status, reason, "while requesting loan approval")
+        return BankAPIBase.decode(body, LoanResponse).get('approved', False)
+
+    async def buy_position(self, source_account, pos_name, pos_symbol, number_of_shares, share_price):
+        """
+        Buys a position for the base customer, funded from the given account.
+
+        Args:
+            source_account (int): The account the shares are paid from.
+            pos_name (str): The name of the position.
+            pos_symbol (str): The ticker symbol of the position.
+            number_of_shares (int): The number of shares to buy.
+            share_price (float): The price per share.
+
+        Returns:
+            list[Position]: The customer's positions.
+
+        Raises:
+            HTTPError: If the buy position request fails.
+            ValueError: If the response does not match the Position schema.
+        """
+        status, reason, body = await self._request(
+            "POST", f"/customers/{self.CUSTOMER_ID[0][0]}/buyPosition", "POST /customers/{customerId}/buyPosition",
+            params={
+                "accountId": source_account,
+                "name": pos_name,
+                "symbol": pos_symbol,
+                "shares": number_of_shares,
+                "pricePerShare": share_price,
+            }
+        )
+        self._raise_for_status(status, reason, "while requesting buying position")
+        return BankAPIBase.decode(body, Position, many=True)
@@ -0,0 +1,195 @@
+from Utils.WorkerAccounts import WorkerAccounts
+
+
+class BalanceMismatchError(AssertionError):
+    """Raised when an account's real balance diverges from the balance the ledger expects."""
+
+
+class BalanceLedger:
+    """
+    Client-side ledger around BankAPIBase that computes expected balances locally.
+
+    Every money-moving call made through the ledger (deposit, withdraw, billpay, loan down payments,
+    buy_position, new-account transfers) updates the expected balance of the affected accounts, so tests no
+    longer need to read the balance before and after each operation. How often the real balance is read back
+    and compared is controlled by the verification policy:
+
+        - "every_op": after every operation (same request count as the classic before/after pattern)
+        - "every_n":  after every `every_n` operations, for the accounts touched since the last check (default)
+        - "at_end":   only when verify_all() is called (e.g. at test teardown)
+
+    "every_n" is the default: it cuts the balance reads by a factor of `every_n` while a divergence is still
+    reported within `every_n` operations of the call that caused it.
+    """
+
+    EVERY_OP = "every_op"
+    EVERY_N = "every_n"
+    AT_END = "at_end"
+    POLICIES = (EVERY_OP, EVERY_N, AT_END)
+
+    TOLERANCE = 0.005  # Balances are compared to the cent
+
+    def __init__(self, api, policy=EVERY_N, every_n=10):
+        """
+        Args:
+            api (BankAPIBase): The API helper the operations are sent through.
+            policy (str): One of POLICIES.
+            every_n (int): Operations between verifications for the "every_n" policy.
+
+        Raises:
+            ValueError: If the policy is unknown.
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown verification policy '{policy}', expected one of {self.POLICIES}")
+        self.api = api
+        self.policy = policy
+        self.every_n = every_n
+        self._expected = {}
+        self._unverified = set()
+        self._verified = {}
+        self._ops_since_verify = 0
+        self.stats = {"operations": 0, "verifications": 0, "balance_reads": 0}
+
+    # --- Tracking ---
+    def track(self, account_id, balance=None):
+        """
+        Starts tracking an account.
+
+        Args:
+            account_id (int): The account to track.
+            balance (float): Its current balance if already known (e.g. from a pool lease); read once otherwise.
+        """
+        if balance is None:
+            balance = self._read_balance(account_id)
+        self._expected[account_id] = balance
+
+    def expected_balance(self, account_id):
+        """Returns the balance the ledger expects the account to have."""
+        return self._expected[account_id]
+
+    def verified_balance(self, account_id):
+        """Returns the account's balance as last read back from the API, or None if changed since."""
+        return self._verified.get(account_id)
+
+    def _read_balance(self, account_id):
+        self.stats["balance_reads"] += 1
+        return self.api.get_account_balance(account_id)
+
+    def _ensure_tracked(self, account_id):
+        """Reads the starting balance of an account the first time an operation touches it."""
+        if account_id not in self._expected:
+            self.track(account_id)
+
+    def _apply(self, account_id, delta):
+        """Records a balance change and runs a verification if the policy calls for one."""
+        self._expected[account_id] = round(self._expected[account_id] + delta, 2)
+        self._unverified.add(account_id)
+        self._verified.pop(account_id, None)
+        self.stats["operations"] += 1
+        self._ops_since_verify += 1
+
+        if self.policy == self.EVERY_OP:
+            self.verify(account_id)
+        elif self.policy == self.EVERY_N and self._ops_since_verify >= self.every_n:
+            self.verify_all()
+
+    # --- Verification ---
+    def verify(self, account_id):
+        """
+        Reads the account's real balance and compares it with the expected one.
+
+        Returns:
+            float: The verified balance.
+
+        Raises:
+            BalanceMismatchError: If the balances differ.
+        """
+        actual = self._read_balance(account_id)
+        expected = self._expected[account_id]
+        self.stats["verifications"] += 1
+        if abs(actual - expected) > self.TOLERANCE:
+            raise BalanceMismatchError(
+                f"Balance of account {account_id} diverged from the ledger: expected {expected}, got {actual}"
+            )
+        self._unverified.discard(account_id)
+        self._verified[account_id] = actual
+        return actual
+
+    def verify_all(self):
+        """
+        Verifies every account changed since its last verification.
+
+        Raises:
+            BalanceMismatchError: On the first account whose balances differ.
+        """
+        try:
+            for account_id in sorted(self._unverified):
+                self.verify(account_id)
+        finally:
+            self._ops_since_verify = 0  # A mismatch must not make every following operation verify again
+
+    # --- Ledgered Operations ---
+    def deposit(self, account_id, amount):
+        """Deposits through the API and credits the expected balance."""
+        self._ensure_tracked(account_id)
+        result = self.api.deposit_to_account(account_id, amount)
+        self._apply(account_id, amount)
+        return result
+
+    def withdraw(self, account_id, amount):
+        """Withdraws through the API and debits the expected balance."""
+        self._ensure_tracked(account_id)
+        result = self.api.withdraw_from_account(account_id, amount)
+        self._apply(account_id, -amount)
+        return result
+
+    def billpay(self, account_id, amount, name, street, city, state, zip_code, phone_number, account_number):
+        """Pays a bill through the API and debits the expected balance."""
+        self._ensure_tracked(account_id)
+        result = self.api.billpay(account_id, amount, name, street, city, state, zip_code,
+                                  phone_number, account_number)
+        self._apply(account_id, -amount)
+        return result
+
+    def billpay_payload(self, account_id, amount, payload):
+        """Pays a bill with a pre-serialized Payee (e.g. from a PayloadPool) and debits the expected balance."""
+        self._ensure_tracked(account_id)
+        result = self.api.billpay_payload(account_id, amount, payload)
+        self._apply(account_id, -amount)
+        return result
+
+    def request_loan(self, customer_id, amount, down_payment, source_account_id):
+        """
+        Requests a loan; when approved the down payment is debited and the new loan account is tracked.
+
+        Returns:
+            dict: The loan response.
+        """
+        self._ensure_tracked(source_account_id)
+        response = self.api.request_loan(customer_id, amount, down_payment, source_account_id)
+        if response.get('approved', False):
+            self._apply(source_account_id, -down_payment)
+            if response.get('accountId') is not None:
+                self._expected[response['accountId']] = amount
+        return response
+
+    def buy_position(self, source_account, pos_name, pos_symbol, number_of_shares, share_price):
+        """Buys a position and debits shares * price from the source account."""
+        self._ensure_tracked(source_account)
+        result = self.api.buy_position(source_account, pos_name, pos_symbol, number_of_shares, share_price)
+        self._apply(source_account, -(number_of_shares * share_price))
+        return result
+
+    def create_new_account(self, customer_id, account_type, source_account_id):
+        """
+        Creates an account; on success the initial transfer moves from the source to the new account.
+
+        Returns:
+            int | dict: The new account ID, or the error dictionary returned by BankAPIBase.
+        """
+        self._ensure_tracked(source_account_id)
+        account_id = self.api.create_new_account(customer_id, account_type, source_account_id)
+        if not isinstance(account_id, dict):
+            self._apply(source_account_id, -WorkerAccounts.NEW_ACCOUNT_TRANSFER)
+            self._expected[account_id] = WorkerAccounts.NEW_ACCOUNT_TRANSFER
+        return account_id
@@ -1,9 +1,18 @@
+import os
+import queue
 import requests
 import time
+import threading
+from datetime import date, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from Utils.BaseClass import BaseClass
+from Utils.HTTPClient import HTTPClient
+from Utils.ParabankClient import ParabankClient
+from Utils.ParabankModels import Account, Customer, Transaction, Position, BillPayResult, LoanResponse
+from Utils.JSONDecoder import JSONDecoder
 
-# Base URL for the Parabank service
-BASE_URL = "http://localhost:8090/parabank/services/bank"
+# Base URL for the Parabank service (PARABANK_BASE_URL points the suite at another instance, e.g. the local mock)
+BASE_URL = os.environ.get("PARABANK_BASE_URL", "http://localhost:8090/parabank/services/bank").rstrip("/")
 
 # Base headers used for JSON responses
 HEADERS = {
@@ -15,6 +24,59 @@ HEADERS = {
 class BankAPIBase(BaseClass):
     """Helper class for interacting with the Bank OpenAPI."""
 
+    # --- Transaction History Streaming ---
+    TRANSACTION_DATE_FORMAT = "%m-%d-%Y"  # Parabank's MM-dd-yyyy path dates
+    TRANSACTION_WINDOW_DAYS = 30  # Days fetched per fromDate/toDate request
+    TRANSACTION_FETCH_WORKERS = 4  # Accounts fetched concurrently by iter_accounts_transactions
+    TRANSACTION_QUEUE_SIZE = 1000  # Transactions buffered between the fetch workers and the consumer
+
+    _api_client = None
+    base_url = BASE_URL
+
+    @classmethod
+    def use_base_url(cls, url):
+        """Points every BankAPIBase (and AsyncBankAPIBase) call of this process at another Parabank base URL."""
+        BankAPIBase.base_url = url.rstrip("/")
+        BankAPIBase._api_client = None
+
+    @property
+    def http(self):
+        """Shared pooled HTTP client (keep-alive, retries, timeouts) that every API call is routed through."""
+        return HTTPClient.shared()
+
+    @property
+    def api(self):
+        """Generated Parabank client (Utils/ParabankClient.py) bound to the shared HTTP client."""
+        http = self.http
+        client = BankAPIBase._api_client
+        if client is None or client.http is not http:
+            client = BankAPIBase._api_client = ParabankClient(http, BankAPIBase.base_url, headers=HEADERS)
+        return client
+
+    @staticmethod
+    def decode(response, model, many=False):
+        """
+        Decodes a response body with the configured JSONDecoder and validates it into generated models.
+
+        Args:
+            response (requests.Response): The API response.
+            model (type): A class from Utils/ParabankModels.py.
+            many (bool): Whether the body is a JSON array of the model.
+
+        Returns:
+            The model instance, or a list of them.
+
+        Raises:
+            SchemaValidationError: If the body does not match the model's schema (a ValueError).
+        """
+        data = JSONDecoder.decode(response)
+        return model.from_json_list(data) if many else model.from_json(data)
+
+    @staticmethod
+    def _response_details(response):
+        """Response text for an error message, or a note that no request was sent (response is None)."""
+        return f"Response: {response.text}" if response is not None else "No request was sent."
+
     def get_account_balance(self, account_id):
         """
         Fetches account balance for the specified account.
@@ -27,21 +89,22 @@ class BankAPIBase(BaseClass):
 
         Raises:
             HTTPError: If there is an HTTP error while fetching the account balance.
-            ValueError: If the balance key is missing in the response.
+            ValueError: If the account ID is not an integer or the balance key is missing in the response.
             Exception: If any other unexpected error occurs.
         """
+        response = None  # Stays None when the request itself is rejected (e.g. a non-numeric ID)
         try:
-            response = requests.get(f"{BASE_URL}/accounts/{account_id}", headers=HEADERS)
+            response = self.api.get_account(account_id)
             response.raise_for_status()
 
-            account_info = response.json()
-            if 'balance' not in account_info:
+            account = self.decode(response, Account)
+            if account.balance is None:
                 raise ValueError("Balance key not found in the response.")
-            return account_info['balance']
+            return account.balance
         except requests.exceptions.HTTPError as http_err:
             raise requests.exceptions.HTTPError(f"HTTP error occurred: {http_err}")
         except ValueError as e:
-            raise ValueError(f"Failed to retrieve account balance: {e}. Response: {response.text}")
+            raise ValueError(f"Failed to retrieve account balance: {e}. {self._response_details(response)}")
         except Exception as e:
             raise Exception(f"An error occurred while fetching the account balance: {e}")
 
@@ -70,19 +133,10 @@ class BankAPIBase(BaseClass):
         log.info(f"Creating new account for customer {customer_id} with type {account_type}")
 
         try:
-            response = requests.post(
-                f"{BASE_URL}/createAccount",
-                headers=HEADERS,
-                params={
-                    "customerId": customer_id,
-                    "newAccountType": account_type,
-                    "fromAccountId": source_account_id
-                }
-            )
+            response = self.api.create_account(customer_id, account_type, source_account_id)
             response.raise_for_status()
 
-            account_data = response.json()
-            account_id = account_data.get('id')
+            account_id = self.decode(response, Account).id
 
             if account_id is None:
                 log.error("Failed to create account: 'id' field missing in response.")
@@ -118,8 +172,7 @@ class BankAPIBase(BaseClass):
             Exception: If any other unexpected error occurs.
         """
         try:
-            response = requests.post(f"{BASE_URL}/deposit", headers=HEADERS,
-                                     params={"accountId": account_id, "amount": amount})
+            response = self.api.deposit(account_id, amount)
             response.raise_for_status()
             return response.text
         except requests.exceptions.HTTPError as http_err:
@@ -143,8 +196,7 @@ class BankAPIBase(BaseClass):
             Exception: If any other unexpected error occurs.
         """
         try:
-            response = requests.post(f"{BASE_URL}/withdraw", headers=HEADERS,
-                                     params={"accountId": account_id, "amount": amount})
+            response = self.api.withdraw(account_id, amount)
             response.raise_for_status()
             return response.text
         except requests.exceptions.HTTPError as http_err:
@@ -168,17 +220,12 @@ class BankAPIBase(BaseClass):
             account_number (str): The account number for the payment.
 
         Returns:
-            dict: The response JSON data from the billpay operation.
+            BillPayResult: The bill payment result (also readable dict-style, e.g. result.get("payeeName")).
 
         Raises:
             HTTPError: If the billpay request fails.
             Exception: If any other unexpected error occurs.
         """
-        params = {
-            'accountId': account_id,
-            'amount': amount
-        }
-
         data = {
             "name": name,
             "address": {
@@ -192,14 +239,34 @@ class BankAPIBase(BaseClass):
         }
 
         try:
-            response = requests.post(
-                f"{BASE_URL}/billpay",
-                headers=HEADERS,
-                params=params,
-                json=data
-            )
+            response = self.api.bill_pay(account_id, amount, data)
             response.raise_for_status()
-            return response.json()
+            return self.decode(response, BillPayResult)
+        except requests.exceptions.HTTPError as http_err:
+            raise requests.exceptions.HTTPError(f"HTTP error occurred during billpay: {http_err}")
+        except Exception as e:
+            raise Exception(f"An error occurred while performing billpay: {e}")
+
+    def billpay_payload(self, account_id, amount, payload):
+        """
+        Performs billpay with a pre-serialized Payee, e.g. one drawn from a PayloadPool.
+
+        Args:
+            account_id (int): The account ID for the bill payment.
+            amount (float): The amount to pay.
+            payload (BillPayPayload | bytes): The Payee as JSON bytes, or a PayloadPool entry.
+
+        Returns:
+            BillPayResult: The bill payment result.
+
+        Raises:
+            HTTPError: If the billpay request fails.
+            Exception: If any other unexpected error occurs.
+        """
+        try:
+            response = self.api.bill_pay(account_id, amount, getattr(payload, "body", payload))
+            response.raise_for_status()
+            return self.decode(response, BillPayResult)
         except requests.exceptions.HTTPError as http_err:
             raise requests.exceptions.HTTPError(f"HTTP error occurred during billpay: {http_err}")
         except Exception as e:
@@ -213,25 +280,26 @@ class BankAPIBase(BaseClass):
             account_id (int): The ID of the account whose customer details are to be fetched.
 
         Returns:
-            dict: The customer details.
+            Customer: The customer details (also readable dict-style, e.g. customer.get("firstName")).
 
         Raises:
             HTTPError: If the request to fetch customer details fails.
             ValueError: If customer details are not found.
             Exception: If any other unexpected error occurs.
         """
+        response = None  # Stays None when the request itself is rejected (e.g. a non-numeric ID)
         try:
-            response = requests.get(f"{BASE_URL}/customers/{account_id}", headers=HEADERS)
+            response = self.api.get_customer(account_id)
             response.raise_for_status()
 
-            account_info = response.json()
-            if not account_info:
+            account_info = self.decode(response, Customer)
+            if account_info.id is None:
                 raise ValueError("Accounts not found in the response.")
             return account_info
         except requests.exceptions.HTTPError as http_err:
             raise requests.exceptions.HTTPError(f"HTTP error occurred while retrieving customer details: {http_err}")
         except ValueError as e:
-            raise ValueError(f"Failed to retrieve customer details: {e}. Response: {response.text}")
+            raise ValueError(f"Failed to retrieve customer details: {e}. {self._response_details(response)}")
         except Exception as e:
             raise Exception(f"An error occurred while fetching customer details: {e}")
 
@@ -243,25 +311,26 @@ class BankAPIBase(BaseClass):
             account_id (int): The ID of the account to fetch.
 
         Returns:
-            dict: The account details.
+            Account: The account details (also readable dict-style, e.g. account.get("balance")).
 
         Raises:
             HTTPError: If the request to fetch account details fails.
             ValueError: If account details are not found.
             Exception: If any other unexpected error occurs.
         """
+        response = None  # Stays None when the request itself is rejected (e.g. a non-numeric ID)
         try:
-            response = requests.get(f"{BASE_URL}/accounts/{account_id}", headers=HEADERS)
+            response = self.api.get_account(account_id)
             response.raise_for_status()
 
-            account_info = response.json()
-            if not account_info:
+            account_info = self.decode(response, Account)
+            if account_info.id is None:
                 raise ValueError("Accounts not found in the response.")
             return account_info
         except requests.exceptions.HTTPError as http_err:
             raise requests.exceptions.HTTPError(f"HTTP error occurred while retrieving account: {http_err}")
         except ValueError as e:
-            raise ValueError(f"Failed to retrieve account details: {e}. Response: {response.text}")
+            raise ValueError(f"Failed to retrieve account details: {e}. {self._response_details(response)}")
         except Exception as e:
             raise Exception(f"An error occurred while fetching account details: {e}")
 
@@ -283,25 +352,34 @@ class BankAPIBase(BaseClass):
             ValueError: If account details are not found.
             Exception: If any other unexpected error occurs.
         """
+        #  If the 'approved' key is not present, it returns False as a default value.
+        return self.request_loan(customer_id, amount, down_payment, source_account_id).get('approved', False)
+
+    def request_loan(self, customer_id, amount, down_payment, source_account_id):
+        """
+        Requests a loan for the customer and returns the full loan response.
+
+        Args:
+            customer_id (int): The ID of the customer requesting the loan.
+            amount (float): The loan amount requested.
+            down_payment (float): The down payment for the loan.
+            source_account_id (int): The account ID from which the loan payment is funded.
+
+        Returns:
+            LoanResponse: The loan response ("approved", "accountId" of the new loan account, "message" ...).
+
+        Raises:
+            HTTPError: If the loan request fails.
+            Exception: If any other unexpected error occurs.
+        """
 
         log = self.get_logger()
         log.info(f"Requesting a loan of {amount} for customer {customer_id}, down payment: {down_payment}")
 
         try:
-            response = requests.post(
-                f"{BASE_URL}/requestLoan",
-                headers=HEADERS,
-                params={
-                    "customerId": customer_id,
-                    "amount": amount,
-                    "downPayment": down_payment,
-                    "fromAccountId": source_account_id
-                }
-            )
+            response = self.api.request_loan(customer_id, amount, down_payment, source_account_id)
             response.raise_for_status()
-            approval_response = response.json()
-            #  If the 'approved' key is not present, it returns False as a default value.
-            return approval_response.get('approved', False)
+            return self.decode(response, LoanResponse)
         except requests.exceptions.HTTPError as http_err:
             log.error(f"HTTP error occurred while requesting loan approval: {http_err}")
             raise
@@ -316,21 +394,10 @@ class BankAPIBase(BaseClass):
                  f"funds transfer from account: {source_account}")
 
         try:
-            response = requests.post(
-                f"{BASE_URL}/customers/{self.CUSTOMER_ID[0][0]}/buyPosition",
-                headers=HEADERS,
-                params={
-                    "accountId": source_account,
-                    "name": pos_name,
-                    "symbol": pos_symbol,
-                    "shares": number_of_shares,
-                    "pricePerShare": share_price,
-                }
-            )
+            response = self.api.buy_position(self.CUSTOMER_ID[0][0], source_account, pos_name, pos_symbol,
+                                             number_of_shares, share_price)
             response.raise_for_status()
-            approval_response = response.json()
-            #  If the 'approved' key is not present, it returns False as a default value.
-            return approval_response
+            return self.decode(response, Position, many=True)
         except requests.exceptions.HTTPError as http_err:
             log.error(f"HTTP error occurred while requesting buying position: {http_err}")
             raise
@@ -338,12 +405,212 @@ class BankAPIBase(BaseClass):
             log.error(f"An error occurred while requesting to buy position: {e}")
             raise
 
+    def transfer(self, from_account_id, to_account_id, amount):
+        """
+        Transfers funds between two accounts.
+
+        Args:
+            from_account_id (int): The account to debit.
+            to_account_id (int): The account to credit.
+            amount (float): The amount to transfer.
+
+        Returns:
+            str: The response text from the transfer operation.
+
+        Raises:
+            HTTPError: If the transfer request fails.
+            Exception: If any other unexpected error occurs.
+        """
+        try:
+            response = self.api.transfer(from_account_id, to_account_id, amount)
+            response.raise_for_status()
+            return response.text
+        except requests.exceptions.HTTPError as http_err:
+            raise requests.exceptions.HTTPError(f"HTTP error occurred during transfer: {http_err}")
+        except Exception as e:
+            raise Exception(f"An error occurred while transferring between accounts: {e}")
+
+    def get_transactions(self, account_id):
+        """
+        Fetches every transaction of an account.
+
+        Args:
+            account_id (int): The ID of the account.
+
+        Returns:
+            list: Transaction models.
+
+        Raises:
+            HTTPError: If the request fails.
+            Exception: If any other unexpected error occurs.
+        """
+        try:
+            response = self.api.get_transactions(account_id)
+            response.raise_for_status()
+            return self.decode(response, Transaction, many=True)
+        except requests.exceptions.HTTPError as http_err:
+            raise requests.exceptions.HTTPError(f"HTTP error occurred while retrieving transactions: {http_err}")
+        except Exception as e:
+            raise Exception(f"An error occurred while fetching transactions: {e}")
+
+    @classmethod
+    def _as_date(cls, value):
+        """Accepts a date, a datetime or an MM-dd-yyyy string."""
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        return datetime.strptime(value, cls.TRANSACTION_DATE_FORMAT).date()
+
+    def get_transactions_by_date_range(self, account_id, from_date, to_date):
+        """
+        Fetches the transactions of an account between two dates (both inclusive).
+
+        Args:
+            account_id (int): The ID of the account.
+            from_date (date | str): First day, as a date or MM-dd-yyyy.
+            to_date (date | str): Last day, as a date or MM-dd-yyyy.
+
+        Returns:
+            list: Transaction models.
+
+        Raises:
+            HTTPError: If the request fails.
+            Exception: If any other unexpected error occurs.
+        """
+        try:
+            response = self.api.get_transactions_by_to_from_date(
+                account_id, self._as_date(from_date).strftime(self.TRANSACTION_DATE_FORMAT),
+                self._as_date(to_date).strftime(self.TRANSACTION_DATE_FORMAT)
+            )
+            response.raise_for_status()
+            return self.decode(response, Transaction, many=True)
+        except requests.exceptions.HTTPError as http_err:
+            raise requests.exceptions.HTTPError(f"HTTP error occurred while retrieving transactions: {http_err}")
+        except Exception as e:
+            raise Exception(f"An error occurred while fetching transactions by date range: {e}")
+
+    def iter_transactions(self, account_id, from_date, to_date=None, window_days=None):
+        """
+        Streams an account's transaction history window by window, oldest first.
+
+        Each window is one fromDate/toDate request, so only one window of transactions is held in memory at a time
+        and the caller can stop early without fetching the rest of the history.
+
+        Args:
+            account_id (int): The ID of the account.
+            from_date (date | str): First day of the history, as a date or MM-dd-yyyy.
+            to_date (date | str): Last day (inclusive); defaults to today.
+            window_days (int): Days per request (defaults to TRANSACTION_WINDOW_DAYS).
+
+        Yields:
+            Transaction: One transaction at a time.
+        """
+        window = timedelta(days=window_days or self.TRANSACTION_WINDOW_DAYS)
+        start = self._as_date(from_date)
+        end = self._as_date(to_date) if to_date is not None else date.today()
+        while start <= end:
+            window_end = min(start + window - timedelta(days=1), end)
+            yield from self.get_transactions_by_date_range(account_id, start, window_end)
+            start = window_end + timedelta(days=1)
+
+    def iter_accounts_transactions(self, account_ids, from_date, to_date=None, window_days=None, max_workers=None,
+                                   queue_size=None):
+        """
+        Streams the transaction histories of many accounts, fetched concurrently.
+
+        Worker threads walk the accounts' date windows and feed a bounded queue, so memory stays at queue_size
+        transactions plus one window per worker however long the histories are, and a slow consumer throttles
+        the fetching. Transactions of one account arrive in date order; accounts are interleaved.
+
+        Args:
+            account_ids (iterable): Account IDs, or rows such as ACCOUNT_ID_LIST ((id,), ...).
+            from_date (date | str): First day of the history, as a date or MM-dd-yyyy.
+            to_date (date | str): Last day (inclusive); defaults to today.
+            window_days (int): Days per request (defaults to TRANSACTION_WINDOW_DAYS).
+            max_workers (int): Accounts fetched concurrently (defaults to TRANSACTION_FETCH_WORKERS).
+            queue_size (int): Transactions buffered ahead of the consumer (defaults to TRANSACTION_QUEUE_SIZE).
+
+        Yields:
+            tuple: (account_id, Transaction).
+
+        Raises:
+            Exception: The first error of any worker; the remaining fetches are cancelled.
+        """
+        ids = [row[0] if isinstance(row, (tuple, list)) else row for row in account_ids]
+        results = queue.Queue(maxsize=queue_size or self.TRANSACTION_QUEUE_SIZE)
+        stop = threading.Event()
+        done = object()
+
+        def put(item):
+            # Blocks while the queue is full, but gives up once the consumer has gone away
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fetch(account_id):
+            try:
+                for transaction in self.iter_transactions(account_id, from_date, to_date, window_days):
+                    if not put((account_id, transaction)):
+                        return
+            except Exception as e:
+                put(e)
+            finally:
+                put(done)
+
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers or self.TRANSACTION_FETCH_WORKERS,
+                                                             len(ids) or 1)),
+                                      thread_name_prefix="transactions")
+        try:
+            for account_id in ids:
+                executor.submit(fetch, account_id)
+            remaining = len(ids)
+            while remaining:
+                item = results.get()
+                if item is done:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_positions(self, customer_id):
+        """
+        Fetches the stock positions of a customer.
+
+        Args:
+            customer_id (int): The ID of the customer.
+
+        Returns:
+            list: Position models.
+
+        Raises:
+            HTTPError: If the request fails.
+            Exception: If any other unexpected error occurs.
+        """
+        try:
+            response = self.api.get_positions(customer_id)
+            response.raise_for_status()
+            return self.decode(response, Position, many=True)
+        except requests.exceptions.HTTPError as http_err:
+            raise requests.exceptions.HTTPError(f"HTTP error occurred while retrieving positions: {http_err}")
+        except Exception as e:
+            raise Exception(f"An error occurred while fetching positions: {e}")
+
     def clean_database(self):
         """Cleans the database by sending a POST request."""
         log = self.get_logger()
         try:
-            response = requests.post(f"{BASE_URL}/cleanDB", headers=HEADERS)
+            response = self.api.clean_db()
             response.raise_for_status()
+            self.invalidate_test_data()  # Cached account/customer IDs no longer match the DB
             log.info(f"Database cleaned successfully: {response}")
             return response.text
         except requests.exceptions.HTTPError as http_err:
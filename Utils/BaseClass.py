@@ -1,9 +1,27 @@
 import os
+import sys
+import json
+import time
+import queue
+import atexit
+import threading
 import logging
-import inspect
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 import jaydebeapi
 import pytest
+from Utils.DBConnectionPool import DBConnectionPool
+
+
+class _LazyTestData:
+    """Class attribute that triggers the shared test-data bootstrap on first access."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if BaseClass._defer_test_data:
+            return self  # Introspection such as pytest collection must not trigger the DB bootstrap
+        return BaseClass.shared_test_data()[self.name]
 
 
 @pytest.mark.usefixtures('setup_browser')
@@ -11,30 +29,76 @@ class BaseClass:
     """Base class for web and database-related utilities in the test framework."""
 
     # --- Logger Setup ---
+    LOG_FILE = os.path.join('Logs', 'logfile.log')
+    LOG_MAX_BYTES = 10 * 1024 * 1024
+    LOG_BACKUP_COUNT = 5
+    LOG_FORMAT = '%(asctime)s :%(levelname)s : %(name)s : %(message)s'
+    LOG_ASYNC_ENV = "PARABANK_ASYNC_LOGGING"  # Set to "1" to write log records from a background thread
+
+    _loggers = {}
+    _log_handler = None
+    _log_listener = None
+    _log_lock = threading.Lock()
+
     @staticmethod
     def get_logger() -> logging.Logger:
-        """Sets up and returns a logger instance for the test framework."""
-        # Use the calling function's name as the logger's name
-        logger_name = inspect.stack()[1][3]
-        logger = logging.getLogger(logger_name)
-
-        # Clear existing handlers to avoid duplicate logs
-        if logger.hasHandlers():
-            logger.handlers.clear()
-
-        # Create 'Logs' directory if it doesn't exist
-        os.makedirs('Logs', exist_ok=True)
-
-        # Set up rotating file handler for log rotation
-        file_handler = RotatingFileHandler(
-            'Logs/logfile.log', maxBytes=10 * 1024 * 1024, backupCount=5
-        )
-        formatter = logging.Formatter('%(asctime)s :%(levelname)s : %(name)s : %(message)s')
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-        logger.setLevel(logging.DEBUG)
+        """
+        Returns the logger named after the calling function.
+
+        Loggers are created once per caller and cached; they all share a single rotating file handler, so
+        repeated calls are a dictionary lookup and never open additional files.
+        """
+        # Use the calling function's name as the logger's name (cheap frame lookup, no source reading)
+        logger_name = sys._getframe(1).f_code.co_name
+        logger = BaseClass._loggers.get(logger_name)
+        if logger is None:
+            logger = BaseClass._create_logger(logger_name)
         return logger
 
+    @classmethod
+    def _create_logger(cls, logger_name):
+        with BaseClass._log_lock:
+            logger = BaseClass._loggers.get(logger_name)
+            if logger is None:
+                logger = logging.getLogger(logger_name)
+
+                # Clear existing handlers to avoid duplicate logs
+                if logger.hasHandlers():
+                    logger.handlers.clear()
+
+                logger.addHandler(cls._shared_log_handler())
+                logger.setLevel(logging.DEBUG)
+                BaseClass._loggers[logger_name] = logger
+        return logger
+
+    @classmethod
+    def _shared_log_handler(cls):
+        """
+        Creates the handler shared by every framework logger (called once, under _log_lock).
+
+        By default this is the rotating file handler itself. With PARABANK_ASYNC_LOGGING=1 loggers get a
+        QueueHandler instead and a QueueListener thread does the formatting and file I/O off the caller's thread.
+        """
+        if BaseClass._log_handler is None:
+            # Create 'Logs' directory if it doesn't exist
+            os.makedirs(os.path.dirname(cls.LOG_FILE), exist_ok=True)
+
+            # Set up rotating file handler for log rotation
+            file_handler = RotatingFileHandler(
+                cls.LOG_FILE, maxBytes=cls.LOG_MAX_BYTES, backupCount=cls.LOG_BACKUP_COUNT
+            )
+            file_handler.setFormatter(logging.Formatter(cls.LOG_FORMAT))
+
+            if os.environ.get(cls.LOG_ASYNC_ENV) == "1":
+                log_queue = queue.SimpleQueue()
+                BaseClass._log_listener = QueueListener(log_queue, file_handler)
+                BaseClass._log_listener.start()
+                atexit.register(BaseClass._log_listener.stop)  # Flushes queued records on exit
+                BaseClass._log_handler = QueueHandler(log_queue)
+            else:
+                BaseClass._log_handler = file_handler
+        return BaseClass._log_handler
+
     # --- Database Utilities ---
     HOST = "localhost"
     PORT = 9001
@@ -45,17 +109,51 @@ class BaseClass:
     USERNAME = "SA"  # Default user for HSQLDB
     PASSWORD = ""  # Default password for HSQLDB (empty by default)
 
-    ACCOUNT_ID_LIST = []
-    BASE_ACCOUNT_ID = None
-    CUSTOMER_ID = None
+    # --- Shared Test Data (loaded lazily on first access) ---
+    ACCOUNT_ID_LIST = _LazyTestData()
+    BASE_ACCOUNT_ID = _LazyTestData()
+    CUSTOMER_ID = _LazyTestData()
+
+    MIN_TEST_ACCOUNT_ID = 13400  # Accounts above this ID are used as test data
+    TEST_DATA_CACHE_FILE = os.path.join('TEMP', 'test_data_cache.json')
+    TEST_DATA_GENERATION_FILE = os.path.join('TEMP', 'test_data_generation')  # Rewritten on every DB reset
+    TEST_DATA_CACHE_ENV = "PARABANK_TEST_DATA_CACHE"  # Set to "0" to disable the cache file
+    TEST_DATA_ENV = "PARABANK_TEST_DATA"  # JSON test data handed to child processes (e.g. Locust workers)
+
+    _test_data = None
+    _test_data_lock = threading.Lock()
+    _defer_test_data = False  # Set by conftest while pytest collects test classes
+
+    DB_POOL_MAX_SIZE = 4  # Maximum warm JDBC connections kept per process
+    DB_POOL_IDLE_TIMEOUT = 300  # Seconds before an unused JDBC connection is closed
+
+    _db_pool = None
 
     @classmethod
-    def execute_db_query(cls, query):
+    def db_pool(cls) -> DBConnectionPool:
+        """Returns the process-wide JDBC connection pool, creating it on first use."""
+        if BaseClass._db_pool is None:
+            BaseClass._db_pool = DBConnectionPool(
+                cls.JDBC_DRIVER, cls.JDBC_URL,
+                [cls.USERNAME, cls.PASSWORD],
+                cls.JDBC_DRIVER_PATH,
+                max_size=cls.DB_POOL_MAX_SIZE,
+                idle_timeout=cls.DB_POOL_IDLE_TIMEOUT
+            )
+            atexit.register(BaseClass._db_pool.close_all)
+        return BaseClass._db_pool
+
+    DB_STREAM_BATCH_SIZE = 500  # Rows fetched per round trip when streaming query results
+    DB_IN_CHUNK_SIZE = 256  # Maximum number of bind values per IN (...) lookup
+
+    @classmethod
+    def execute_db_query(cls, query, params=None):
         """
         Executes a SQL query on the database and retrieves the results.
 
         Args:
-            query (str): The SQL query to execute.
+            query (str): The SQL query to execute, using `?` placeholders for bind parameters.
+            params (tuple | list): Optional bind parameters for the `?` placeholders.
 
         Returns:
             list: A list of results retrieved from the database based on the query.
@@ -67,25 +165,21 @@ class BaseClass:
         Notes:
             This method is intended to run any SQL query and is not limited to specific data retrievals.
             Ensure the query is valid for the database schema to avoid errors.
+            Connections are borrowed from the pooled `db_pool()` and stay warm between queries, and the
+            prepared statement is cached per connection, so prefer bind parameters over f-string SQL.
         """
-        conn = None
-        cursor = None
         log = cls.get_logger()
+        pool = cls.db_pool()
 
         try:
-            # Establish the database connection
-            conn = jaydebeapi.connect(
-                cls.JDBC_DRIVER, cls.JDBC_URL,
-                [cls.USERNAME, cls.PASSWORD],
-                cls.JDBC_DRIVER_PATH
-            )
-            cursor = conn.cursor()
-
-            # Execute the query and fetch all results
-            cursor.execute(query)
-            query_response = cursor.fetchall()
+            with pool.cursor() as cursor:
+                # Execute the query and fetch all results
+                start = time.perf_counter()
+                cursor.execute(query, params)
+                query_response = cursor.fetchall() if cursor.description else []
+                pool.record_execute(time.perf_counter() - start)
 
-            log.info(f"DB query {query} results: {query_response}")
+            log.info(f"DB query {query} params {params} results: {query_response}")
             return query_response
 
         except jaydebeapi.DatabaseError as e:
@@ -96,36 +190,286 @@ class BaseClass:
             log.error(f"Unexpected error during query execution: {query}. Error: {e}")
             raise  # Re-raise the error after logging
 
-        finally:
-            # Ensure resources are closed to avoid memory leaks
-            if cursor is not None:
-                cursor.close()
-            if conn is not None:
-                conn.close()
+    @classmethod
+    def execute_db_many(cls, query, seq_of_params):
+        """
+        Executes one statement for many parameter sets as a single JDBC batch.
+
+        Args:
+            query (str): The SQL statement with `?` placeholders (e.g. an UPDATE or INSERT).
+            seq_of_params (iterable): One tuple of bind parameters per execution.
+
+        Returns:
+            int: Total number of rows affected.
+
+        Raises:
+            jaydebeapi.DatabaseError: If a database error occurs during the batch.
+            Exception: If an unexpected error occurs during the batch.
+        """
+        log = cls.get_logger()
+        pool = cls.db_pool()
+
+        try:
+            with pool.cursor() as cursor:
+                start = time.perf_counter()
+                cursor.executemany(query, seq_of_params)
+                pool.record_execute(time.perf_counter() - start)
+                rowcount = cursor.rowcount
+
+            log.info(f"DB batch {query} affected {rowcount} rows")
+            return rowcount
+
+        except jaydebeapi.DatabaseError as e:
+            log.error(f"Database error during batch execution: {query}. Error: {e}")
+            raise  # Re-raise the error after logging
+
+        except Exception as e:
+            log.error(f"Unexpected error during batch execution: {query}. Error: {e}")
+            raise  # Re-raise the error after logging
+
+    @classmethod
+    def execute_db_query_in(cls, query, values, params=(), chunk_size=None):
+        """
+        Runs a bulk `IN (...)` lookup, binding the values instead of formatting them into the SQL.
+
+        Values are sent in chunks of at most `chunk_size`; each chunk is padded to a power-of-two length by
+        repeating its last value, so only a handful of distinct statements are ever prepared and cached.
+
+        Args:
+            query (str): SQL containing a `{placeholders}` marker inside the IN clause, e.g.
+                "SELECT ID, BALANCE FROM PUBLIC.ACCOUNT WHERE ID IN ({placeholders})".
+            values (iterable): Values for the IN clause.
+            params (tuple): Bind parameters for any `?` placed before the IN clause.
+            chunk_size (int): Maximum values per round trip (defaults to DB_IN_CHUNK_SIZE).
+
+        Returns:
+            list: The concatenated result rows of every chunk.
+        """
+        chunk_size = chunk_size or cls.DB_IN_CHUNK_SIZE
+        values = list(values)
+        pool = cls.db_pool()
+        rows = []
+
+        with pool.cursor() as cursor:
+            for offset in range(0, len(values), chunk_size):
+                chunk = values[offset:offset + chunk_size]
+                padded_size = min(chunk_size, 1 << (len(chunk) - 1).bit_length())
+                chunk += [chunk[-1]] * (padded_size - len(chunk))
+
+                start = time.perf_counter()
+                cursor.execute(query.format(placeholders=", ".join("?" * padded_size)), tuple(params) + tuple(chunk))
+                rows.extend(cursor.fetchall())
+                pool.record_execute(time.perf_counter() - start)
+
+        cls.get_logger().info(f"DB bulk lookup {query} for {len(values)} values returned {len(rows)} rows")
+        return rows
+
+    @classmethod
+    def iter_db_query(cls, query, params=None, batch_size=None):
+        """
+        Streams the results of a query instead of materializing them with fetchall().
+
+        The pooled connection is held until the generator is exhausted or closed, so consume it promptly.
+
+        Args:
+            query (str): The SQL query to execute, using `?` placeholders for bind parameters.
+            params (tuple | list): Optional bind parameters.
+            batch_size (int): Rows fetched per round trip (defaults to DB_STREAM_BATCH_SIZE).
+
+        Yields:
+            tuple: One result row at a time.
+        """
+        batch_size = batch_size or cls.DB_STREAM_BATCH_SIZE
+        with cls.db_pool().cursor(fetch_size=batch_size) as cursor:
+            cursor.execute(query, params)
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    break
+                yield from batch
+
+    @classmethod
+    def fetch_account_balances(cls, account_ids):
+        """
+        Fetches the DB balance of many accounts in one bulk lookup.
+
+        Args:
+            account_ids (iterable): Account IDs, or rows such as ACCOUNT_ID_LIST ((id,), ...).
+
+        Returns:
+            dict: Mapping of account ID to balance.
+        """
+        ids = [row[0] if isinstance(row, (tuple, list)) else row for row in account_ids]
+        rows = cls.execute_db_query_in("SELECT ID, BALANCE FROM PUBLIC.ACCOUNT WHERE ID IN ({placeholders})", ids)
+        return {account_id: balance for account_id, balance in rows}
+
+    @classmethod
+    def shared_test_data(cls):
+        """
+        Returns the shared test data, bootstrapping it on first use.
+
+        Returns:
+            dict: "ACCOUNT_ID_LIST", "BASE_ACCOUNT_ID" and "CUSTOMER_ID" in the shapes the DB queries return.
+        """
+        if BaseClass._test_data is None:
+            with BaseClass._test_data_lock:
+                if BaseClass._test_data is None:
+                    BaseClass._test_data = cls._test_data_from_env() or cls.initialize_account_and_customer_ids()
+        return BaseClass._test_data
+
+    @classmethod
+    def _test_data_from_env(cls):
+        """Returns the test data a parent process passed in PARABANK_TEST_DATA, or None if it is not set."""
+        encoded = os.environ.get(cls.TEST_DATA_ENV)
+        if not encoded:
+            return None
+        data = json.loads(encoded)
+        return {
+            "ACCOUNT_ID_LIST": [tuple(row) for row in data["ACCOUNT_ID_LIST"]],
+            "BASE_ACCOUNT_ID": data["BASE_ACCOUNT_ID"],
+            "CUSTOMER_ID": [tuple(row) for row in data["CUSTOMER_ID"]]
+        }
+
+    @classmethod
+    def shared_test_data_env(cls, account_id_list=None):
+        """
+        Encodes the test data for PARABANK_TEST_DATA, so a child process starts without querying the DB.
+
+        Args:
+            account_id_list (list): Optional subset of ACCOUNT_ID_LIST rows to hand over (e.g. one worker's
+                partition); the base account becomes its first account.
+
+        Returns:
+            str: JSON for the child's environment.
+        """
+        data = cls.shared_test_data()
+        if account_id_list is not None:
+            data = dict(data, ACCOUNT_ID_LIST=account_id_list, BASE_ACCOUNT_ID=account_id_list[0][0])
+        return json.dumps(data)
+
+    @classmethod
+    def bind_test_data(cls, account_id_list, customer_id, base_account_id=None):
+        """
+        Overrides the shared test data for this process (e.g. with data handed over by a parent process).
+
+        Args:
+            account_id_list (list): Rows of account IDs, e.g. [(13455,), (13566,)].
+            customer_id (list): Rows holding the customer ID, e.g. [(12212,)].
+            base_account_id (int): Base account; defaults to the first account in the list.
+        """
+        account_id_list = [tuple(row) for row in account_id_list]
+        BaseClass._test_data = {
+            "ACCOUNT_ID_LIST": account_id_list,
+            "BASE_ACCOUNT_ID": base_account_id if base_account_id is not None else account_id_list[0][0],
+            "CUSTOMER_ID": [tuple(row) for row in customer_id]
+        }
+
+    @classmethod
+    def invalidate_test_data(cls):
+        """
+        Forgets the loaded test data and starts a new reset generation (call after the DB is reset).
+
+        Bumping the generation stamp also invalidates a cache file another process is still writing from
+        data it queried before the reset.
+        """
+        BaseClass._test_data = None
+        try:
+            os.remove(cls.TEST_DATA_CACHE_FILE)
+        except FileNotFoundError:
+            pass
+        os.makedirs(os.path.dirname(cls.TEST_DATA_GENERATION_FILE), exist_ok=True)
+        tmp_path = f"{cls.TEST_DATA_GENERATION_FILE}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as generation_file:
+            generation_file.write(f"{time.time_ns()}-{os.getpid()}")
+        os.replace(tmp_path, cls.TEST_DATA_GENERATION_FILE)
+
+    @classmethod
+    def _test_data_generation(cls):
+        """The current reset generation stamp, or None if the DB was never reset through this framework."""
+        try:
+            with open(cls.TEST_DATA_GENERATION_FILE) as generation_file:
+                return generation_file.read().strip() or None
+        except OSError:
+            return None
+
+    @classmethod
+    def _load_test_data_cache(cls):
+        """
+        Returns the cached test data if it was built in the current reset generation, else None.
+
+        Only the local stamp file is compared, so a cache hit needs no DB connection; a reset by another
+        process (cleanDB, a snapshot restore) still invalidates the cache through invalidate_test_data().
+        """
+        if os.environ.get(cls.TEST_DATA_CACHE_ENV) == "0":
+            return None
+        try:
+            with open(cls.TEST_DATA_CACHE_FILE) as cache_file:
+                cached = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+        if cached.get("generation") != cls._test_data_generation():
+            return None
+
+        data = cached["data"]
+        return {
+            "ACCOUNT_ID_LIST": [tuple(row) for row in data["ACCOUNT_ID_LIST"]],
+            "BASE_ACCOUNT_ID": data["BASE_ACCOUNT_ID"],
+            "CUSTOMER_ID": [tuple(row) for row in data["CUSTOMER_ID"]]
+        }
+
+    @classmethod
+    def _save_test_data_cache(cls, data, generation):
+        """Atomically writes the cache file so parallel workers never read a partial file."""
+        if os.environ.get(cls.TEST_DATA_CACHE_ENV) == "0":
+            return
+        os.makedirs(os.path.dirname(cls.TEST_DATA_CACHE_FILE), exist_ok=True)
+        tmp_path = f"{cls.TEST_DATA_CACHE_FILE}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as cache_file:
+            json.dump({"created": time.time(), "generation": generation, "data": data}, cache_file)
+        os.replace(tmp_path, cls.TEST_DATA_CACHE_FILE)
 
     @classmethod
     def initialize_account_and_customer_ids(cls):
-        """Initializes class attributes ACCOUNT_ID_LIST, BASE_ACCOUNT_ID, and CUSTOMER_ID."""
+        """
+        Loads ACCOUNT_ID_LIST, BASE_ACCOUNT_ID, and CUSTOMER_ID.
+
+        A cache file built in the current reset generation is used without connecting to the DB; otherwise the
+        DB is queried and the cache rewritten.
+
+        Returns:
+            dict: The test data; empty values if the DB could not be reached.
+        """
         log = cls.get_logger()  # Obtain a logger instance
 
         try:
-            # Query to retrieve all account IDs greater than 13400
-            account_id_query = "SELECT ID FROM PUBLIC.ACCOUNT WHERE ID > 13400"
-            cls.ACCOUNT_ID_LIST = cls.execute_db_query(account_id_query)
-            cls.BASE_ACCOUNT_ID = cls.ACCOUNT_ID_LIST[0][0]
+            generation = cls._test_data_generation()  # Read before querying, so a concurrent reset wins
+            cached = cls._load_test_data_cache()
+            if cached is not None:
+                log.info("Account and customer IDs loaded from the test data cache.")
+                return cached
+
+            # Query to retrieve all account IDs greater than MIN_TEST_ACCOUNT_ID
+            account_id_query = "SELECT ID FROM PUBLIC.ACCOUNT WHERE ID > ?"
+            account_id_list = cls.execute_db_query(account_id_query, (cls.MIN_TEST_ACCOUNT_ID,))
+            base_account_id = account_id_list[0][0]
 
             # Query to retrieve customer ID associated with BASE_ACCOUNT_ID
-            customer_id_query = f"SELECT CUSTOMER_ID FROM PUBLIC.ACCOUNT WHERE ID = {cls.BASE_ACCOUNT_ID}"
-            cls.CUSTOMER_ID = cls.execute_db_query(customer_id_query)
-            log.info("Account and customer IDs initialized successfully.")
+            customer_id_query = "SELECT CUSTOMER_ID FROM PUBLIC.ACCOUNT WHERE ID = ?"
+            customer_id = cls.execute_db_query(customer_id_query, (base_account_id,))
+
+            data = {
+                "ACCOUNT_ID_LIST": account_id_list,
+                "BASE_ACCOUNT_ID": base_account_id,
+                "CUSTOMER_ID": customer_id
+            }
+            cls._save_test_data_cache(data, generation)
+            log.info(f"Account and customer IDs initialized successfully. Accounts: {account_id_list}")
+            return data
         except Exception as e:
             # Log the exception but don't raise it, to prevent test failures
             log.warning(
                 f"Failed to initialize account and customer IDs. "
                 f"Proceeding without these values. Error: {e}"
             )
-
-
-# Initialize the account and customer IDs at class level
-BaseClass.initialize_account_and_customer_ids()
-print(f"**** This is the account ID full list :{BaseClass.ACCOUNT_ID_LIST}****")
+            return {"ACCOUNT_ID_LIST": [], "BASE_ACCOUNT_ID": None, "CUSTOMER_ID": None}
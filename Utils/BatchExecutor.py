@@ -0,0 +1,210 @@
+import queue
+import time
+import threading
+from collections import namedtuple
+from Utils.BankAPIBase import BankAPIBase
+
+BatchOp = namedtuple("BatchOp", ["kind", "account_id", "amount", "to_account_id"], defaults=(None,))
+BatchOp.__doc__ = ("One money movement: kind is 'deposit', 'withdraw' or 'transfer' (from account_id to "
+                   "to_account_id).")
+
+BatchResult = namedtuple("BatchResult", ["index", "op", "ok", "response", "error", "latency_ms"])
+BatchResult.__doc__ = ("Outcome of the index-th operation of a batch: the response text on success, the exception on "
+                       "failure, and the request latency.")
+
+
+class TokenBucket:
+    """Thread-safe token bucket: refills `rate` tokens per second up to `burst`, acquire() waits for a token."""
+
+    def __init__(self, rate, burst=None):
+        """
+        Args:
+            rate (float): Tokens (requests) per second.
+            burst (int): Bucket size, i.e. how many requests may start back to back (defaults to one second's worth,
+                at least 1).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst or max(1.0, self.rate))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Takes one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class BatchExecutor:
+    """
+    Executes many deposits, withdrawals and transfers concurrently through BankAPIBase.
+
+    Operations are spread over `workers` lanes by account: every operation of an account (the source account of a
+    transfer) goes to the same lane and lanes run their operations one at a time in input order. A transfer also
+    waits for the earlier operations on its destination account, and later operations on that account wait for
+    it, so no operation overtakes an earlier one on any account it touches (a withdrawal never overtakes the
+    transfer funding it) while different accounts proceed in parallel. Account IDs are compared as integers, so
+    "12345" and 12345 are the same account. Lane queues are bounded, so a generator of operations is consumed only
+    as fast as it is executed. An optional token bucket caps the request rate across all lanes. Results are
+    streamed in completion order as BatchResult tuples; stats holds the counters of the latest run().
+    """
+
+    KINDS = ("deposit", "withdraw", "transfer")
+    WORKERS = 16  # Lanes executing operations concurrently
+    LANE_QUEUE_SIZE = 100  # Operations buffered per lane ahead of its worker
+
+    def __init__(self, api=None, workers=None, rate=None, burst=None):
+        """
+        Args:
+            api (BankAPIBase): The API helper the operations are sent through; a new one by default.
+            workers (int): Number of lanes (concurrent requests).
+            rate (float): Requests per second across all lanes (None = unlimited).
+            burst (int): Token bucket size for the rate limit.
+        """
+        self.api = api or BankAPIBase()
+        self.workers = workers or self.WORKERS
+        self.limiter = TokenBucket(rate, burst) if rate else None
+        self.stats = self._new_stats()
+
+    @staticmethod
+    def _new_stats():
+        return {"submitted": 0, "succeeded": 0, "failed": 0, "elapsed_s": 0.0}
+
+    def _call(self, op):
+        if op.kind == "deposit":
+            return self.api.deposit_to_account(op.account_id, op.amount)
+        if op.kind == "withdraw":
+            return self.api.withdraw_from_account(op.account_id, op.amount)
+        return self.api.transfer(op.account_id, op.to_account_id, op.amount)
+
+    def _validate(self, op):
+        if not isinstance(op, BatchOp):
+            op = BatchOp(*op)
+        if op.kind not in self.KINDS:
+            raise ValueError(f"Unknown operation kind '{op.kind}', expected one of {self.KINDS}")
+        if op.kind == "transfer" and op.to_account_id is None:
+            raise ValueError("A transfer needs to_account_id")
+        try:
+            return op._replace(account_id=int(op.account_id),
+                               to_account_id=None if op.to_account_id is None else int(op.to_account_id))
+        except (TypeError, ValueError):
+            raise ValueError(f"Account IDs must be integers: {op}")
+
+    @staticmethod
+    def _accounts(op):
+        """Accounts an operation changes, source first."""
+        if op.kind == "transfer" and op.to_account_id != op.account_id:
+            return op.account_id, op.to_account_id
+        return op.account_id,
+
+    def run(self, operations):
+        """
+        Executes the operations and yields their results as they complete.
+
+        Args:
+            operations (iterable): BatchOp tuples (or plain (kind, account_id, amount[, to_account_id]) tuples);
+                a generator is consumed lazily.
+
+        Yields:
+            BatchResult: One per operation, in completion order (index is the input position).
+
+        Raises:
+            ValueError: If an operation is malformed; operations still queued at that point are skipped.
+        """
+        log = self.api.get_logger()
+        lanes = [queue.Queue(maxsize=self.LANE_QUEUE_SIZE) for _ in range(self.workers)]
+        results = queue.Queue()
+        stop = threading.Event()
+        end = object()
+        stats = self.stats = self._new_stats()  # This run's counters, updated by the feeder and the consumer
+        stats_lock = threading.Lock()
+
+        def count(name):
+            with stats_lock:
+                stats[name] += 1
+
+        def work(lane):
+            while True:
+                item = lane.get()
+                if item is end:
+                    results.put(end)
+                    return
+                index, op, after, done = item
+                try:
+                    # Earlier operations on the other account of a transfer run on other lanes
+                    for previous in after:
+                        previous.wait()
+                    if stop.is_set():
+                        continue  # The consumer went away; drain without executing
+                    if self.limiter is not None:
+                        self.limiter.acquire()
+                    start = time.perf_counter()
+                    try:
+                        response = self._call(op)
+                        results.put(BatchResult(index, op, True, response, None, (time.perf_counter() - start) * 1000))
+                    except Exception as e:
+                        results.put(BatchResult(index, op, False, None, e, (time.perf_counter() - start) * 1000))
+                finally:
+                    done.set()
+
+        def feed():
+            last = {}  # account_id -> Event set once the latest operation on the account has finished
+            try:
+                for index, op in enumerate(operations):
+                    if stop.is_set():
+                        break
+                    op = self._validate(op)
+                    accounts = self._accounts(op)
+                    after = [last[account_id] for account_id in accounts if account_id in last]
+                    done = threading.Event()
+                    for account_id in accounts:
+                        last[account_id] = done
+                    lanes[hash(op.account_id) % self.workers].put((index, op, after, done))
+                    count("submitted")
+            except Exception as e:
+                results.put(e)
+            finally:
+                for lane in lanes:
+                    lane.put(end)
+
+        threads = [threading.Thread(target=work, args=(lane,), name=f"batch-lane-{number}", daemon=True)
+                   for number, lane in enumerate(lanes)]
+        threads.append(threading.Thread(target=feed, name="batch-feeder", daemon=True))
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        try:
+            running = self.workers
+            while running:
+                item = results.get()
+                if item is end:
+                    running -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    count("succeeded" if item.ok else "failed")
+                    yield item
+        finally:
+            stop.set()
+            with stats_lock:
+                stats["elapsed_s"] = time.perf_counter() - started
+                log.info(f"Batch finished: {stats}")
+
+    def execute(self, operations):
+        """
+        Executes the operations and returns every result, ordered by input position.
+
+        Returns:
+            list: BatchResult tuples.
+        """
+        return sorted(self.run(operations), key=lambda result: result.index)
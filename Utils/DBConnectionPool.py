@@ -0,0 +1,378 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+import jaydebeapi
+
+# Private jaydebeapi members CachingCursor relies on (JayDeBeApi is pinned to the version they were checked
+# against in requirements.txt); Tests/Integration/test_Integ_DB_pool.py fails if any of them disappears
+JAYDEBEAPI_INTERNALS = {
+    "jaydebeapi": ("_handle_sql_exception",),
+    "Cursor": ("_close_last", "_set_stmt_parms", "_rs", "_prep", "_meta", "_description"),
+    "Connection": ("_closed", "_converters")  # Instance attributes, checked on a live connection
+}
+
+
+def missing_jaydebeapi_internals(connection=None):
+    """
+    Lists the JAYDEBEAPI_INTERNALS the installed jaydebeapi no longer provides.
+
+    Args:
+        connection (jaydebeapi.Connection): Live connection to check the instance attributes on; they are
+            skipped without one.
+
+    Returns:
+        list: Missing names such as "Cursor._set_stmt_parms".
+    """
+    targets = {"jaydebeapi": jaydebeapi, "Cursor": jaydebeapi.Cursor, "Connection": connection}
+    return [f"{owner}.{name}" for owner, names in JAYDEBEAPI_INTERNALS.items() if targets[owner] is not None
+            for name in names if not hasattr(targets[owner], name)]
+
+
+class _PooledConnection:
+    """A JDBC connection plus the bookkeeping the pool needs to reuse it."""
+
+    __slots__ = ("conn", "created_at", "last_used", "uses", "statements", "generation")
+
+    def __init__(self, conn, generation):
+        self.conn = conn
+        self.generation = generation  # Pool generation it was opened in; close_all() retires older ones
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.uses = 0
+        self.statements = OrderedDict()  # SQL text -> cached java.sql.PreparedStatement (LRU order)
+
+
+class CachingCursor(jaydebeapi.Cursor):
+    """
+    jaydebeapi cursor that reuses the PreparedStatements cached on its pooled connection.
+
+    The stock cursor prepares (and the server re-parses) the statement on every execute() and closes it right
+    after; this one keeps up to STATEMENT_CACHE_SIZE statements per connection and only rebinds parameters.
+    """
+
+    def __init__(self, pool, pooled):
+        super().__init__(pooled.conn, pooled.conn._converters)
+        self._pool = pool
+        self._statements = pooled.statements
+        self.fetch_size = None  # JDBC fetch size hint applied before each execute
+
+    def _prepare(self, operation):
+        prep = self._statements.get(operation)
+        if prep is not None:
+            self._statements.move_to_end(operation)
+            prep.clearParameters()
+            self._pool.count("statement_cache_hits")
+            return prep
+
+        prep = self._connection.jconn.prepareStatement(operation)
+        self._statements[operation] = prep
+        self._pool.count("statement_cache_misses")
+        if len(self._statements) > self._pool.statement_cache_size:
+            _, evicted = self._statements.popitem(last=False)
+            evicted.close()
+        return prep
+
+    def _close_last(self):
+        # Close the result set only; the statement stays open in the connection's cache
+        if self._rs:
+            self._rs.close()
+        self._rs = None
+        self._prep = None
+        self._meta = None
+        self._description = None
+
+    def execute(self, operation, parameters=None):
+        if self._connection._closed:
+            raise jaydebeapi.Error()
+        self._close_last()
+        self._prep = self._prepare(operation)
+        # Set on every execute: the statement is cached, so a streaming cursor's hint would stick to later queries
+        self._prep.setFetchSize(self.fetch_size or 0)
+        self._set_stmt_parms(self._prep, parameters or ())
+        try:
+            is_rs = self._prep.execute()
+        except Exception:
+            jaydebeapi._handle_sql_exception()
+        if is_rs:
+            self._rs = self._prep.getResultSet()
+            self._meta = self._rs.getMetaData()
+            self.rowcount = -1
+        else:
+            self.rowcount = self._prep.getUpdateCount()
+
+    def executemany(self, operation, seq_of_parameters):
+        if self._connection._closed:
+            raise jaydebeapi.Error()
+        self._close_last()
+        self._prep = self._prepare(operation)
+        for parameters in seq_of_parameters:
+            self._set_stmt_parms(self._prep, parameters)
+            self._prep.addBatch()
+        try:
+            update_counts = self._prep.executeBatch()
+        except Exception:
+            jaydebeapi._handle_sql_exception()
+        self.rowcount = sum(update_counts)
+        self._close_last()
+
+
+class DBConnectionPool:
+    """
+    Process-wide pool of warm JDBC connections.
+
+    Connections are opened lazily up to MAX_SIZE, validated before reuse when they have been idle for a while,
+    closed once idle for longer than IDLE_TIMEOUT, and handed back to the thread that used them last whenever
+    possible (per-worker affinity). A pool is bound to the process that created it. pytest-xdist and Locust
+    workers are separate interpreters that start their own JVM and pool; a child forked from a process whose JVM
+    is already running cannot use JDBC at all (JPype does not survive a fork).
+    """
+
+    MAX_SIZE = 4  # Maximum open connections per process
+    IDLE_TIMEOUT = 300  # Seconds an unused connection is kept before it is closed
+    VALIDATE_AFTER = 30  # Seconds idle after which a connection is health-checked before reuse
+    VALIDATION_TIMEOUT = 2  # Seconds allowed for the JDBC isValid() health check
+    ACQUIRE_TIMEOUT = 30  # Seconds to wait for a free connection when the pool is exhausted
+    STATEMENT_CACHE_SIZE = 32  # Prepared statements kept open per connection
+
+    def __init__(self, driver, url, credentials, jar_path, max_size=None, idle_timeout=None,
+                 statement_cache_size=None):
+        """
+        Args:
+            driver (str): JDBC driver class name.
+            url (str): JDBC connection URL.
+            credentials (list): [username, password].
+            jar_path (str): Path to the JDBC driver jar.
+            max_size (int): Maximum number of open connections.
+            idle_timeout (float): Seconds after which an idle connection is closed.
+            statement_cache_size (int): Prepared statements cached per connection.
+        """
+        self.driver = driver
+        self.url = url
+        self.credentials = credentials
+        self.jar_path = jar_path
+        self.max_size = max_size or self.MAX_SIZE
+        self.idle_timeout = self.IDLE_TIMEOUT if idle_timeout is None else idle_timeout
+        self.statement_cache_size = statement_cache_size or self.STATEMENT_CACHE_SIZE
+
+        self._cond = threading.Condition()
+        self._idle = []
+        self._open = 0
+        self._pid = os.getpid()
+        self._generation = 0
+        self._affinity = threading.local()
+        self._metrics = {
+            "connects": 0, "connect_time": 0.0,
+            "executes": 0, "execute_time": 0.0,
+            "acquires": 0, "reuses": 0, "affinity_hits": 0, "waits": 0,
+            "health_checks": 0, "health_check_failures": 0, "evictions": 0,
+            "statement_cache_hits": 0, "statement_cache_misses": 0
+        }
+
+    # --- Acquire / Release ---
+    @contextmanager
+    def connection(self):
+        """
+        Borrows a connection for the duration of a `with` block.
+
+        Yields:
+            jaydebeapi.Connection: A live connection. It is returned to the pool on exit, or discarded if a
+            database error escaped the block and the connection no longer validates.
+        """
+        pooled = self._acquire()
+        broken = False
+        try:
+            yield pooled.conn
+        except jaydebeapi.DatabaseError:
+            broken = not self._validate(pooled)
+            raise
+        finally:
+            self._release(pooled, broken)
+
+    @contextmanager
+    def cursor(self, fetch_size=None):
+        """
+        Borrows a connection and opens a statement-caching cursor on it for the duration of a `with` block.
+
+        Args:
+            fetch_size (int): Optional JDBC fetch size hint for streaming large result sets.
+
+        Yields:
+            CachingCursor: A DB-API cursor whose prepared statements are reused across calls.
+        """
+        pooled = self._acquire()
+        cursor = CachingCursor(self, pooled)
+        cursor.fetch_size = fetch_size
+        broken = False
+        try:
+            yield cursor
+        except jaydebeapi.DatabaseError:
+            broken = not self._validate(pooled)
+            raise
+        finally:
+            cursor.close()
+            self._release(pooled, broken)
+
+    def _acquire(self):
+        self._check_pid()
+        deadline = time.monotonic() + self.ACQUIRE_TIMEOUT
+        with self._cond:
+            self._metrics["acquires"] += 1
+        while True:
+            with self._cond:
+                pooled = self._take_idle_or_slot(deadline)
+            if pooled is None:
+                break
+            # Validate outside the lock: isValid() is a server round trip that would stall every other acquire
+            if self._is_healthy(pooled):
+                with self._cond:
+                    self._metrics["reuses"] += 1
+                return pooled
+            with self._cond:
+                self._close(pooled)
+                self._cond.notify()
+
+        # Connect outside the lock so other threads can keep reusing idle connections meanwhile
+        try:
+            return self._connect()
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, pooled, broken=False):
+        with self._cond:
+            if broken or pooled.generation != self._generation:
+                self._close(pooled)
+            else:
+                pooled.last_used = time.monotonic()
+                pooled.uses += 1
+                self._idle.append(pooled)
+                self._affinity.pooled = pooled
+            self._cond.notify()
+
+    def _take_idle_or_slot(self, deadline):
+        """
+        Takes an idle connection, or reserves a slot for a new one (returns None); waits while the pool is full.
+
+        Must be called with _cond held.
+        """
+        while True:
+            self._evict_idle()
+            pooled = self._take_idle()
+            if pooled is not None:
+                return pooled
+            if self._open < self.max_size:
+                self._open += 1
+                return None
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"No database connection became available within {self.ACQUIRE_TIMEOUT}s")
+            self._metrics["waits"] += 1
+            self._cond.wait(remaining)
+
+    def _take_idle(self):
+        """Pops the calling thread's previous connection if it is idle, otherwise the most recently used one."""
+        if not self._idle:
+            return None
+        preferred = getattr(self._affinity, "pooled", None)
+        if preferred is not None and preferred in self._idle:
+            self._idle.remove(preferred)
+            self._metrics["affinity_hits"] += 1
+            return preferred
+        return self._idle.pop()
+
+    # --- Lifecycle Helpers ---
+    def _connect(self):
+        start = time.perf_counter()
+        conn = jaydebeapi.connect(self.driver, self.url, self.credentials, self.jar_path)
+        elapsed = time.perf_counter() - start
+        with self._cond:
+            self._metrics["connects"] += 1
+            self._metrics["connect_time"] += elapsed
+            return _PooledConnection(conn, self._generation)
+
+    def _is_healthy(self, pooled):
+        """Validates connections that sat idle longer than VALIDATE_AFTER via JDBC isValid()."""
+        if time.monotonic() - pooled.last_used < self.VALIDATE_AFTER:
+            return True
+        healthy = self._validate(pooled)
+        with self._cond:
+            self._metrics["health_checks"] += 1
+            if not healthy:
+                self._metrics["health_check_failures"] += 1
+        return healthy
+
+    def _validate(self, pooled):
+        try:
+            return bool(pooled.conn.jconn.isValid(self.VALIDATION_TIMEOUT))
+        except Exception:
+            return False
+
+    def _evict_idle(self):
+        now = time.monotonic()
+        for pooled in [p for p in self._idle if now - p.last_used > self.idle_timeout]:
+            self._idle.remove(pooled)
+            self._close(pooled)
+            self._metrics["evictions"] += 1
+
+    def _close(self, pooled):
+        self._open -= 1
+        try:
+            pooled.conn.close()
+        except Exception:
+            pass  # The connection is already unusable; nothing left to clean up
+
+    def _check_pid(self):
+        """
+        Forgets connections inherited from a parent process; a JDBC connection cannot be shared across a fork.
+
+        This keeps the pool's bookkeeping consistent only: the child still needs a JVM of its own (see the class
+        docstring), so forking after the first query is not supported.
+        """
+        if os.getpid() != self._pid:
+            with self._cond:
+                self._idle = []
+                self._open = 0
+                self._generation += 1  # Inherited connections still borrowed are dropped on release
+                self._pid = os.getpid()
+                self._affinity = threading.local()
+
+    def close_all(self):
+        """
+        Closes every idle connection. Connections borrowed at the time are closed when they are released, and
+        the next acquire opens a new one.
+        """
+        with self._cond:
+            self._generation += 1
+            while self._idle:
+                self._close(self._idle.pop())
+
+    # --- Metrics ---
+    def count(self, name):
+        """Increments a metrics counter."""
+        with self._cond:
+            self._metrics[name] += 1
+
+    def record_execute(self, elapsed):
+        """Adds the time spent executing a statement and fetching its results."""
+        with self._cond:
+            self._metrics["executes"] += 1
+            self._metrics["execute_time"] += elapsed
+
+    def metrics(self):
+        """
+        Returns pool metrics.
+
+        Returns:
+            dict: Counters plus "open"/"idle" connection counts and average connect/execute times in seconds.
+        """
+        with self._cond:
+            metrics = dict(self._metrics)
+            metrics["open"] = self._open
+            metrics["idle"] = len(self._idle)
+        metrics["avg_connect_time"] = metrics["connect_time"] / metrics["connects"] if metrics["connects"] else 0.0
+        metrics["avg_execute_time"] = metrics["execute_time"] / metrics["executes"] if metrics["executes"] else 0.0
+        return metrics
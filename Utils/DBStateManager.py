@@ -0,0 +1,131 @@
+import time
+import requests
+from Utils.BankAPIBase import BankAPIBase
+from Utils.Readiness import Readiness
+
+
+class DBStateManager(BankAPIBase):
+    """
+    Snapshots the Parabank dataset at the start of a test session and restores it once the session is over.
+
+    snapshot() streams the rows of TABLES (columns and types from INFORMATION_SCHEMA) into memory; restore()
+    deletes the tables' rows children first and re-inserts the snapshot as JDBC batches, parents first. Date/time
+    and decimal values are read as text and cast back to the column's type on insert, so they come back exactly
+    as they were, whatever Python types the JDBC driver maps them to. Without a snapshot, restore() falls back to
+    Parabank's /initializeDB. Either way it returns as soon as Readiness sees the API and the database answering
+    again, instead of sleeping a fixed time.
+    """
+
+    # Parent tables first; rows are deleted in reverse order so foreign keys hold throughout
+    TABLES = ("CUSTOMER", "ACCOUNT", "TRANSACTION", "POSITIONS")
+    # Column types snapshotted as text and cast back on insert
+    EXACT_TYPES = ("DATE", "TIME", "TIMESTAMP", "DECIMAL", "NUMERIC")
+    INSERT_BATCH_SIZE = 5000  # Rows per JDBC batch during restore
+
+    def __init__(self, tables=None):
+        """
+        Args:
+            tables (tuple): Tables to snapshot and restore, parents before children (defaults to TABLES).
+        """
+        self.tables = tuple(tables or self.TABLES)
+        # {table: {"columns": [...], "types": [SQL type for EXACT_TYPES columns, else None], "rows": [(...), ...]}}
+        self.snapshot_data = None
+
+    def columns(self, table):
+        """
+        Returns the table's columns in ordinal order.
+
+        Returns:
+            list: (column name, SQL type) tuples; the type, e.g. "DECIMAL(20,2)", is None unless it is one of
+            EXACT_TYPES.
+        """
+        rows = self.execute_db_query(
+            "SELECT COLUMN_NAME, DATA_TYPE, NUMERIC_PRECISION, NUMERIC_SCALE FROM INFORMATION_SCHEMA.COLUMNS "
+            "WHERE TABLE_SCHEMA = 'PUBLIC' AND TABLE_NAME = ? ORDER BY ORDINAL_POSITION", (table,)
+        )
+        columns = []
+        for name, data_type, precision, scale in rows:
+            if data_type not in self.EXACT_TYPES:
+                columns.append((name, None))
+            elif data_type in ("DECIMAL", "NUMERIC"):
+                columns.append((name, f"{data_type}({int(precision)},{int(scale)})"))
+            else:
+                columns.append((name, data_type))
+        return columns
+
+    def snapshot(self):
+        """
+        Captures the current rows of the managed tables in memory.
+
+        Returns:
+            dict: Row counts per table.
+        """
+        log = self.get_logger()
+        start = time.perf_counter()
+        data = {}
+        try:
+            for table in self.tables:
+                columns = self.columns(table)
+                # Quoted: INFORMATION_SCHEMA returns the exact names, and TRANSACTION has a column named DATE
+                selected = [f'CAST("{name}" AS VARCHAR(64))' if sql_type else f'"{name}"' for name, sql_type in columns]
+                rows = list(self.iter_db_query(f"SELECT {', '.join(selected)} FROM PUBLIC.{table}"))
+                data[table] = {"columns": [name for name, _ in columns],
+                               "types": [sql_type for _, sql_type in columns], "rows": rows}
+        except Exception as e:
+            log.error(f"Failed to snapshot the database: {e}")
+            raise
+        self.snapshot_data = data
+        counts = {table: len(data[table]["rows"]) for table in self.tables}
+        log.info(f"DB snapshot of {counts} taken in {time.perf_counter() - start:.2f}s")
+        return counts
+
+    def restore(self, timeout=None):
+        """
+        Brings the database back to the snapshot (or to Parabank's initial data without one) and waits until
+        Parabank is ready.
+
+        Args:
+            timeout (float): Seconds to wait for readiness (defaults to Readiness.TIMEOUT).
+
+        Returns:
+            float: Seconds the reset took, readiness included.
+        """
+        log = self.get_logger()
+        start = time.perf_counter()
+        try:
+            if self.snapshot_data is None:
+                self.initialize_database()
+            else:
+                self._restore_rows()
+        except Exception as e:
+            log.error(f"Failed to restore the database: {e}")
+            raise
+        self.invalidate_test_data()  # Cached account/customer IDs may no longer match the DB
+        Readiness.wait_for_parabank(timeout)
+        elapsed = time.perf_counter() - start
+        log.info(f"Database restored in {elapsed:.2f}s")
+        return elapsed
+
+    def _restore_rows(self):
+        for table in reversed(self.tables):
+            self.execute_db_query(f"DELETE FROM PUBLIC.{table}")
+        for table in self.tables:
+            snapshot = self.snapshot_data[table]
+            columns, rows = snapshot["columns"], snapshot["rows"]
+            values = [f"CAST(? AS {sql_type})" if sql_type else "?" for sql_type in snapshot["types"]]
+            names = ", ".join(f'"{name}"' for name in columns)
+            statement = f"INSERT INTO PUBLIC.{table} ({names}) VALUES ({', '.join(values)})"
+            for offset in range(0, len(rows), self.INSERT_BATCH_SIZE):
+                self.execute_db_many(statement, [tuple(row) for row in rows[offset:offset + self.INSERT_BATCH_SIZE]])
+
+    def initialize_database(self):
+        """Resets Parabank to its initial dataset through /initializeDB (does not wait for readiness)."""
+        log = self.get_logger()
+        try:
+            response = self.api.initialize_db()
+            response.raise_for_status()
+            log.info("Database initialization requested")
+            return response.text
+        except requests.exceptions.HTTPError as http_err:
+            log.error(f"HTTP error occurred while initializing the database: {http_err}")
+            raise
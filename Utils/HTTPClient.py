@@ -0,0 +1,255 @@
+import re
+import time
+import threading
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+from Utils.LatencyStats import LatencyStats
+
+# Time spent in connect() by the current thread, read and reset around every request
+_connect_time = threading.local()
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    """urllib3 connection that reports how long opening the TCP connection took."""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_time.seconds = getattr(_connect_time, "seconds", 0.0) + time.perf_counter() - start
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    """urllib3 connection that reports how long the TCP connect and TLS handshake took."""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_time.seconds = getattr(_connect_time, "seconds", 0.0) + time.perf_counter() - start
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools open timed connections."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool
+        }
+
+
+class HTTPClient:
+    """Shared, pooled keep-alive HTTP client that all API helpers route their calls through."""
+
+    # --- Pool / Transport Settings ---
+    POOL_CONNECTIONS = 10  # Number of per-host connection pools kept in the pool manager
+    POOL_MAXSIZE = 20  # Keep-alive connections kept per host (per-host limit)
+    POOL_BLOCK = False  # When True, never open more than POOL_MAXSIZE connections to a host
+    CONNECT_TIMEOUT = 3.05  # Seconds to establish a TCP connection
+    READ_TIMEOUT = 30  # Seconds to wait for the server between bytes
+
+    # --- Retry Settings (idempotent methods only) ---
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF_FACTOR = 0.3  # Sleeps 0.3s, 0.6s, 1.2s ... between attempts
+    RETRY_STATUS_FORCELIST = (502, 503, 504)
+    RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+    # Path segments replaced by a placeholder when an endpoint name is derived from the URL
+    ID_SEGMENT = re.compile(r"^\d+$")
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, pool_connections=None, pool_maxsize=None, pool_block=None,
+                 connect_timeout=None, read_timeout=None, retries=None, backoff_factor=None):
+        """
+        Creates a client backed by a single requests.Session with a tuned connection pool.
+
+        Args:
+            pool_connections (int): Number of per-host pools to cache.
+            pool_maxsize (int): Maximum number of keep-alive connections per host.
+            pool_block (bool): Whether to block instead of opening extra connections when the pool is exhausted.
+            connect_timeout (float): Default connect timeout in seconds.
+            read_timeout (float): Default read timeout in seconds.
+            retries (int): Number of retries for idempotent requests.
+            backoff_factor (float): Exponential backoff factor between retries.
+        """
+        self.pool_connections = pool_connections or self.POOL_CONNECTIONS
+        self.pool_maxsize = pool_maxsize or self.POOL_MAXSIZE
+        self.pool_block = self.POOL_BLOCK if pool_block is None else pool_block
+        self.timeout = (connect_timeout or self.CONNECT_TIMEOUT, read_timeout or self.READ_TIMEOUT)
+        self.retries = self.RETRY_TOTAL if retries is None else retries
+        self.backoff_factor = self.RETRY_BACKOFF_FACTOR if backoff_factor is None else backoff_factor
+
+        retry = Retry(
+            total=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.RETRY_STATUS_FORCELIST,
+            allowed_methods=self.RETRY_METHODS,
+            raise_on_status=False  # Hand the last response back so callers can raise_for_status()
+        )
+        self._adapter = _TimedHTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=retry
+        )
+
+        self.session = requests.Session()
+        self.session.mount("http://", self._adapter)
+        self.session.mount("https://", self._adapter)
+
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._errors = 0
+
+    @classmethod
+    def shared(cls):
+        """Returns the process-wide client, creating it on first use."""
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+        return cls._shared
+
+    @classmethod
+    def configure(cls, **kwargs):
+        """
+        Replaces the process-wide client with one built from the given settings.
+
+        Args:
+            **kwargs: Any keyword accepted by HTTPClient.__init__.
+
+        Returns:
+            HTTPClient: The new shared client.
+        """
+        with cls._shared_lock:
+            if cls._shared is not None:
+                cls._shared.close()
+            cls._shared = cls(**kwargs)
+        return cls._shared
+
+    def settings(self):
+        """
+        Returns the keyword arguments this client was built with, e.g. to restore it after a temporary change:
+        HTTPClient.configure(**previous_settings).
+        """
+        return {
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "pool_block": self.pool_block,
+            "connect_timeout": self.timeout[0],
+            "read_timeout": self.timeout[1],
+            "retries": self.retries,
+            "backoff_factor": self.backoff_factor
+        }
+
+    def request(self, method, url, endpoint=None, **kwargs):
+        """
+        Sends a request through the pooled session and records its latency in LatencyStats.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Full request URL.
+            endpoint (str): Name the sample is aggregated under, e.g. "GET /accounts/{accountId}". Derived from
+                the URL (numeric path segments replaced by "{id}") when omitted.
+            **kwargs: Passed to requests.Session.request (headers, params, json ...).
+
+        Returns:
+            requests.Response: The server response.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        endpoint = endpoint or self.endpoint_name(method, url)
+        with self._lock:
+            self._requests += 1
+
+        _connect_time.seconds = 0.0
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.exceptions.RequestException:
+            with self._lock:
+                self._errors += 1
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            LatencyStats.record(endpoint, 0, _connect_time.seconds * 1000, elapsed_ms, elapsed_ms, 0, 0)
+            raise
+
+        # requests reads the body eagerly, so the wall time covers the full transfer; Response.elapsed stops
+        # once the headers were parsed
+        total_ms = (time.perf_counter() - start) * 1000
+        connect_ms = _connect_time.seconds * 1000
+        ttfb_ms = max(response.elapsed.total_seconds() * 1000 - connect_ms, 0.0)
+        body = response.request.body
+        LatencyStats.record(
+            endpoint, response.status_code, connect_ms, ttfb_ms, total_ms,
+            len(body) if body else 0, len(response.content)
+        )
+        return response
+
+    @classmethod
+    def endpoint_name(cls, method, url):
+        """Builds an endpoint name such as "GET /bank/accounts/{id}" from a request URL."""
+        segments = urlsplit(url).path.split("/")
+        return f"{method} " + "/".join("{id}" if cls.ID_SEGMENT.match(s) else s for s in segments)
+
+    def get(self, url, **kwargs):
+        """Sends a GET request (retried with backoff on connection errors and 502/503/504)."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        """Sends a POST request (never retried once the request has been sent)."""
+        return self.request("POST", url, **kwargs)
+
+    def stats(self):
+        """
+        Collects connection pool statistics.
+
+        Returns:
+            dict: Totals plus a per-host breakdown with the keys:
+                - "requests" (int): Requests issued through this client.
+                - "errors" (int): Requests that raised a transport error.
+                - "connections_opened" (int): New TCP connections opened by the pools.
+                - "reuse_rate" (float): Fraction of pool requests served on an existing connection.
+                - "pools" (dict): Per host "requests", "connections_opened", "idle" counts.
+        """
+        pools = {}
+        pool_manager = self._adapter.poolmanager
+        for key in list(pool_manager.pools.keys()):
+            pool = pool_manager.pools.get(key)
+            if pool is None:
+                continue
+            pools[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                "requests": pool.num_requests,
+                "connections_opened": pool.num_connections,
+                "idle": pool.pool.qsize() if pool.pool is not None else 0
+            }
+
+        pool_requests = sum(p["requests"] for p in pools.values())
+        opened = sum(p["connections_opened"] for p in pools.values())
+        return {
+            "requests": self._requests,
+            "errors": self._errors,
+            "connections_opened": opened,
+            "reuse_rate": (1 - opened / pool_requests) if pool_requests else 0.0,
+            "pools": pools
+        }
+
+    def close(self):
+        """Closes the session and every pooled connection."""
+        self.session.close()
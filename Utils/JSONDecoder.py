@@ -0,0 +1,52 @@
+import os
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard library decoder is used without it
+    orjson = None
+
+
+class JSONDecoder:
+    """
+    Pluggable JSON decoder used for API responses.
+
+    Defaults to orjson when it is installed (decodes bytes directly, several times faster on large arrays such
+    as account transactions) and falls back to the standard library. Override with PARABANK_JSON_DECODER=json
+    or JSONDecoder.use(...).
+    """
+
+    DECODER_ENV = "PARABANK_JSON_DECODER"  # "orjson" or "json"
+
+    name = "json"
+    loads = staticmethod(json.loads)
+
+    @classmethod
+    def use(cls, decoder):
+        """
+        Selects the decoder.
+
+        Args:
+            decoder (str | callable): "orjson", "json", or any callable taking bytes/str and returning objects.
+
+        Raises:
+            ValueError: If the named decoder is unknown or not installed.
+        """
+        if callable(decoder):
+            cls.name, cls.loads = getattr(decoder, "__name__", "custom"), staticmethod(decoder)
+        elif decoder == "orjson":
+            if orjson is None:
+                raise ValueError("orjson is not installed")
+            cls.name, cls.loads = "orjson", staticmethod(orjson.loads)
+        elif decoder == "json":
+            cls.name, cls.loads = "json", staticmethod(json.loads)
+        else:
+            raise ValueError(f"Unknown JSON decoder '{decoder}', expected 'orjson', 'json' or a callable")
+
+    @classmethod
+    def decode(cls, response):
+        """Decodes a response body (requests.Response or bytes) with the selected decoder."""
+        return cls.loads(response if isinstance(response, (bytes, str)) else response.content)
+
+
+JSONDecoder.use(os.environ.get(JSONDecoder.DECODER_ENV) or ("orjson" if orjson is not None else "json"))
@@ -0,0 +1,199 @@
+import json
+import math
+
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear latency histogram: fixed relative precision, bounded memory, exactly mergeable.
+
+    Values are recorded in microseconds into buckets that are linear within each power of two (2^k sub-buckets
+    sized for the requested significant digits), so every recorded value is known to within ~1% (2 digits) from
+    1 us up to HIGHEST_MS. Only non-empty buckets are stored - a few hundred at most for real latency spreads -
+    and two histograms merge by adding counts, so per-worker and per-run histograms combine into exact
+    percentiles without keeping raw samples.
+    """
+
+    FORMAT = "parabank-latency-histogram"  # Marker of the files written by dump_endpoints
+    FORMAT_VERSION = 1
+    SIGNIFICANT_DIGITS = 2
+    HIGHEST_MS = 3600000  # Larger values are clamped (one hour)
+    PERCENTILES = (50, 90, 95, 99, 99.9)
+
+    __slots__ = ("significant_digits", "_sub_bits", "_sub_count", "_half", "_highest_us",
+                 "counts", "count", "total_us", "min_us", "max_us")
+
+    def __init__(self, significant_digits=None):
+        """
+        Args:
+            significant_digits (int): Decimal digits of precision (1-4).
+        """
+        self.significant_digits = significant_digits or self.SIGNIFICANT_DIGITS
+        if not 1 <= self.significant_digits <= 4:
+            raise ValueError("significant_digits must be between 1 and 4")
+        self._sub_bits = math.ceil(math.log2(2 * 10 ** self.significant_digits))
+        self._sub_count = 1 << self._sub_bits
+        self._half = self._sub_count >> 1
+        self._highest_us = self.HIGHEST_MS * 1000
+        self.counts = {}  # Bucket index -> count, sparse
+        self.count = 0
+        self.total_us = 0
+        self.min_us = None
+        self.max_us = 0
+
+    def _index(self, value_us):
+        if value_us < self._sub_count:
+            return value_us
+        shift = value_us.bit_length() - self._sub_bits
+        return self._sub_count + (shift - 1) * self._half + (value_us >> shift) - self._half
+
+    def _highest_equivalent(self, index):
+        if index < self._sub_count:
+            return index
+        shift, sub = divmod(index - self._sub_count, self._half)
+        shift += 1
+        return ((sub + self._half + 1) << shift) - 1
+
+    def record(self, value_ms, count=1):
+        """Records a latency in milliseconds (negative values count as 0, values above HIGHEST_MS are clamped)."""
+        value_us = min(max(int(value_ms * 1000 + 0.5), 0), self._highest_us)
+        index = self._index(value_us)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        self.total_us += value_us * count
+        if self.min_us is None or value_us < self.min_us:
+            self.min_us = value_us
+        if value_us > self.max_us:
+            self.max_us = value_us
+
+    def merge(self, other):
+        """
+        Adds another histogram's samples to this one.
+
+        Raises:
+            ValueError: If the histograms were recorded with different precision.
+        """
+        if other.significant_digits != self.significant_digits:
+            raise ValueError("Cannot merge histograms with different significant digits")
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        if other.min_us is not None and (self.min_us is None or other.min_us < self.min_us):
+            self.min_us = other.min_us
+        self.max_us = max(self.max_us, other.max_us)
+        return self
+
+    def percentile(self, pct):
+        """Latency (ms) at or below which pct percent of the samples fall, within the histogram's precision."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100 * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self._highest_equivalent(index), self.max_us) / 1000
+        return self.max_us / 1000
+
+    def percentiles(self, pcts=None):
+        """Returns {"p50": ms, ...} for the given (default PERCENTILES) percentiles in one pass."""
+        pcts = sorted(pcts or self.PERCENTILES)
+        result = dict.fromkeys((f"p{pct:g}" for pct in pcts), 0.0)
+        if not self.count:
+            return result
+        ranks = [(f"p{pct:g}", max(1, math.ceil(pct / 100 * self.count))) for pct in pcts]
+        seen, position = 0, 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            while position < len(ranks) and seen >= ranks[position][1]:
+                result[ranks[position][0]] = min(self._highest_equivalent(index), self.max_us) / 1000
+                position += 1
+        return result
+
+    @property
+    def mean(self):
+        """Mean latency in milliseconds."""
+        return self.total_us / self.count / 1000 if self.count else 0.0
+
+    @property
+    def max(self):
+        """Highest recorded latency in milliseconds."""
+        return self.max_us / 1000
+
+    @property
+    def min(self):
+        """Lowest recorded latency in milliseconds."""
+        return (self.min_us or 0) / 1000
+
+    def to_dict(self):
+        """Returns a JSON-serializable form (sparse bucket counts plus the derived percentiles)."""
+        return {
+            "significant_digits": self.significant_digits,
+            "count": self.count,
+            "min_ms": self.min,
+            "max_ms": self.max,
+            "mean_ms": round(self.mean, 3),
+            "percentiles_ms": self.percentiles(),
+            "total_us": self.total_us,
+            "counts": {str(index): count for index, count in sorted(self.counts.items())}
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuilds a histogram written by to_dict."""
+        histogram = cls(data["significant_digits"])
+        histogram.counts = {int(index): count for index, count in data["counts"].items()}
+        histogram.count = data["count"]
+        histogram.total_us = data["total_us"]
+        histogram.min_us = round(data["min_ms"] * 1000) if data["count"] else None
+        histogram.max_us = round(data["max_ms"] * 1000)
+        return histogram
+
+    @classmethod
+    def dump_endpoints(cls, path, histograms, sources=()):
+        """
+        Writes {endpoint: LatencyHistogram} as a mergeable per-endpoint percentile file.
+
+        Args:
+            path (str): Output file.
+            histograms (dict): Histograms keyed by endpoint, e.g. "GET /accounts/{accountId}".
+            sources (list): Where the samples came from (worker IDs, run names ...), carried into merged files.
+        """
+        document = {
+            "format": cls.FORMAT,
+            "version": cls.FORMAT_VERSION,
+            "unit": "ms",
+            "sources": list(sources),
+            "endpoints": {endpoint: histograms[endpoint].to_dict() for endpoint in sorted(histograms)}
+        }
+        with open(path, "w") as histogram_file:
+            json.dump(document, histogram_file, indent=1)
+
+    @classmethod
+    def load_endpoints(cls, path):
+        """
+        Reads a file written by dump_endpoints.
+
+        Returns:
+            tuple: ({endpoint: LatencyHistogram}, sources list).
+
+        Raises:
+            ValueError: If the file is not a latency histogram file.
+        """
+        with open(path) as histogram_file:
+            document = json.load(histogram_file)
+        if document.get("format") != cls.FORMAT:
+            raise ValueError(f"{path} is not a {cls.FORMAT} file")
+        histograms = {endpoint: cls.from_dict(data) for endpoint, data in document["endpoints"].items()}
+        return histograms, document.get("sources", [])
+
+    @staticmethod
+    def merge_endpoints(histogram_sets):
+        """Merges several {endpoint: LatencyHistogram} dicts into a new one (inputs are not modified)."""
+        merged = {}
+        for histograms in histogram_sets:
+            for endpoint, histogram in histograms.items():
+                if endpoint not in merged:
+                    merged[endpoint] = LatencyHistogram(histogram.significant_digits)
+                merged[endpoint].merge(histogram)
+        return merged
@@ -0,0 +1,210 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from Utils.LatencyHistogram import LatencyHistogram
+
+
+class EndpointStats:
+    """Latency histograms (connect, TTFB, total), payload sizes and status codes for one endpoint."""
+
+    PHASES = ("connect", "ttfb", "total")
+
+    __slots__ = ("count", "histograms", "request_bytes", "response_bytes", "status_codes")
+
+    def __init__(self):
+        self.count = 0
+        self.histograms = {phase: LatencyHistogram() for phase in self.PHASES}
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.status_codes = {}
+
+    def record(self, status, timings_ms, request_bytes, response_bytes):
+        self.count += 1
+        for phase in self.PHASES:
+            self.histograms[phase].record(timings_ms[phase])
+        self.request_bytes += request_bytes
+        self.response_bytes += response_bytes
+        self.status_codes[status] = self.status_codes.get(status, 0) + 1
+
+    def merge(self, other):
+        self.count += other.count
+        for phase in self.PHASES:
+            self.histograms[phase].merge(other.histograms[phase])
+        self.request_bytes += other.request_bytes
+        self.response_bytes += other.response_bytes
+        for status, count in other.status_codes.items():
+            self.status_codes[status] = self.status_codes.get(status, 0) + count
+
+    def percentile(self, phase, pct):
+        """Latency (ms) of the given phase at the given percentile, within the histogram's ~1% precision."""
+        return self.histograms[phase].percentile(pct)
+
+    def mean(self, phase):
+        """Mean latency (ms) of the given phase."""
+        return self.histograms[phase].mean
+
+    def summary(self):
+        """Returns a JSON-serializable summary of the endpoint."""
+        return {
+            "count": self.count,
+            "mean_ms": {phase: self.histograms[phase].mean for phase in self.PHASES},
+            "p50_ms": {phase: self.percentile(phase, 50) for phase in self.PHASES},
+            "p95_ms": {phase: self.percentile(phase, 95) for phase in self.PHASES},
+            "p99_ms": {phase: self.percentile(phase, 99) for phase in self.PHASES},
+            "max_ms": {phase: self.histograms[phase].max for phase in self.PHASES},
+            "histogram_ms": {phase: histogram.to_dict() for phase, histogram in self.histograms.items()},
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "status_codes": {str(status): count for status, count in sorted(self.status_codes.items())}
+        }
+
+
+class LatencyStats:
+    """
+    Process-wide collector of API call latencies, aggregated per endpoint, per test and per session.
+
+    The shared HTTPClient and AsyncBankAPIBase record every request here; conftest sets the current test so the
+    same samples are also grouped under the running test's node ID. Threads and asyncio tasks can tag their own
+    calls: inside unattributed() (background work such as the account pool's recycler) samples count for the
+    session but not for the running test, and inside warmup() they go to a separate collector and reach neither.
+    """
+
+    WARMUP = "warmup"
+    UNATTRIBUTED = "unattributed"
+
+    _lock = threading.Lock()
+    _session = {}
+    _tests = {}
+    _warmup = {}
+    _current_test = None
+    _tag = ContextVar("latency_tag", default=None)  # Set by warmup() / unattributed(); per thread and asyncio task
+
+    @classmethod
+    def record(cls, endpoint, status, connect_ms, ttfb_ms, total_ms, request_bytes, response_bytes):
+        """
+        Records one API call.
+
+        Args:
+            endpoint (str): Endpoint template, e.g. "GET /accounts/{accountId}".
+            status (int): HTTP status code (0 when no response was received).
+            connect_ms (float): Time spent opening new connections (0 for a reused keep-alive connection).
+            ttfb_ms (float): Time from sending the request until the response headers were parsed.
+            total_ms (float): Time until the full response body was read.
+            request_bytes (int): Request body size.
+            response_bytes (int): Response body size.
+        """
+        timings = {"connect": connect_ms, "ttfb": ttfb_ms, "total": total_ms}
+        tag = cls._tag.get()
+        with cls._lock:
+            if tag == cls.WARMUP:
+                targets = [cls._warmup]
+            else:
+                targets = [cls._session]
+                if tag is None and cls._current_test is not None:
+                    targets.append(cls._tests.setdefault(cls._current_test, {}))
+            for target in targets:
+                stats = target.get(endpoint)
+                if stats is None:
+                    stats = target[endpoint] = EndpointStats()
+                stats.record(status, timings, request_bytes, response_bytes)
+
+    @classmethod
+    def set_current_test(cls, node_id):
+        """Groups subsequent samples under the given test (None to stop grouping)."""
+        with cls._lock:
+            cls._current_test = node_id
+
+    @classmethod
+    @contextmanager
+    def _tagged(cls, tag):
+        token = cls._tag.set(tag)
+        try:
+            yield
+        finally:
+            cls._tag.reset(token)
+
+    @classmethod
+    def warmup(cls):
+        """
+        Tags the calling thread's samples inside the block as warmup traffic, excluded from the session and tests.
+
+        Context-local: asyncio tasks started inside the block inherit the tag, but code that fans out to a thread
+        pool enters the block in every worker thread.
+        """
+        return cls._tagged(cls.WARMUP)
+
+    @classmethod
+    def unattributed(cls):
+        """
+        Keeps the calling thread's samples inside the block out of the running test's statistics (they still
+        count for the session), e.g. for background threads and session-scoped setup. Context-local like warmup().
+        """
+        return cls._tagged(cls.UNATTRIBUTED)
+
+    @classmethod
+    def warmup_stats(cls):
+        """Returns {endpoint: EndpointStats} of the warmup traffic."""
+        with cls._lock:
+            return dict(cls._warmup)
+
+    @classmethod
+    def test_stats(cls, node_id):
+        """Returns {endpoint: EndpointStats} recorded while the given test ran."""
+        with cls._lock:
+            return dict(cls._tests.get(node_id, {}))
+
+    @classmethod
+    def session_stats(cls):
+        """Returns {endpoint: EndpointStats} for the whole session."""
+        with cls._lock:
+            return dict(cls._session)
+
+    @classmethod
+    def histograms(cls, phase="total"):
+        """Returns {endpoint: LatencyHistogram} of the given phase for the whole session (copies, mergeable)."""
+        with cls._lock:
+            return {
+                endpoint: LatencyHistogram().merge(stats.histograms[phase])
+                for endpoint, stats in cls._session.items()
+            }
+
+    @classmethod
+    def reset(cls):
+        """Drops every recorded sample."""
+        with cls._lock:
+            cls._session = {}
+            cls._tests = {}
+            cls._warmup = {}
+
+    @classmethod
+    def to_dict(cls):
+        """Returns a JSON-serializable summary of the session and of every test."""
+        with cls._lock:
+            return {
+                "session": {endpoint: stats.summary() for endpoint, stats in sorted(cls._session.items())},
+                "tests": {
+                    node_id: {endpoint: stats.summary() for endpoint, stats in sorted(endpoints.items())}
+                    for node_id, endpoints in cls._tests.items()
+                }
+            }
+
+    @staticmethod
+    def html_table(stats_by_endpoint):
+        """Renders {endpoint: EndpointStats} as an HTML table for the pytest-html report."""
+        rows = []
+        for endpoint, stats in sorted(stats_by_endpoint.items()):
+            statuses = ", ".join(f"{status}: {count}" for status, count in sorted(stats.status_codes.items()))
+            rows.append(
+                f"<tr><td>{endpoint}</td><td>{stats.count}</td>"
+                f"<td>{stats.mean('connect'):.1f}</td><td>{stats.mean('ttfb'):.1f}</td>"
+                f"<td>{stats.mean('total'):.1f}</td><td>{stats.percentile('total', 95):.1f}</td>"
+                f"<td>{stats.percentile('total', 99):.1f}</td><td>{stats.histograms['total'].max:.1f}</td>"
+                f"<td>{stats.request_bytes}</td><td>{stats.response_bytes}</td><td>{statuses}</td></tr>"
+            )
+        return (
+            '<table class="latency" border="1" style="border-collapse:collapse;font-size:12px">'
+            "<tr><th>Endpoint</th><th>Calls</th><th>Connect avg (ms)</th><th>TTFB avg (ms)</th>"
+            "<th>Total avg (ms)</th><th>Total p95 (ms)</th><th>Total p99 (ms)</th><th>Total max (ms)</th>"
+            "<th>Req bytes</th><th>Resp bytes</th><th>Status codes</th></tr>"
+            + "".join(rows) + "</table>"
+        )
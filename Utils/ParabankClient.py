@@ -0,0 +1,531 @@
+"""
+Typed Parabank REST client generated from Tests/bank_api_swagger.yaml.
+
+DO NOT EDIT - regenerate with `python -m Tools.generate_parabank_client`.
+
+Every operation method builds its URL from a precompiled template, serializes its parameters with the
+serializer of their declared type and sends the request through the given HTTP session. The session only needs
+a requests-style `request(method, url, **kwargs)`, so the same client runs on HTTPClient (pytest) and on a
+Locust HttpUser's client. Methods return the raw response; extra keyword arguments are passed through.
+"""
+from collections import namedtuple
+from decimal import Decimal
+from urllib.parse import quote
+
+Operation = namedtuple("Operation", "method path name endpoint response_schema")
+
+JSON_HEADERS = {
+    "accept": "application/json",
+    "Content-Type": "application/json"
+}
+
+_SEQUENCES = (list, tuple)
+
+
+def _integer(value):
+    """Serializes an integer parameter; rejects floats with a fractional part."""
+    if type(value) is int:
+        return str(value)
+    number = int(value)
+    if isinstance(value, float) and number != value:
+        raise ValueError(f"Expected an integer, got {value!r}")
+    return str(number)
+
+
+def _number(value):
+    """Serializes a number parameter."""
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return str(value)
+    return str(float(value))
+
+
+def _boolean(value):
+    """Serializes a boolean parameter."""
+    return "true" if value else "false"
+
+
+def _string(value):
+    """Serializes and percent-encodes a string parameter."""
+    return quote(str(value), safe="")
+
+
+def _query(spec, values):
+    """
+    Builds a query string from precompiled (encoded key, serializer) pairs.
+
+    None values are omitted; list/tuple values repeat the key, as requests does.
+    """
+    parts = []
+    for (key, serialize), value in zip(spec, values):
+        if value is None:
+            continue
+        if type(value) in _SEQUENCES:
+            parts.extend(key + serialize(item) for item in value)
+        else:
+            parts.append(key + serialize(value))
+    return "?" + "&".join(parts) if parts else ""
+
+
+OPERATIONS = {
+    "billPay": Operation("POST", "/billpay", "bill_pay", "POST /billpay", 'BillPayResult'),
+    "buyPosition": Operation("POST", "/customers/{customerId}/buyPosition", "buy_position", "POST /customers/{customerId}/buyPosition", 'list[Position]'),
+    "cleanDB": Operation("POST", "/cleanDB", "clean_db", "POST /cleanDB", None),
+    "createAccount": Operation("POST", "/createAccount", "create_account", "POST /createAccount", 'Account'),
+    "deposit": Operation("POST", "/deposit", "deposit", "POST /deposit", None),
+    "getAccount": Operation("GET", "/accounts/{accountId}", "get_account", "GET /accounts/{accountId}", 'Account'),
+    "getAccounts": Operation("GET", "/customers/{customerId}/accounts", "get_accounts", "GET /customers/{customerId}/accounts", 'list[Account]'),
+    "getCustomer": Operation("GET", "/customers/{customerId}", "get_customer", "GET /customers/{customerId}", 'Customer'),
+    "getPosition": Operation("GET", "/positions/{positionId}", "get_position", "GET /positions/{positionId}", 'Position'),
+    "getPositionHistory": Operation("GET", "/positions/{positionId}/{startDate}/{endDate}", "get_position_history", "GET /positions/{positionId}/{startDate}/{endDate}", 'list[HistoryPoint]'),
+    "getPositions": Operation("GET", "/customers/{customerId}/positions", "get_positions", "GET /customers/{customerId}/positions", 'list[Position]'),
+    "getTransaction": Operation("GET", "/transactions/{transactionId}", "get_transaction", "GET /transactions/{transactionId}", 'Transaction'),
+    "getTransactions": Operation("GET", "/accounts/{accountId}/transactions", "get_transactions", "GET /accounts/{accountId}/transactions", 'list[Transaction]'),
+    "getTransactionsByAmount": Operation("GET", "/accounts/{accountId}/transactions/amount/{amount}", "get_transactions_by_amount", "GET /accounts/{accountId}/transactions/amount/{amount}", 'list[Transaction]'),
+    "getTransactionsByMonthAndType": Operation("GET", "/accounts/{accountId}/transactions/month/{month}/type/{type}", "get_transactions_by_month_and_type", "GET /accounts/{accountId}/transactions/month/{month}/type/{type}", 'list[Transaction]'),
+    "getTransactionsByToFromDate": Operation("GET", "/accounts/{accountId}/transactions/fromDate/{fromDate}/toDate/{toDate}", "get_transactions_by_to_from_date", "GET /accounts/{accountId}/transactions/fromDate/{fromDate}/toDate/{toDate}", 'list[Transaction]'),
+    "getTransactionsOnDate": Operation("GET", "/accounts/{accountId}/transactions/onDate/{onDate}", "get_transactions_on_date", "GET /accounts/{accountId}/transactions/onDate/{onDate}", 'list[Transaction]'),
+    "initializeDB": Operation("POST", "/initializeDB", "initialize_db", "POST /initializeDB", None),
+    "login": Operation("GET", "/login/{username}/{password}", "login", "GET /login/{username}/{password}", 'Customer'),
+    "requestLoan": Operation("POST", "/requestLoan", "request_loan", "POST /requestLoan", 'LoanResponse'),
+    "sellPosition": Operation("POST", "/customers/{customerId}/sellPosition", "sell_position", "POST /customers/{customerId}/sellPosition", 'list[Position]'),
+    "setParameter": Operation("POST", "/setParameter/{name}/{value}", "set_parameter", "POST /setParameter/{name}/{value}", None),
+    "shutdownJmsListener": Operation("POST", "/shutdownJmsListener", "shutdown_jms_listener", "POST /shutdownJmsListener", None),
+    "startupJmsListener": Operation("POST", "/startupJmsListener", "startup_jms_listener", "POST /startupJmsListener", None),
+    "transfer": Operation("POST", "/transfer", "transfer", "POST /transfer", None),
+    "updateCustomer": Operation("POST", "/customers/update/{customerId}", "update_customer", "POST /customers/update/{customerId}", None),
+    "withdraw": Operation("POST", "/withdraw", "withdraw", "POST /withdraw", None),
+}
+
+_BILL_PAY_QUERY = (("accountId=", _integer), ("amount=", _number))
+_BUY_POSITION_QUERY = (("accountId=", _integer), ("name=", _string), ("symbol=", _string), ("shares=", _integer), ("pricePerShare=", _number))
+_CREATE_ACCOUNT_QUERY = (("customerId=", _integer), ("newAccountType=", _integer), ("fromAccountId=", _integer))
+_DEPOSIT_QUERY = (("accountId=", _integer), ("amount=", _number))
+_REQUEST_LOAN_QUERY = (("customerId=", _integer), ("amount=", _number), ("downPayment=", _number), ("fromAccountId=", _integer))
+_SELL_POSITION_QUERY = (("accountId=", _integer), ("positionId=", _integer), ("shares=", _integer), ("pricePerShare=", _number))
+_TRANSFER_QUERY = (("fromAccountId=", _integer), ("toAccountId=", _integer), ("amount=", _number))
+_UPDATE_CUSTOMER_QUERY = (("firstName=", _string), ("lastName=", _string), ("street=", _string), ("city=", _string), ("state=", _string), ("zipCode=", _string), ("phoneNumber=", _string), ("ssn=", _string), ("username=", _string), ("password=", _string))
+_WITHDRAW_QUERY = (("accountId=", _integer), ("amount=", _number))
+
+
+class ParabankClient:
+    """
+    Parabank REST client with one method per OpenAPI operation.
+
+    Args:
+        http: Object with a requests-style `request(method, url, **kwargs)` (HTTPClient, requests.Session,
+            Locust's HttpSession).
+        base_url (str): Service root, e.g. "http://localhost:8090/parabank/services/bank".
+        tag_kwarg (str): Keyword used to pass each operation's endpoint name to the session ("endpoint" for
+            HTTPClient, "name" for Locust), so statistics group by template instead of by concrete URL. None to
+            send no tag.
+        headers (dict): Default headers for every request.
+        tag_method (bool): Whether the tag starts with the HTTP method ("GET /accounts/{accountId}"). Locust
+            already reports the method separately, so its user passes False ("/accounts/{accountId}").
+    """
+
+    def __init__(self, http, base_url, tag_kwarg="endpoint", headers=None, tag_method=True):
+        self.http = http
+        self.base_url = base_url.rstrip("/")
+        self.tag_kwarg = tag_kwarg
+        self.headers = JSON_HEADERS if headers is None else headers
+        self.tag_method = tag_method
+
+    def _send(self, method, url, endpoint, body, kwargs):
+        kwargs.setdefault("headers", self.headers)
+        if self.tag_kwarg:
+            kwargs.setdefault(self.tag_kwarg, endpoint if self.tag_method else endpoint[len(method) + 1:])
+        if body is not None:
+            # Pre-serialized payloads are sent as-is, anything else is JSON-encoded by the session
+            kwargs["data" if isinstance(body, (bytes, str)) else "json"] = body
+        return self.http.request(method, url, **kwargs)
+
+    def bill_pay(self, account_id, amount, body, **kwargs):
+        """
+        POST /billpay (billPay) - Pay bill
+
+        Args:
+            account_id (integer): query parameter 'accountId'.
+            amount (number): query parameter 'amount'.
+            body (dict | bytes): Payee request body (bytes/str are sent pre-serialized).
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response (BillPayResult JSON).
+        """
+        return self._send("POST", f"{self.base_url}/billpay" + _query(_BILL_PAY_QUERY, (account_id, amount)), "POST /billpay", body, kwargs)
+
+    def buy_position(self, customer_id, account_id, name, symbol, shares, price_per_share, **kwargs):
+        """
+        POST /customers/{customerId}/buyPosition (buyPosition) - Buy a Position
+
+        Args:
+            customer_id (integer): path parameter 'customerId'.
+            account_id (integer): query parameter 'accountId'.
+            name (string): query parameter 'name'.
+            symbol (string): query parameter 'symbol'.
+            shares (integer): query parameter 'shares'.
+            price_per_share (number): query parameter 'pricePerShare'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response (list[Position] JSON).
+        """
+        return self._send("POST", f"{self.base_url}/customers/{_integer(customer_id)}/buyPosition" + _query(_BUY_POSITION_QUERY, (account_id, name, symbol, shares, price_per_share)), "POST /customers/{customerId}/buyPosition", None, kwargs)
+
+    def clean_db(self, **kwargs):
+        """
+        POST /cleanDB (cleanDB) - Clean the Database
+
+        Args:
+            None.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response.
+        """
+        return self._send("POST", f"{self.base_url}/cleanDB", "POST /cleanDB", None, kwargs)
+
+    def create_account(self, customer_id, new_account_type, from_account_id, **kwargs):
+        """
+        POST /createAccount (createAccount) - Create a new account
+
+        Args:
+            customer_id (integer): query parameter 'customerId'.
+            new_account_type (integer): query parameter 'newAccountType'.
+            from_account_id (integer): query parameter 'fromAccountId'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response (Account JSON).
+        """
+        return self._send("POST", f"{self.base_url}/createAccount" + _query(_CREATE_ACCOUNT_QUERY, (customer_id, new_account_type, from_account_id)), "POST /createAccount", None, kwargs)
+
+    def deposit(self, account_id, amount, **kwargs):
+        """
+        POST /deposit (deposit) - Deposit funds
+
+        Args:
+            account_id (integer): query parameter 'accountId'.
+            amount (number): query parameter 'amount'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response.
+        """
+        return self._send("POST", f"{self.base_url}/deposit" + _query(_DEPOSIT_QUERY, (account_id, amount)), "POST /deposit", None, kwargs)
+
+    def get_account(self, account_id, **kwargs):
+        """
+        GET /accounts/{accountId} (getAccount) - Get Account by Id
+
+        Args:
+            account_id (integer): path parameter 'accountId'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response (Account JSON).
+        """
+        return self._send("GET", f"{self.base_url}/accounts/{_integer(account_id)}", "GET /accounts/{accountId}", None, kwargs)
+
+    def get_accounts(self, customer_id, **kwargs):
+        """
+        GET /customers/{customerId}/accounts (getAccounts) - Get Customer Accounts
+
+        Args:
+            customer_id (integer): path parameter 'customerId'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response (list[Account] JSON).
+        """
+        return self._send("GET", f"{self.base_url}/customers/{_integer(customer_id)}/accounts", "GET /customers/{customerId}/accounts", None, kwargs)
+
+    def get_customer(self, customer_id, **kwargs):
+        """
+        GET /customers/{customerId} (getCustomer) - Get Customer Details
+
+        Args:
+            customer_id (integer): path parameter 'customerId'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response (Customer JSON).
+        """
+        return self._send("GET", f"{self.base_url}/customers/{_integer(customer_id)}", "GET /customers/{customerId}", None, kwargs)
+
+    def get_position(self, position_id, **kwargs):
+        """
+        GET /positions/{positionId} (getPosition) - Get Position by id
+
+        Args:
+            position_id (integer): path parameter 'positionId'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response (Position JSON).
+        """
+        return self._send("GET", f"{self.base_url}/positions/{_integer(position_id)}", "GET /positions/{positionId}", None, kwargs)
+
+    def get_position_history(self, position_id, start_date, end_date, **kwargs):
+        """
+        GET /positions/{positionId}/{startDate}/{endDate} (getPositionHistory) - Get Position history by id within a date range
+
+        Args:
+            position_id (integer): path parameter 'positionId'.
+            start_date (string): path parameter 'startDate'.
+            end_date (string): path parameter 'endDate'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response (list[HistoryPoint] JSON).
+        """
+        return self._send("GET", f"{self.base_url}/positions/{_integer(position_id)}/{_string(start_date)}/{_string(end_date)}", "GET /positions/{positionId}/{startDate}/{endDate}", None, kwargs)
+
+    def get_positions(self, customer_id, **kwargs):
+        """
+        GET /customers/{customerId}/positions (getPositions) - Get Positions for Customer
+
+        Args:
+            customer_id (integer): path parameter 'customerId'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response (list[Position] JSON).
+        """
+        return self._send("GET", f"{self.base_url}/customers/{_integer(customer_id)}/positions", "GET /customers/{customerId}/positions", None, kwargs)
+
+    def get_transaction(self, transaction_id, **kwargs):
+        """
+        GET /transactions/{transactionId} (getTransaction) - Get the transaction for the id
+
+        Args:
+            transaction_id (integer): path parameter 'transactionId'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response (Transaction JSON).
+        """
+        return self._send("GET", f"{self.base_url}/transactions/{_integer(transaction_id)}", "GET /transactions/{transactionId}", None, kwargs)
+
+    def get_transactions(self, account_id, **kwargs):
+        """
+        GET /accounts/{accountId}/transactions (getTransactions) - Get the list of Transactions for the account
+
+        Args:
+            account_id (integer): path parameter 'accountId'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response (list[Transaction] JSON).
+        """
+        return self._send("GET", f"{self.base_url}/accounts/{_integer(account_id)}/transactions", "GET /accounts/{accountId}/transactions", None, kwargs)
+
+    def get_transactions_by_amount(self, account_id, amount, **kwargs):
+        """
+        GET /accounts/{accountId}/transactions/amount/{amount} (getTransactionsByAmount) - Create transactions by amount for account
+
+        Args:
+            account_id (integer): path parameter 'accountId'.
+            amount (number): path parameter 'amount'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response (list[Transaction] JSON).
+        """
+        return self._send("GET", f"{self.base_url}/accounts/{_integer(account_id)}/transactions/amount/{_number(amount)}", "GET /accounts/{accountId}/transactions/amount/{amount}", None, kwargs)
+
+    def get_transactions_by_month_and_type(self, account_id, month, type, **kwargs):
+        """
+        GET /accounts/{accountId}/transactions/month/{month}/type/{type} (getTransactionsByMonthAndType) - Fetch transactions by month and type for account
+
+        Args:
+            account_id (integer): path parameter 'accountId'.
+            month (string): path parameter 'month'.
+            type (string): path parameter 'type'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response (list[Transaction] JSON).
+        """
+        return self._send("GET", f"{self.base_url}/accounts/{_integer(account_id)}/transactions/month/{_string(month)}/type/{_string(type)}", "GET /accounts/{accountId}/transactions/month/{month}/type/{type}", None, kwargs)
+
+    def get_transactions_by_to_from_date(self, account_id, from_date, to_date, **kwargs):
+        """
+        GET /accounts/{accountId}/transactions/fromDate/{fromDate}/toDate/{toDate} (getTransactionsByToFromDate) - Fetch transactions for date range for account
+
+        Args:
+            account_id (integer): path parameter 'accountId'.
+            from_date (string): path parameter 'fromDate'.
+            to_date (string): path parameter 'toDate'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response (list[Transaction] JSON).
+        """
+        return self._send("GET", f"{self.base_url}/accounts/{_integer(account_id)}/transactions/fromDate/{_string(from_date)}/toDate/{_string(to_date)}", "GET /accounts/{accountId}/transactions/fromDate/{fromDate}/toDate/{toDate}", None, kwargs)
+
+    def get_transactions_on_date(self, account_id, on_date, **kwargs):
+        """
+        GET /accounts/{accountId}/transactions/onDate/{onDate} (getTransactionsOnDate) - Fetch transactions for a specific date for account
+
+        Args:
+            account_id (integer): path parameter 'accountId'.
+            on_date (string): path parameter 'onDate'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response (list[Transaction] JSON).
+        """
+        return self._send("GET", f"{self.base_url}/accounts/{_integer(account_id)}/transactions/onDate/{_string(on_date)}", "GET /accounts/{accountId}/transactions/onDate/{onDate}", None, kwargs)
+
+    def initialize_db(self, **kwargs):
+        """
+        POST /initializeDB (initializeDB) - Initialize the Database
+
+        Args:
+            None.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response.
+        """
+        return self._send("POST", f"{self.base_url}/initializeDB", "POST /initializeDB", None, kwargs)
+
+    def login(self, username, password, **kwargs):
+        """
+        GET /login/{username}/{password} (login) - Login (john/demo)
+
+        Args:
+            username (string): path parameter 'username'.
+            password (string): path parameter 'password'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response (Customer JSON).
+        """
+        return self._send("GET", f"{self.base_url}/login/{_string(username)}/{_string(password)}", "GET /login/{username}/{password}", None, kwargs)
+
+    def request_loan(self, customer_id, amount, down_payment, from_account_id, **kwargs):
+        """
+        POST /requestLoan (requestLoan) - Request a loan
+
+        Args:
+            customer_id (integer): query parameter 'customerId'.
+            amount (number): query parameter 'amount'.
+            down_payment (number): query parameter 'downPayment'.
+            from_account_id (integer): query parameter 'fromAccountId'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response (LoanResponse JSON).
+        """
+        return self._send("POST", f"{self.base_url}/requestLoan" + _query(_REQUEST_LOAN_QUERY, (customer_id, amount, down_payment, from_account_id)), "POST /requestLoan", None, kwargs)
+
+    def sell_position(self, customer_id, account_id, position_id, shares, price_per_share, **kwargs):
+        """
+        POST /customers/{customerId}/sellPosition (sellPosition) - Sell a Position
+
+        Args:
+            customer_id (integer): path parameter 'customerId'.
+            account_id (integer): query parameter 'accountId'.
+            position_id (integer): query parameter 'positionId'.
+            shares (integer): query parameter 'shares'.
+            price_per_share (number): query parameter 'pricePerShare'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response (list[Position] JSON).
+        """
+        return self._send("POST", f"{self.base_url}/customers/{_integer(customer_id)}/sellPosition" + _query(_SELL_POSITION_QUERY, (account_id, position_id, shares, price_per_share)), "POST /customers/{customerId}/sellPosition", None, kwargs)
+
+    def set_parameter(self, name, value, **kwargs):
+        """
+        POST /setParameter/{name}/{value} (setParameter) - Set Parameters
+
+        Args:
+            name (string): path parameter 'name'.
+            value (string): path parameter 'value'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response.
+        """
+        return self._send("POST", f"{self.base_url}/setParameter/{_string(name)}/{_string(value)}", "POST /setParameter/{name}/{value}", None, kwargs)
+
+    def shutdown_jms_listener(self, **kwargs):
+        """
+        POST /shutdownJmsListener (shutdownJmsListener) - Stop JMS Listener
+
+        Args:
+            None.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response.
+        """
+        return self._send("POST", f"{self.base_url}/shutdownJmsListener", "POST /shutdownJmsListener", None, kwargs)
+
+    def startup_jms_listener(self, **kwargs):
+        """
+        POST /startupJmsListener (startupJmsListener) - Start JMS Listener
+
+        Args:
+            None.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response.
+        """
+        return self._send("POST", f"{self.base_url}/startupJmsListener", "POST /startupJmsListener", None, kwargs)
+
+    def transfer(self, from_account_id, to_account_id, amount, **kwargs):
+        """
+        POST /transfer (transfer) - Transfer funds
+
+        Args:
+            from_account_id (integer): query parameter 'fromAccountId'.
+            to_account_id (integer): query parameter 'toAccountId'.
+            amount (number): query parameter 'amount'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response.
+        """
+        return self._send("POST", f"{self.base_url}/transfer" + _query(_TRANSFER_QUERY, (from_account_id, to_account_id, amount)), "POST /transfer", None, kwargs)
+
+    def update_customer(self, customer_id, first_name, last_name, street, city, state, zip_code, phone_number, ssn, username, password, **kwargs):
+        """
+        POST /customers/update/{customerId} (updateCustomer) - Update customer information
+
+        Args:
+            customer_id (integer): path parameter 'customerId'.
+            first_name (string): query parameter 'firstName'.
+            last_name (string): query parameter 'lastName'.
+            street (string): query parameter 'street'.
+            city (string): query parameter 'city'.
+            state (string): query parameter 'state'.
+            zip_code (string): query parameter 'zipCode'.
+            phone_number (string): query parameter 'phoneNumber'.
+            ssn (string): query parameter 'ssn'.
+            username (string): query parameter 'username'.
+            password (string): query parameter 'password'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response.
+        """
+        return self._send("POST", f"{self.base_url}/customers/update/{_integer(customer_id)}" + _query(_UPDATE_CUSTOMER_QUERY, (first_name, last_name, street, city, state, zip_code, phone_number, ssn, username, password)), "POST /customers/update/{customerId}", None, kwargs)
+
+    def withdraw(self, account_id, amount, **kwargs):
+        """
+        POST /withdraw (withdraw) - Withdraw funds
+
+        Args:
+            account_id (integer): query parameter 'accountId'.
+            amount (number): query parameter 'amount'.
+            **kwargs: Passed to the HTTP session (timeout, catch_response ...).
+
+        Returns:
+            The session's response.
+        """
+        return self._send("POST", f"{self.base_url}/withdraw" + _query(_WITHDRAW_QUERY, (account_id, amount)), "POST /withdraw", None, kwargs)
@@ -0,0 +1,494 @@
+"""
+Response models generated from the components/schemas of Tests/bank_api_swagger.yaml.
+
+DO NOT EDIT - regenerate with `python -m Tools.generate_parabank_client`.
+
+Each schema is a compact, immutable tuple-backed class (`__slots__ = ()`, fields exposed as properties, like a
+namedtuple). from_json() validates a decoded JSON object field by field (types, enums, required fields, nested
+objects) while building the instance; from_json_list() reads every object of a JSON array with one itemgetter
+call, validates each column with one set comparison and builds the rows at C speed, so large lists such as
+account transactions are checked and converted without per-field Python code. Models also support the dict-style reads existing callers use
+(`model.get("balance")`, `model["id"]`), keyed by the JSON field names.
+"""
+from itertools import repeat
+from operator import itemgetter
+
+
+class SchemaValidationError(ValueError):
+    """Raised when a response does not match its OpenAPI schema."""
+
+
+# Accepted value classes per OpenAPI type; the _OR_NULL variants are used for optional fields
+_NULL = type(None)
+_INTEGER = frozenset((int,))
+_NUMBER = frozenset((int, float))
+_STRING = frozenset((str,))
+_BOOLEAN = frozenset((bool,))
+_DATE_TIME = frozenset((str, int))  # Parabank serializes date-time fields as epoch milliseconds
+_INTEGER_OR_NULL = _INTEGER | {_NULL}
+_NUMBER_OR_NULL = _NUMBER | {_NULL}
+_STRING_OR_NULL = _STRING | {_NULL}
+_BOOLEAN_OR_NULL = _BOOLEAN | {_NULL}
+_DATE_TIME_OR_NULL = _DATE_TIME | {_NULL}
+_OBJECTS = frozenset((dict,))
+
+_new = tuple.__new__
+
+
+def _not_an_object(model, data):
+    raise SchemaValidationError(f"{model}: expected an object, got {type(data).__name__}")
+
+
+def _reject(model, data):
+    """
+    Slow path of from_json(), taken only when the combined fast check failed: finds the first invalid field
+    and raises a descriptive error.
+    """
+    for key, accepted, expected, required, is_enum in model._RULES:
+        value = data.get(key)
+        if value is None:
+            if required:
+                raise SchemaValidationError(f"{model.__name__}.{key}: required field is missing")
+            continue
+        if accepted is not None and (value if is_enum else value.__class__) not in accepted:
+            raise SchemaValidationError(f"{model.__name__}.{key}: expected {expected}, got {value!r}")
+    raise SchemaValidationError(f"{model.__name__}: invalid object {data!r}")
+
+
+class _Model(tuple):
+    """Base class of the generated models."""
+
+    __slots__ = ()
+    _FIELDS = {}  # JSON field name -> position
+    _KEYS = ()  # JSON field names in position order
+    _GETTER = None  # itemgetter(*_KEYS): reads every field of a JSON object into a tuple in one C call
+    _RULES = ()  # (JSON field name, accepted classes or enum values, expected, required, is enum) per position
+    _NESTED = False  # Whether any field holds another model (validated per object instead of per column)
+
+    @classmethod
+    def from_json(cls, data):
+        """Validates a decoded JSON object and builds the model; every generated model defines its own."""
+        raise NotImplementedError(f"{cls.__name__} has no generated from_json()")
+
+    @classmethod
+    def from_json_list(cls, data):
+        """Validates a JSON array of objects and builds one model per element."""
+        if data.__class__ is not list:
+            raise SchemaValidationError(f"list[{cls.__name__}]: expected an array, got {type(data).__name__}")
+        if cls._NESTED or cls._GETTER is None or not set(map(type, data)) <= _OBJECTS:
+            from_json = cls.from_json
+            return [from_json(item) for item in data]
+
+        try:
+            rows = list(map(cls._GETTER, data))
+        except KeyError:
+            keys = cls._KEYS  # Some objects omit optional fields
+            rows = [tuple(map(item.get, keys)) for item in data]
+
+        columns = zip(*rows)
+        for column, (_, accepted, _, _, is_enum) in zip(columns, cls._RULES):
+            if accepted is not None and not (set(column) if is_enum else set(map(type, column))) <= accepted:
+                for item in data:
+                    cls.from_json(item)  # Raises the descriptive error for the first invalid element
+        return list(map(_new, repeat(cls), rows))
+
+    def get(self, key, default=None):
+        """Dict-style read by JSON field name; missing and null fields return the default."""
+        position = self._FIELDS.get(key)
+        value = None if position is None else tuple.__getitem__(self, position)
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        if key.__class__ is int or key.__class__ is slice:
+            return tuple.__getitem__(self, key)
+        position = self._FIELDS.get(key)
+        if position is None:
+            raise KeyError(key)
+        return tuple.__getitem__(self, position)
+
+    def __contains__(self, key):
+        position = self._FIELDS.get(key)
+        return position is not None and tuple.__getitem__(self, position) is not None
+
+    def __eq__(self, other):
+        return type(other) is type(self) and tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = tuple.__hash__
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+    def to_dict(self):
+        """Converts the model back to its JSON representation (None fields omitted)."""
+        result = {}
+        for key, value in zip(self._KEYS, self):
+            if value is not None:
+                if isinstance(value, _Model):
+                    value = value.to_dict()
+                elif value.__class__ is list:
+                    value = [item.to_dict() if isinstance(item, _Model) else item for item in value]
+                result[key] = value
+        return result
+
+    def __repr__(self):
+        names = (name for name, value in type(self).__dict__.items() if isinstance(value, property))
+        return f"{type(self).__name__}({', '.join(f'{name}={value!r}' for name, value in zip(names, self))})"
+
+
+_ACCOUNT_TYPE_ENUM = frozenset(('CHECKING', 'SAVINGS', 'LOAN'))
+_ACCOUNT_TYPE_ENUM_OR_NULL = _ACCOUNT_TYPE_ENUM | {None}
+_TRANSACTION_TYPE_ENUM = frozenset(('Credit', 'Debit'))
+_TRANSACTION_TYPE_ENUM_OR_NULL = _TRANSACTION_TYPE_ENUM | {None}
+
+
+class Account(_Model):
+    """Account schema."""
+
+    __slots__ = ()
+    _FIELDS = {"id": 0, "customerId": 1, "type": 2, "balance": 3}
+    _KEYS = ("id", "customerId", "type", "balance")
+    _GETTER = itemgetter(*_KEYS)
+    _RULES = (
+        ("id", _INTEGER_OR_NULL, "integer", False, False),
+        ("customerId", _INTEGER_OR_NULL, "integer", False, False),
+        ("type", _ACCOUNT_TYPE_ENUM_OR_NULL, "one of CHECKING/SAVINGS/LOAN", False, True),
+        ("balance", _NUMBER_OR_NULL, "number", False, False),
+    )
+    _NESTED = False
+
+    id = property(itemgetter(0))
+    customer_id = property(itemgetter(1))
+    type = property(itemgetter(2))
+    balance = property(itemgetter(3))
+
+    def __new__(cls, id=None, customer_id=None, type=None, balance=None):
+        return _new(cls, (id, customer_id, type, balance))
+
+    @classmethod
+    def from_json(cls, data):
+        """Validates a decoded JSON object against the Account schema and builds the model."""
+        if data.__class__ is not dict:
+            _not_an_object("Account", data)
+        id, customer_id, type, balance = map(data.get, cls._KEYS)
+        if (id.__class__ not in _INTEGER_OR_NULL
+                or customer_id.__class__ not in _INTEGER_OR_NULL
+                or type not in _ACCOUNT_TYPE_ENUM_OR_NULL
+                or balance.__class__ not in _NUMBER_OR_NULL):
+            _reject(cls, data)
+        return _new(cls, (id, customer_id, type, balance))
+
+
+class Address(_Model):
+    """Address schema."""
+
+    __slots__ = ()
+    _FIELDS = {"street": 0, "city": 1, "state": 2, "zipCode": 3}
+    _KEYS = ("street", "city", "state", "zipCode")
+    _GETTER = itemgetter(*_KEYS)
+    _RULES = (
+        ("street", _STRING_OR_NULL, "string", False, False),
+        ("city", _STRING_OR_NULL, "string", False, False),
+        ("state", _STRING_OR_NULL, "string", False, False),
+        ("zipCode", _STRING_OR_NULL, "string", False, False),
+    )
+    _NESTED = False
+
+    street = property(itemgetter(0))
+    city = property(itemgetter(1))
+    state = property(itemgetter(2))
+    zip_code = property(itemgetter(3))
+
+    def __new__(cls, street=None, city=None, state=None, zip_code=None):
+        return _new(cls, (street, city, state, zip_code))
+
+    @classmethod
+    def from_json(cls, data):
+        """Validates a decoded JSON object against the Address schema and builds the model."""
+        if data.__class__ is not dict:
+            _not_an_object("Address", data)
+        street, city, state, zip_code = map(data.get, cls._KEYS)
+        if (street.__class__ not in _STRING_OR_NULL
+                or city.__class__ not in _STRING_OR_NULL
+                or state.__class__ not in _STRING_OR_NULL
+                or zip_code.__class__ not in _STRING_OR_NULL):
+            _reject(cls, data)
+        return _new(cls, (street, city, state, zip_code))
+
+
+class BillPayResult(_Model):
+    """BillPayResult schema."""
+
+    __slots__ = ()
+    _FIELDS = {"payeeName": 0, "amount": 1, "accountId": 2}
+    _KEYS = ("payeeName", "amount", "accountId")
+    _GETTER = itemgetter(*_KEYS)
+    _RULES = (
+        ("payeeName", _STRING_OR_NULL, "string", False, False),
+        ("amount", _NUMBER_OR_NULL, "number", False, False),
+        ("accountId", _INTEGER_OR_NULL, "integer", False, False),
+    )
+    _NESTED = False
+
+    payee_name = property(itemgetter(0))
+    amount = property(itemgetter(1))
+    account_id = property(itemgetter(2))
+
+    def __new__(cls, payee_name=None, amount=None, account_id=None):
+        return _new(cls, (payee_name, amount, account_id))
+
+    @classmethod
+    def from_json(cls, data):
+        """Validates a decoded JSON object against the BillPayResult schema and builds the model."""
+        if data.__class__ is not dict:
+            _not_an_object("BillPayResult", data)
+        payee_name, amount, account_id = map(data.get, cls._KEYS)
+        if (payee_name.__class__ not in _STRING_OR_NULL
+                or amount.__class__ not in _NUMBER_OR_NULL
+                or account_id.__class__ not in _INTEGER_OR_NULL):
+            _reject(cls, data)
+        return _new(cls, (payee_name, amount, account_id))
+
+
+class Customer(_Model):
+    """Customer schema."""
+
+    __slots__ = ()
+    _FIELDS = {"id": 0, "firstName": 1, "lastName": 2, "address": 3, "phoneNumber": 4, "ssn": 5}
+    _KEYS = ("id", "firstName", "lastName", "address", "phoneNumber", "ssn")
+    _GETTER = itemgetter(*_KEYS)
+    _RULES = (
+        ("id", _INTEGER_OR_NULL, "integer", False, False),
+        ("firstName", _STRING_OR_NULL, "string", False, False),
+        ("lastName", _STRING_OR_NULL, "string", False, False),
+        ("address", None, "Address", False, False),
+        ("phoneNumber", _STRING_OR_NULL, "string", False, False),
+        ("ssn", _STRING_OR_NULL, "string", False, False),
+    )
+    _NESTED = True
+
+    id = property(itemgetter(0))
+    first_name = property(itemgetter(1))
+    last_name = property(itemgetter(2))
+    address = property(itemgetter(3))
+    phone_number = property(itemgetter(4))
+    ssn = property(itemgetter(5))
+
+    def __new__(cls, id=None, first_name=None, last_name=None, address=None, phone_number=None, ssn=None):
+        return _new(cls, (id, first_name, last_name, address, phone_number, ssn))
+
+    @classmethod
+    def from_json(cls, data):
+        """Validates a decoded JSON object against the Customer schema and builds the model."""
+        if data.__class__ is not dict:
+            _not_an_object("Customer", data)
+        id, first_name, last_name, address, phone_number, ssn = map(data.get, cls._KEYS)
+        if (id.__class__ not in _INTEGER_OR_NULL
+                or first_name.__class__ not in _STRING_OR_NULL
+                or last_name.__class__ not in _STRING_OR_NULL
+                or phone_number.__class__ not in _STRING_OR_NULL
+                or ssn.__class__ not in _STRING_OR_NULL):
+            _reject(cls, data)
+        if address is not None:
+            address = Address.from_json(address)
+        return _new(cls, (id, first_name, last_name, address, phone_number, ssn))
+
+
+class HistoryPoint(_Model):
+    """HistoryPoint schema."""
+
+    __slots__ = ()
+    _FIELDS = {"symbol": 0, "date": 1, "closingPrice": 2}
+    _KEYS = ("symbol", "date", "closingPrice")
+    _GETTER = itemgetter(*_KEYS)
+    _RULES = (
+        ("symbol", _STRING_OR_NULL, "string", False, False),
+        ("date", _DATE_TIME_OR_NULL, "date-time", False, False),
+        ("closingPrice", _NUMBER_OR_NULL, "number", False, False),
+    )
+    _NESTED = False
+
+    symbol = property(itemgetter(0))
+    date = property(itemgetter(1))
+    closing_price = property(itemgetter(2))
+
+    def __new__(cls, symbol=None, date=None, closing_price=None):
+        return _new(cls, (symbol, date, closing_price))
+
+    @classmethod
+    def from_json(cls, data):
+        """Validates a decoded JSON object against the HistoryPoint schema and builds the model."""
+        if data.__class__ is not dict:
+            _not_an_object("HistoryPoint", data)
+        symbol, date, closing_price = map(data.get, cls._KEYS)
+        if (symbol.__class__ not in _STRING_OR_NULL
+                or date.__class__ not in _DATE_TIME_OR_NULL
+                or closing_price.__class__ not in _NUMBER_OR_NULL):
+            _reject(cls, data)
+        return _new(cls, (symbol, date, closing_price))
+
+
+class LoanResponse(_Model):
+    """LoanResponse schema."""
+
+    __slots__ = ()
+    _FIELDS = {"responseDate": 0, "loanProviderName": 1, "approved": 2, "message": 3, "accountId": 4}
+    _KEYS = ("responseDate", "loanProviderName", "approved", "message", "accountId")
+    _GETTER = itemgetter(*_KEYS)
+    _RULES = (
+        ("responseDate", _DATE_TIME_OR_NULL, "date-time", False, False),
+        ("loanProviderName", _STRING, "string", True, False),
+        ("approved", _BOOLEAN_OR_NULL, "boolean", False, False),
+        ("message", _STRING_OR_NULL, "string", False, False),
+        ("accountId", _INTEGER_OR_NULL, "integer", False, False),
+    )
+    _NESTED = False
+
+    response_date = property(itemgetter(0))
+    loan_provider_name = property(itemgetter(1))
+    approved = property(itemgetter(2))
+    message = property(itemgetter(3))
+    account_id = property(itemgetter(4))
+
+    def __new__(cls, response_date=None, loan_provider_name=None, approved=None, message=None, account_id=None):
+        return _new(cls, (response_date, loan_provider_name, approved, message, account_id))
+
+    @classmethod
+    def from_json(cls, data):
+        """Validates a decoded JSON object against the LoanResponse schema and builds the model."""
+        if data.__class__ is not dict:
+            _not_an_object("LoanResponse", data)
+        response_date, loan_provider_name, approved, message, account_id = map(data.get, cls._KEYS)
+        if (response_date.__class__ not in _DATE_TIME_OR_NULL
+                or loan_provider_name.__class__ not in _STRING
+                or approved.__class__ not in _BOOLEAN_OR_NULL
+                or message.__class__ not in _STRING_OR_NULL
+                or account_id.__class__ not in _INTEGER_OR_NULL):
+            _reject(cls, data)
+        return _new(cls, (response_date, loan_provider_name, approved, message, account_id))
+
+
+class Payee(_Model):
+    """Payee schema."""
+
+    __slots__ = ()
+    _FIELDS = {"name": 0, "address": 1, "phoneNumber": 2, "accountNumber": 3}
+    _KEYS = ("name", "address", "phoneNumber", "accountNumber")
+    _GETTER = itemgetter(*_KEYS)
+    _RULES = (
+        ("name", _STRING_OR_NULL, "string", False, False),
+        ("address", None, "Address", False, False),
+        ("phoneNumber", _STRING_OR_NULL, "string", False, False),
+        ("accountNumber", _INTEGER_OR_NULL, "integer", False, False),
+    )
+    _NESTED = True
+
+    name = property(itemgetter(0))
+    address = property(itemgetter(1))
+    phone_number = property(itemgetter(2))
+    account_number = property(itemgetter(3))
+
+    def __new__(cls, name=None, address=None, phone_number=None, account_number=None):
+        return _new(cls, (name, address, phone_number, account_number))
+
+    @classmethod
+    def from_json(cls, data):
+        """Validates a decoded JSON object against the Payee schema and builds the model."""
+        if data.__class__ is not dict:
+            _not_an_object("Payee", data)
+        name, address, phone_number, account_number = map(data.get, cls._KEYS)
+        if (name.__class__ not in _STRING_OR_NULL
+                or phone_number.__class__ not in _STRING_OR_NULL
+                or account_number.__class__ not in _INTEGER_OR_NULL):
+            _reject(cls, data)
+        if address is not None:
+            address = Address.from_json(address)
+        return _new(cls, (name, address, phone_number, account_number))
+
+
+class Position(_Model):
+    """Position schema."""
+
+    __slots__ = ()
+    _FIELDS = {"positionId": 0, "customerId": 1, "name": 2, "symbol": 3, "shares": 4, "purchasePrice": 5}
+    _KEYS = ("positionId", "customerId", "name", "symbol", "shares", "purchasePrice")
+    _GETTER = itemgetter(*_KEYS)
+    _RULES = (
+        ("positionId", _INTEGER_OR_NULL, "integer", False, False),
+        ("customerId", _INTEGER_OR_NULL, "integer", False, False),
+        ("name", _STRING_OR_NULL, "string", False, False),
+        ("symbol", _STRING_OR_NULL, "string", False, False),
+        ("shares", _INTEGER_OR_NULL, "integer", False, False),
+        ("purchasePrice", _NUMBER_OR_NULL, "number", False, False),
+    )
+    _NESTED = False
+
+    position_id = property(itemgetter(0))
+    customer_id = property(itemgetter(1))
+    name = property(itemgetter(2))
+    symbol = property(itemgetter(3))
+    shares = property(itemgetter(4))
+    purchase_price = property(itemgetter(5))
+
+    def __new__(cls, position_id=None, customer_id=None, name=None, symbol=None, shares=None, purchase_price=None):
+        return _new(cls, (position_id, customer_id, name, symbol, shares, purchase_price))
+
+    @classmethod
+    def from_json(cls, data):
+        """Validates a decoded JSON object against the Position schema and builds the model."""
+        if data.__class__ is not dict:
+            _not_an_object("Position", data)
+        position_id, customer_id, name, symbol, shares, purchase_price = map(data.get, cls._KEYS)
+        if (position_id.__class__ not in _INTEGER_OR_NULL
+                or customer_id.__class__ not in _INTEGER_OR_NULL
+                or name.__class__ not in _STRING_OR_NULL
+                or symbol.__class__ not in _STRING_OR_NULL
+                or shares.__class__ not in _INTEGER_OR_NULL
+                or purchase_price.__class__ not in _NUMBER_OR_NULL):
+            _reject(cls, data)
+        return _new(cls, (position_id, customer_id, name, symbol, shares, purchase_price))
+
+
+class Transaction(_Model):
+    """Transaction schema."""
+
+    __slots__ = ()
+    _FIELDS = {"id": 0, "accountId": 1, "type": 2, "date": 3, "amount": 4, "description": 5}
+    _KEYS = ("id", "accountId", "type", "date", "amount", "description")
+    _GETTER = itemgetter(*_KEYS)
+    _RULES = (
+        ("id", _INTEGER_OR_NULL, "integer", False, False),
+        ("accountId", _INTEGER_OR_NULL, "integer", False, False),
+        ("type", _TRANSACTION_TYPE_ENUM_OR_NULL, "one of Credit/Debit", False, True),
+        ("date", _DATE_TIME_OR_NULL, "date-time", False, False),
+        ("amount", _NUMBER_OR_NULL, "number", False, False),
+        ("description", _STRING_OR_NULL, "string", False, False),
+    )
+    _NESTED = False
+
+    id = property(itemgetter(0))
+    account_id = property(itemgetter(1))
+    type = property(itemgetter(2))
+    date = property(itemgetter(3))
+    amount = property(itemgetter(4))
+    description = property(itemgetter(5))
+
+    def __new__(cls, id=None, account_id=None, type=None, date=None, amount=None, description=None):
+        return _new(cls, (id, account_id, type, date, amount, description))
+
+    @classmethod
+    def from_json(cls, data):
+        """Validates a decoded JSON object against the Transaction schema and builds the model."""
+        if data.__class__ is not dict:
+            _not_an_object("Transaction", data)
+        id, account_id, type, date, amount, description = map(data.get, cls._KEYS)
+        if (id.__class__ not in _INTEGER_OR_NULL
+                or account_id.__class__ not in _INTEGER_OR_NULL
+                or type not in _TRANSACTION_TYPE_ENUM_OR_NULL
+                or date.__class__ not in _DATE_TIME_OR_NULL
+                or amount.__class__ not in _NUMBER_OR_NULL
+                or description.__class__ not in _STRING_OR_NULL):
+            _reject(cls, data)
+        return _new(cls, (id, account_id, type, date, amount, description))
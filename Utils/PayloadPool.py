@@ -0,0 +1,118 @@
+import os
+import json
+import time
+import itertools
+import threading
+from collections import namedtuple
+from faker import Faker
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard library encoder is used without it
+    orjson = None
+
+BillPayPayload = namedtuple("BillPayPayload", ["name", "body"])
+BillPayPayload.__doc__ = "A billpay Payee: the payee name (for assertions) and the request body as JSON bytes."
+
+
+def _dumps(data):
+    return orjson.dumps(data) if orjson is not None else json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+class PayloadPool:
+    """
+    Ring buffer of pre-generated, pre-serialized billpay payloads.
+
+    Creating a Faker instance and generating the payee fields costs far more CPU than sending the request, so the
+    Locust users and the tests draw payloads from this pool instead: next() only advances an index. The first
+    INITIAL_SIZE payloads are generated up front; with background=True the rest of the ring is generated by a
+    daemon thread (a greenlet under Locust) while next() cycles over what is ready. A seed makes the sequence
+    reproducible (PARABANK_PAYLOAD_SEED for the shared pool).
+    """
+
+    SIZE = 1000  # Payloads in the ring
+    INITIAL_SIZE = 50  # Payloads generated synchronously before a background fill takes over
+    SEED_ENV = "PARABANK_PAYLOAD_SEED"  # Seed of the shared pool, unseeded (random) when unset
+    FILL_YIELD_EVERY = 20  # Payloads generated between yields of the background fill
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, size=None, seed=None, background=False, locale=None):
+        """
+        Args:
+            size (int): Number of payloads in the ring.
+            seed (int): Seed for a reproducible payload sequence.
+            background (bool): Generate all but the first INITIAL_SIZE payloads in a background thread.
+            locale (str): Faker locale, e.g. "en_US".
+        """
+        self.size = size or self.SIZE
+        self.seed = seed
+        self._fake = Faker(locale)
+        if seed is not None:
+            self._fake.seed_instance(seed)
+        self._payloads = []
+        self._index = itertools.count()
+        self._filler = None
+
+        initial = min(self.INITIAL_SIZE, self.size) if background else self.size
+        self._payloads.extend(self._generate() for _ in range(initial))
+        if initial < self.size:
+            self._filler = threading.Thread(target=self._fill, name="PayloadPool-fill", daemon=True)
+            self._filler.start()
+
+    @classmethod
+    def shared(cls):
+        """Returns the process-wide pool (filled in the background), creating it on first use."""
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    seed = os.environ.get(cls.SEED_ENV)
+                    cls._shared = cls(seed=int(seed) if seed else None, background=True)
+        return cls._shared
+
+    def _generate(self):
+        fake = self._fake
+        name = fake.name()
+        payee = {
+            "name": name,
+            "address": {
+                "street": fake.street_address(),
+                "city": fake.city(),
+                "state": fake.state(),
+                "zipCode": fake.zipcode()
+            },
+            "phoneNumber": fake.phone_number(),
+            "accountNumber": fake.random_int(15000, 30000)
+        }
+        return BillPayPayload(name, _dumps(payee))
+
+    def _fill(self):
+        for count in range(len(self._payloads), self.size):
+            self._payloads.append(self._generate())  # list.append is atomic, next() sees a consistent prefix
+            if count % self.FILL_YIELD_EVERY == 0:
+                time.sleep(0)  # Let request greenlets run while the ring fills under Locust
+
+    def next(self):
+        """
+        Returns the next payload of the ring (thread-safe, wraps around).
+
+        Returns:
+            BillPayPayload: Payee name and JSON body bytes, sent as-is by ParabankClient.bill_pay.
+        """
+        payloads = self._payloads
+        return payloads[next(self._index) % len(payloads)]
+
+    def wait_filled(self, timeout=None):
+        """
+        Waits for the background fill to finish.
+
+        Returns:
+            bool: True if every payload of the ring has been generated.
+        """
+        if self._filler is not None:
+            self._filler.join(timeout)
+        return len(self._payloads) == self.size
+
+    def __len__(self):
+        return len(self._payloads)
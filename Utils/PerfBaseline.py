@@ -0,0 +1,275 @@
+import os
+import re
+import json
+import argparse
+import platform
+from datetime import datetime
+from urllib.parse import urlsplit
+from collections import namedtuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+Regression = namedtuple("Regression", ["endpoint", "metric", "baseline", "current", "change", "limit"])
+
+
+class PerfRegressionError(AssertionError):
+    """Raised when a run is slower than its stored baseline beyond the allowed thresholds."""
+
+
+class PerfBaselineMissingError(LookupError):
+    """Raised when a scenario is checked against a target that has no recorded baseline and no update was requested."""
+
+
+class PerfBaseline:
+    """
+    Stored per-endpoint performance baseline of one fixed scenario, and the regression check against it.
+
+    A baseline is a JSON file in Tests/Performance/baselines/<scenario>.<target>.json holding p50/p95/p99 latency,
+    throughput and error rate per endpoint, plus the thresholds the scenario is checked with. The target ("mock" or
+    the Parabank host) is part of the file name, so a run against the mock is never compared with a recording of a
+    real server. It is versioned twice: in git,
+    and with a "version" counter bumped on every update, so a diff shows which recording a run was compared to.
+    Results come from LatencyStats (pytest) or from Locust's stats (from_locust).
+    """
+
+    BASELINE_DIR = os.path.join(PROJECT_ROOT, "Tests", "Performance", "baselines")
+    UPDATE_ENV = "PARABANK_UPDATE_BASELINE"  # "1" records the run as the new baseline instead of checking it
+    PERCENTILES = (50, 95, 99)
+    METRICS = ("p50_ms", "p95_ms", "p99_ms", "rps", "error_rate")
+    # Allowed relative change per metric: latencies may grow by, throughput may drop by this fraction. The error
+    # rate is compared absolutely: it may grow by this many failed requests per request (0.01 = 1 point)
+    THRESHOLDS = {"p50_ms": 0.20, "p95_ms": 0.25, "p99_ms": 0.35, "rps": 0.15, "error_rate": 0.01}
+    MIN_DELTA_MS = 5.0  # Latency increases smaller than this are noise, whatever the relative change
+    MIN_SAMPLES = 20  # Endpoints with fewer requests in either run are reported but not checked
+
+    def __init__(self, scenario, target, path=None, thresholds=None):
+        """
+        Args:
+            scenario (str): Scenario name, the first part of the baseline file name.
+            target (str): What the scenario ran against, "mock" or a target_of(url) name; the second part.
+            path (str): Baseline file; defaults to BASELINE_DIR/<scenario>.<target>.json.
+            thresholds (dict): Per-metric overrides of the stored and default thresholds, e.g. {"p95_ms": 0.5}.
+        """
+        self.scenario = scenario
+        self.target = target
+        self.path = path or os.path.join(self.BASELINE_DIR, f"{scenario}.{target}.json")
+        self.overrides = dict(thresholds or {})
+        unknown = set(self.overrides) - set(self.METRICS)
+        if unknown:
+            raise ValueError(f"Unknown threshold metric(s) {sorted(unknown)}, expected {list(self.METRICS)}")
+
+    @staticmethod
+    def target_of(url):
+        """Baseline target name of a Parabank URL: its host and port, e.g. "localhost_8090"."""
+        return re.sub(r"[^A-Za-z0-9.-]+", "_", urlsplit(url).netloc or url)
+
+    @classmethod
+    def parse_threshold(cls, text):
+        """
+        Parses a METRIC=FRACTION threshold override; usable as an argparse type, so bad values fail option parsing.
+
+        Returns:
+            tuple: (metric, fraction).
+
+        Raises:
+            argparse.ArgumentTypeError: If the metric is unknown or the fraction is not a non-negative number.
+        """
+        metric, _, fraction = text.partition("=")
+        metric = metric.strip()
+        if metric not in cls.METRICS:
+            raise argparse.ArgumentTypeError(f"unknown metric in '{text}', expected one of {list(cls.METRICS)}")
+        try:
+            value = float(fraction)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"'{text}' is not METRIC=FRACTION, e.g. p95_ms=0.5")
+        if not value >= 0:
+            raise argparse.ArgumentTypeError(f"threshold in '{text}' must be a non-negative number")
+        return metric, value
+
+    @staticmethod
+    def from_latency_stats(stats_by_endpoint, duration):
+        """
+        Builds results from LatencyStats data.
+
+        Args:
+            stats_by_endpoint (dict): {endpoint: EndpointStats}, e.g. LatencyStats.test_stats(node_id).
+            duration (float): Wall time of the scenario in seconds, for the throughput.
+
+        Returns:
+            dict: {endpoint: {"count", "failures", "p50_ms", "p95_ms", "p99_ms", "rps", "error_rate"}}.
+        """
+        results = {}
+        for endpoint, stats in stats_by_endpoint.items():
+            result = {"count": stats.count,
+                      "failures": sum(count for status, count in stats.status_codes.items() if not 0 < status < 400)}
+            for pct in PerfBaseline.PERCENTILES:
+                result[f"p{pct}_ms"] = round(stats.percentile("total", pct), 2)
+            result["rps"] = round(stats.count / duration, 2) if duration else 0.0
+            result["error_rate"] = PerfBaseline._error_rate(result)
+            results[endpoint] = result
+        return results
+
+    @staticmethod
+    def from_locust(stats):
+        """
+        Builds results from a Locust RequestStats (environment.stats), keyed "METHOD name".
+
+        Returns:
+            dict: {endpoint: {"count", "failures", "p50_ms", "p95_ms", "p99_ms", "rps", "error_rate"}}.
+        """
+        results = {}
+        for (name, method), entry in stats.entries.items():
+            if not entry.num_requests:
+                continue
+            result = {"count": entry.num_requests, "failures": entry.num_failures}
+            for pct in PerfBaseline.PERCENTILES:
+                result[f"p{pct}_ms"] = float(entry.get_response_time_percentile(pct / 100))
+            result["rps"] = round(entry.total_rps, 2)
+            result["error_rate"] = PerfBaseline._error_rate(result)
+            results[f"{method} {name}"] = result
+        return results
+
+    @staticmethod
+    def _error_rate(result):
+        """Failed requests per request of one endpoint's result (also for baselines recorded without error_rate)."""
+        if "error_rate" in result:
+            return result["error_rate"]
+        return round(result.get("failures", 0) / result["count"], 4) if result.get("count") else 0.0
+
+    def load(self):
+        """Returns the stored baseline document, or None if the scenario has none yet."""
+        try:
+            with open(self.path) as baseline_file:
+                return json.load(baseline_file)
+        except FileNotFoundError:
+            return None
+
+    def thresholds(self, baseline=None):
+        """Effective thresholds: class defaults, then the baseline file's, then the constructor overrides."""
+        stored = (baseline or {}).get("thresholds", {})
+        return {**self.THRESHOLDS, **stored, **self.overrides}
+
+    def save(self, results, notes=None):
+        """
+        Records results as the scenario's new baseline, bumping its version.
+
+        Returns:
+            dict: The written baseline document.
+        """
+        previous = self.load() or {}
+        document = {
+            "scenario": self.scenario,
+            "target": self.target,
+            "version": previous.get("version", 0) + 1,
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+            "host": platform.node(),
+            "python": platform.python_version(),
+            "notes": notes or previous.get("notes", ""),
+            "thresholds": previous.get("thresholds", dict(self.THRESHOLDS)),
+            "endpoints": {endpoint: results[endpoint] for endpoint in sorted(results)}
+        }
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w") as baseline_file:
+            json.dump(document, baseline_file, indent=2)
+            baseline_file.write("\n")
+        return document
+
+    def compare(self, results, baseline=None):
+        """
+        Compares results against the baseline.
+
+        Returns:
+            list: Regression tuples; change and limit are relative (0.3 = +30%), absolute for error_rate (0.02 = two
+            more failures per 100 requests), change is None for an endpoint missing from the run.
+        """
+        baseline = baseline or self.load() or {}
+        thresholds = self.thresholds(baseline)
+        regressions = []
+        for endpoint, expected in baseline.get("endpoints", {}).items():
+            actual = results.get(endpoint)
+            if actual is None:
+                regressions.append(Regression(endpoint, "count", expected["count"], 0, None, None))
+                continue
+            if min(actual["count"], expected["count"]) < self.MIN_SAMPLES:
+                continue
+            before, after, limit = self._error_rate(expected), self._error_rate(actual), thresholds.get("error_rate")
+            if limit is not None and after - before > limit:
+                regressions.append(Regression(endpoint, "error_rate", before, after, after - before, limit))
+            for metric in self.METRICS:
+                before, after, limit = expected.get(metric), actual.get(metric), thresholds.get(metric)
+                if metric == "error_rate" or not before or after is None or limit is None:
+                    continue
+                change = (after - before) / before
+                if metric == "rps":
+                    if change < -limit:
+                        regressions.append(Regression(endpoint, metric, before, after, change, -limit))
+                elif change > limit and after - before >= self.MIN_DELTA_MS:
+                    regressions.append(Regression(endpoint, metric, before, after, change, limit))
+        return regressions
+
+    def format_diff(self, results, regressions, baseline=None):
+        """Renders every endpoint and metric side by side with the baseline, marking the regressions."""
+        baseline = baseline or self.load() or {}
+        flagged = {(regression.endpoint, regression.metric) for regression in regressions}
+        lines = [
+            f"Scenario '{self.scenario}' on {self.target} against baseline v{baseline.get('version', '-')} "
+            f"({baseline.get('recorded_at', 'never recorded')})",
+            f"{'Endpoint':<44}{'Metric':<12}{'Baseline':>10}{'Current':>10}{'Change':>9}"
+        ]
+        for endpoint in sorted(set(baseline.get("endpoints", {})) | set(results)):
+            expected = baseline.get("endpoints", {}).get(endpoint, {})
+            actual = results.get(endpoint, {})
+            if (endpoint, "count") in flagged:
+                lines.append(f"{endpoint:<44}{'count':<12}{expected['count']:>10}{'missing':>10}{'':>9}  REGRESSION")
+                continue
+            for metric in self.METRICS:
+                if metric == "error_rate":
+                    before = self._error_rate(expected) if expected else None
+                    after = self._error_rate(actual) if actual else None
+                    change = f"{after - before:+.1%}" if before is not None and after is not None else ""
+                else:
+                    before, after = expected.get(metric), actual.get(metric)
+                    change = f"{(after - before) / before:+.1%}" if before and after is not None else ""
+                marker = "  REGRESSION" if (endpoint, metric) in flagged else ""
+                lines.append(f"{endpoint:<44}{metric:<12}{self._cell(metric, before)}{self._cell(metric, after)}"
+                             f"{change:>9}{marker}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _cell(metric, value):
+        if value is None:
+            return f"{'-':>10}"
+        return f"{value:>10.2%}" if metric == "error_rate" else f"{value:>10.1f}"
+
+    def check(self, results, update=None, notes=None):
+        """
+        Checks results against the baseline, or records them as the new baseline when an update is requested.
+
+        Args:
+            results (dict): Output of from_latency_stats or from_locust.
+            update (bool): Record instead of checking; defaults to PARABANK_UPDATE_BASELINE=1.
+            notes (str): Free text stored with a recorded baseline.
+
+        Returns:
+            str: The readable diff (or a note that the baseline was recorded).
+
+        Raises:
+            PerfBaselineMissingError: If the target has no baseline for the scenario and no update was requested.
+            PerfRegressionError: If any metric regressed beyond its threshold; the message holds the diff.
+        """
+        if update is None:
+            update = os.environ.get(self.UPDATE_ENV) == "1"
+        baseline = self.load()
+        if baseline is None and not update:
+            raise PerfBaselineMissingError(
+                f"No baseline for '{self.scenario}' on {self.target} ({self.path}); record one with "
+                f"{self.UPDATE_ENV}=1"
+            )
+        if update:
+            document = self.save(results, notes)
+            return f"Recorded baseline v{document['version']} for '{self.scenario}' on {self.target} in {self.path}"
+        regressions = self.compare(results, baseline)
+        diff = self.format_diff(results, regressions, baseline)
+        if regressions:
+            raise PerfRegressionError(f"{len(regressions)} performance regression(s)\n{diff}")
+        return diff
@@ -0,0 +1,101 @@
+import time
+import requests
+from Utils.BaseClass import BaseClass
+from Utils.BankAPIBase import BankAPIBase
+
+
+class Readiness(BaseClass):
+    """
+    Polls Parabank and HSQLDB with exponential backoff until they answer, instead of sleeping a fixed time.
+
+    A probe is a callable returning a truthy value once the service is ready; exceptions count as "not ready
+    yet". The first probe runs immediately and the delay between probes doubles from INITIAL_DELAY up to
+    MAX_DELAY, so a service that is already up costs one round trip and a restarting one is noticed within
+    MAX_DELAY of becoming ready.
+    """
+
+    TIMEOUT = 60  # Seconds before a wait gives up
+    INITIAL_DELAY = 0.05  # Seconds before the second probe
+    MAX_DELAY = 1.0  # Longest pause between probes
+    BACKOFF = 2.0  # Delay multiplier per failed probe
+    PROBE_TIMEOUT = 5  # Seconds a single HTTP probe may take
+    READY_CUSTOMER_ID = 12212  # Parabank's demo customer, present after initializeDB and cleanDB
+
+    @classmethod
+    def wait_until(cls, probe, name, timeout=None, initial_delay=None, max_delay=None):
+        """
+        Calls probe until it returns a truthy value.
+
+        Args:
+            probe (callable): Readiness check without arguments.
+            name (str): What is being waited for, for logs and the timeout error.
+            timeout (float): Seconds to wait (defaults to TIMEOUT).
+            initial_delay (float): First pause between probes (defaults to INITIAL_DELAY).
+            max_delay (float): Longest pause between probes (defaults to MAX_DELAY).
+
+        Returns:
+            float: Seconds until the probe succeeded.
+
+        Raises:
+            TimeoutError: If the probe did not succeed in time; the message holds the last probe error.
+        """
+        log = cls.get_logger()
+        timeout = cls.TIMEOUT if timeout is None else timeout
+        delay = cls.INITIAL_DELAY if initial_delay is None else initial_delay
+        max_delay = cls.MAX_DELAY if max_delay is None else max_delay
+        start = time.monotonic()
+        attempts, last_error = 0, None
+        while True:
+            attempts += 1
+            try:
+                if probe():
+                    elapsed = time.monotonic() - start
+                    log.info(f"{name} ready after {elapsed:.2f}s ({attempts} probe(s))")
+                    return elapsed
+                last_error = None
+            except Exception as e:
+                last_error = e
+            remaining = timeout - (time.monotonic() - start)
+            if remaining <= 0:
+                raise TimeoutError(f"{name} not ready after {timeout}s ({attempts} probes). Last error: {last_error}")
+            time.sleep(min(delay, remaining))
+            delay = min(delay * cls.BACKOFF, max_delay)
+
+    @classmethod
+    def http_probe(cls, url=None):
+        """
+        Returns a probe that succeeds once the Parabank API answers 200.
+
+        Args:
+            url (str): URL to GET; defaults to the demo customer under the current BankAPIBase base URL.
+        """
+        url = url or f"{BankAPIBase.base_url}/customers/{cls.READY_CUSTOMER_ID}"
+
+        def probe():
+            # A bare request: probes must not go through the retrying client or into the latency statistics
+            return requests.get(url, headers={"accept": "application/json"}, timeout=cls.PROBE_TIMEOUT).ok
+        return probe
+
+    @classmethod
+    def db_probe(cls):
+        """Returns a probe that succeeds once HSQLDB answers and the ACCOUNT table holds data."""
+        def probe():
+            return cls.execute_db_query("SELECT COUNT(*) FROM PUBLIC.ACCOUNT")[0][0] > 0
+        return probe
+
+    @classmethod
+    def wait_for_parabank(cls, timeout=None, database=True):
+        """
+        Waits until the Parabank API and (optionally) HSQLDB are ready.
+
+        Args:
+            timeout (float): Seconds to wait for each of them (defaults to TIMEOUT).
+            database (bool): Also wait for the JDBC endpoint.
+
+        Returns:
+            float: Total seconds waited.
+        """
+        elapsed = cls.wait_until(cls.http_probe(), "Parabank API", timeout)
+        if database:
+            elapsed += cls.wait_until(cls.db_probe(), "HSQLDB", timeout)
+        return elapsed
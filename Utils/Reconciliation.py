@@ -0,0 +1,290 @@
+import json
+import time
+import random
+from array import array
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from Utils.BankAPIBase import BankAPIBase
+
+try:
+    import numpy
+except ImportError:  # numpy is optional; the array module and plain loops are used without it
+    numpy = None
+
+Mismatch = namedtuple("Mismatch", ["account_id", "check", "expected", "actual"])
+Mismatch.__doc__ = "One inconsistency found by a reconciliation: the account, the check that failed and both values."
+
+
+class Ledger:
+    """
+    Per-account DB state of one moment: balances and transaction sums in parallel arrays indexed by position.
+
+    ids is sorted, so an account's position is found by binary search (vectorized with numpy). offset is
+    balance - (credits - debits): the part of the balance not explained by the TRANSACTION table. Parabank's seed
+    data starts with arbitrary offsets, but every operation changes a balance and writes matching transactions,
+    so an account's offset must not change during a run.
+    """
+
+    __slots__ = ("ids", "balances", "net", "counts", "orphans", "_index")
+
+    def __init__(self, ids, balances, net, counts, orphans=0):
+        self.ids = ids
+        self.balances = balances
+        self.net = net
+        self.counts = counts
+        self.orphans = orphans  # Transactions whose account is not in the ACCOUNT table
+        self._index = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def position(self, account_id):
+        """Index of an account in the arrays, or None if it is unknown."""
+        if self._index is None:
+            self._index = {int(account_id): position for position, account_id in enumerate(self.ids)}
+        return self._index.get(account_id)
+
+    def offset(self, position):
+        return float(self.balances[position]) - float(self.net[position])
+
+    def offsets(self):
+        """Returns {account_id: offset}."""
+        return {int(account_id): round(self.offset(position), 2) for position, account_id in enumerate(self.ids)}
+
+
+class ReconciliationReport:
+    """Outcome of Reconciliation.run(): the mismatches, what was checked and how long each phase took."""
+
+    def __init__(self, ledger, mismatches, sampled, timings):
+        self.ledger = ledger
+        self.mismatches = mismatches
+        self.sampled = sampled
+        self.timings = timings
+
+    @property
+    def ok(self):
+        return not self.mismatches
+
+    def summary(self):
+        """Renders the counts, phase timings and the first mismatches as text."""
+        lines = [
+            f"Reconciled {len(self.ledger)} accounts and {int(sum(self.ledger.counts))} transactions "
+            f"({self.ledger.orphans} orphaned); {self.sampled} API balances sampled; "
+            f"{len(self.mismatches)} mismatch(es)",
+            "Timings: " + ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in self.timings.items())
+        ]
+        for mismatch in self.mismatches[:Reconciliation.REPORT_LIMIT]:
+            lines.append(f"  account {mismatch.account_id:<10} {mismatch.check:<8} "
+                         f"expected {mismatch.expected!s:>14} actual {mismatch.actual!s:>14}")
+        if len(self.mismatches) > Reconciliation.REPORT_LIMIT:
+            lines.append(f"  ... and {len(self.mismatches) - Reconciliation.REPORT_LIMIT} more")
+        return "\n".join(lines)
+
+
+class Reconciliation(BankAPIBase):
+    """
+    Bulk end-of-run consistency check of HSQLDB against itself and against the API.
+
+    The ACCOUNT and TRANSACTION tables are streamed in batches (iter_db_query), transaction amounts are summed
+    per account with vectorized arithmetic (numpy.bincount when numpy is installed, typed arrays otherwise), and
+    three checks run over the result:
+
+        - "ledger":  an account's offset (balance minus net transactions) changed since the `before` snapshot,
+                     i.e. a balance moved without a matching transaction or the other way round
+        - "api":     a sampled account's API balance differs from its DB balance
+        - "missing": an account of the `before` snapshot or of the API sample is gone from the DB
+    """
+
+    ACCOUNT_QUERY = "SELECT ID, BALANCE FROM PUBLIC.ACCOUNT ORDER BY ID"
+    TRANSACTION_QUERY = "SELECT ACCOUNT_ID, TYPE, AMOUNT FROM PUBLIC.TRANSACTION"
+    CREDIT = 0  # TRANSACTION.TYPE codes
+    DEBIT = 1
+    BATCH_SIZE = 10000  # Rows fetched and summed per batch
+    SAMPLE_SIZE = 500  # Accounts whose balance is read through the API
+    API_WORKERS = 16  # Concurrent API balance reads
+    TOLERANCE = 0.005  # Amounts are compared to the cent
+    REPORT_LIMIT = 50  # Mismatches listed by ReconciliationReport.summary()
+
+    def __init__(self, batch_size=None, tolerance=None):
+        """
+        Args:
+            batch_size (int): Rows fetched and summed per batch.
+            tolerance (float): Largest difference treated as equal.
+        """
+        self.batch_size = batch_size or self.BATCH_SIZE
+        self.tolerance = self.TOLERANCE if tolerance is None else tolerance
+
+    def _batches(self, query):
+        rows = self.iter_db_query(query, batch_size=self.batch_size)
+        while True:
+            batch = list(islice(rows, self.batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def load_accounts(self):
+        """
+        Streams the ACCOUNT table.
+
+        Returns:
+            tuple: (sorted account IDs, balances) as numpy arrays, or array('q') / array('d') without numpy.
+        """
+        ids, balances = array("q"), array("d")
+        for batch in self._batches(self.ACCOUNT_QUERY):
+            account_ids, account_balances = zip(*batch)
+            ids.extend(account_ids)
+            balances.extend(float(balance) for balance in account_balances)
+        if numpy is not None:
+            return numpy.frombuffer(ids, dtype=numpy.int64), numpy.frombuffer(balances, dtype=numpy.float64)
+        return ids, balances
+
+    def _sum_transactions_numpy(self, ids):
+        net = numpy.zeros(len(ids))
+        counts = numpy.zeros(len(ids), dtype=numpy.int64)
+        orphans = 0
+        for batch in self._batches(self.TRANSACTION_QUERY):
+            account_ids, types, amounts = zip(*batch)
+            account_ids = numpy.fromiter(account_ids, dtype=numpy.int64, count=len(batch))
+            signs = numpy.where(numpy.fromiter(types, dtype=numpy.int64, count=len(batch)) == self.DEBIT, -1.0, 1.0)
+            amounts = numpy.fromiter((float(amount) for amount in amounts), dtype=numpy.float64, count=len(batch))
+            positions = numpy.searchsorted(ids, account_ids)
+            known = positions < len(ids)
+            known[known] = ids[positions[known]] == account_ids[known]
+            orphans += int(len(batch) - known.sum())
+            positions = positions[known]
+            net += numpy.bincount(positions, weights=signs[known] * amounts[known], minlength=len(ids))
+            counts += numpy.bincount(positions, minlength=len(ids))
+        return net, counts, orphans
+
+    def _sum_transactions_array(self, ids):
+        index = {account_id: position for position, account_id in enumerate(ids)}
+        net = array("d", bytes(8 * len(ids)))
+        counts = array("q", bytes(8 * len(ids)))
+        orphans = 0
+        for batch in self._batches(self.TRANSACTION_QUERY):
+            for account_id, kind, amount in batch:
+                position = index.get(account_id)
+                if position is None:
+                    orphans += 1
+                    continue
+                net[position] += -float(amount) if kind == self.DEBIT else float(amount)
+                counts[position] += 1
+        return net, counts, orphans
+
+    def ledger(self):
+        """
+        Builds the current Ledger from the DB.
+
+        Returns:
+            Ledger: Balances, net transaction sums and transaction counts per account.
+        """
+        log = self.get_logger()
+        try:
+            ids, balances = self.load_accounts()
+            if numpy is not None:
+                net, counts, orphans = self._sum_transactions_numpy(ids)
+            else:
+                net, counts, orphans = self._sum_transactions_array(ids)
+            return Ledger(ids, balances, net, counts, orphans)
+        except Exception as e:
+            log.error(f"Failed to load the account ledger from the database: {e}")
+            raise
+
+    @staticmethod
+    def save_offsets(path, ledger):
+        """Writes a ledger's per-account offsets as the `before` snapshot of a later run."""
+        with open(path, "w") as snapshot_file:
+            json.dump({str(account_id): offset for account_id, offset in ledger.offsets().items()}, snapshot_file)
+
+    @staticmethod
+    def load_offsets(path):
+        """Reads a snapshot written by save_offsets, as {account_id: offset}."""
+        with open(path) as snapshot_file:
+            return {int(account_id): offset for account_id, offset in json.load(snapshot_file).items()}
+
+    def check_ledger(self, ledger, before):
+        """
+        Compares the ledger's offsets with a `before` snapshot.
+
+        Args:
+            ledger (Ledger): The current state.
+            before (dict): {account_id: offset}, from Ledger.offsets() or load_offsets().
+
+        Returns:
+            list: Mismatch tuples ("ledger" and "missing").
+        """
+        mismatches = []
+        for account_id, expected in before.items():
+            position = ledger.position(account_id)
+            if position is None:
+                mismatches.append(Mismatch(account_id, "missing", expected, None))
+                continue
+            actual = round(ledger.offset(position), 2)
+            if abs(actual - expected) > self.tolerance:
+                mismatches.append(Mismatch(account_id, "ledger", expected, actual))
+        return mismatches
+
+    def check_api(self, ledger, account_ids, workers=None):
+        """
+        Reads account balances through the API concurrently and compares them with the ledger.
+
+        Returns:
+            list: Mismatch tuples ("api" and "missing").
+        """
+        def read(account_id):
+            try:
+                return account_id, self.get_account_balance(account_id)
+            except Exception as e:
+                return account_id, e
+
+        mismatches = []
+        with ThreadPoolExecutor(max_workers=workers or self.API_WORKERS) as executor:
+            for account_id, balance in executor.map(read, account_ids):
+                position = ledger.position(account_id)
+                if position is None:
+                    mismatches.append(Mismatch(account_id, "missing", None, balance))
+                    continue
+                expected = float(ledger.balances[position])
+                if isinstance(balance, Exception) or abs(balance - expected) > self.tolerance:
+                    mismatches.append(Mismatch(account_id, "api", expected, balance))
+        return mismatches
+
+    def run(self, before=None, sample_size=None, account_ids=None, seed=None):
+        """
+        Loads the ledger and runs the checks.
+
+        Args:
+            before (dict): {account_id: offset} snapshot taken before the run; without it the ledger check is
+                skipped.
+            sample_size (int): Accounts checked through the API (defaults to SAMPLE_SIZE; 0 skips the check).
+            account_ids (iterable): Accounts to sample from; defaults to every account in the DB.
+            seed (int): Seed of the sample, for a reproducible selection.
+
+        Returns:
+            ReconciliationReport: The mismatches and statistics.
+        """
+        log = self.get_logger()
+        timings = {}
+        start = time.perf_counter()
+        ledger = self.ledger()
+        timings["ledger"] = time.perf_counter() - start
+
+        mismatches = []
+        if before is not None:
+            start = time.perf_counter()
+            mismatches += self.check_ledger(ledger, before)
+            timings["ledger check"] = time.perf_counter() - start
+
+        sample_size = self.SAMPLE_SIZE if sample_size is None else sample_size
+        candidates = [row[0] if isinstance(row, (tuple, list)) else row for row in account_ids] \
+            if account_ids is not None else [int(account_id) for account_id in ledger.ids]
+        sample = random.Random(seed).sample(candidates, min(sample_size, len(candidates)))
+        if sample:
+            start = time.perf_counter()
+            mismatches += self.check_api(ledger, sample)
+            timings["api check"] = time.perf_counter() - start
+
+        report = ReconciliationReport(ledger, mismatches, len(sample), timings)
+        (log.info if report.ok else log.error)(report.summary())
+        return report
@@ -0,0 +1,77 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from Utils.BankAPIBase import BankAPIBase
+from Utils.LatencyStats import LatencyStats
+from Utils.Readiness import Readiness
+
+
+class Warmup(BankAPIBase):
+    """
+    Readiness and warmup stage run before functional and load runs.
+
+    Waits until the Parabank API and the JDBC endpoint answer (Readiness, exponential backoff), opens the JDBC
+    pool's connections, then sends a burst of reads (account balance and details, customer details), so
+    Parabank's JIT, connection and cache paths are hot before anything is measured. The burst is recorded as
+    warmup traffic (LatencyStats.warmup()) and never reaches the session or per-test latency statistics.
+
+    The burst is read-only: every xdist worker runs it at session start on the shared test accounts, where any
+    write (even a net-zero deposit and withdrawal) would race with the balance assertions of other workers' tests.
+    """
+
+    BURST = 5  # Rounds over the read endpoints
+    WORKERS = 8  # Concurrent warmup calls
+
+    def _round(self, account_id):
+        """One pass over the read endpoints, recorded as warmup traffic; returns the number of calls made."""
+        with LatencyStats.warmup():
+            return self._calls(account_id)
+
+    def _calls(self, account_id):
+        self.get_account_balance(account_id)
+        self.get_account_by_id(account_id)
+        self.get_customer_details(self.CUSTOMER_ID[0][0])
+        return 3
+
+    def warm_db_pool(self):
+        """Opens the JDBC pool's connections with concurrent trivial queries."""
+        with ThreadPoolExecutor(max_workers=self.DB_POOL_MAX_SIZE) as executor:
+            list(executor.map(lambda _: self.execute_db_query("SELECT COUNT(*) FROM PUBLIC.ACCOUNT"),
+                              range(self.DB_POOL_MAX_SIZE)))
+
+    def run(self, burst=None, workers=None, database=True, timeout=None):
+        """
+        Runs the readiness checks and the warmup burst.
+
+        Args:
+            burst (int): Rounds over the read endpoints (defaults to BURST; 0 only checks readiness and warms the
+                JDBC pool, without loading the test data).
+            workers (int): Concurrent rounds (defaults to WORKERS).
+            database (bool): Also wait for HSQLDB and warm the JDBC pool.
+            timeout (float): Seconds each readiness check may take (defaults to Readiness.TIMEOUT).
+
+        Returns:
+            dict: "ready_s", "warmup_s", "calls" and "errors" (failed rounds; they are logged, not raised).
+
+        Raises:
+            TimeoutError: If Parabank or HSQLDB did not become ready.
+        """
+        log = self.get_logger()
+        burst = self.BURST if burst is None else burst
+        result = {"ready_s": Readiness.wait_for_parabank(timeout, database=database), "calls": 0, "errors": 0}
+
+        start = time.perf_counter()
+        if database:
+            self.warm_db_pool()
+        if burst > 0:
+            accounts = [row[0] for row in self.ACCOUNT_ID_LIST] or [self.BASE_ACCOUNT_ID]
+            with ThreadPoolExecutor(max_workers=workers or self.WORKERS) as executor:
+                futures = [executor.submit(self._round, accounts[index % len(accounts)]) for index in range(burst)]
+                for future in futures:
+                    try:
+                        result["calls"] += future.result()
+                    except Exception as e:
+                        result["errors"] += 1
+                        log.warning(f"Warmup round failed: {e}")
+        result["warmup_s"] = time.perf_counter() - start
+        log.info(f"Warmup finished: {result}")
+        return result
@@ -0,0 +1,74 @@
+import os
+from Utils.BankAPIBase import BankAPIBase
+
+
+class WorkerAccounts(BankAPIBase):
+    """
+    Provisions dedicated, funded accounts for one test process.
+
+    Functional tests assert exact balance deltas on BASE_ACCOUNT_ID, so two processes sharing that account race
+    each other. When the suite runs in parallel (pytest-xdist) every worker provisions its own account(s) under
+    the shared customer and rebinds BASE_ACCOUNT_ID to them, so the existing tests run unchanged and isolated.
+    """
+
+    XDIST_WORKER_ENV = "PYTEST_XDIST_WORKER"  # Set by pytest-xdist in every worker process (gw0, gw1 ...)
+    CHECKING = 0  # Parabank account type of the provisioned accounts
+    NEW_ACCOUNT_TRANSFER = 100  # Parabank moves this amount from the source account into every new account
+    # Demo customer's account below MIN_TEST_ACCOUNT_ID: never in ACCOUNT_ID_LIST, never provisioned or leased, so
+    # no test tracks its balance while every process debits the new-account transfers from it
+    FUNDING_ACCOUNT_ID = 13344
+
+    @classmethod
+    def worker_id(cls):
+        """Returns the pytest-xdist worker ID, or "master" when not running under xdist."""
+        return os.environ.get(cls.XDIST_WORKER_ENV, "master")
+
+    @classmethod
+    def is_xdist_worker(cls):
+        """Whether this process is a pytest-xdist worker."""
+        return cls.XDIST_WORKER_ENV in os.environ
+
+    def provision(self, count=1, funding=10000, source_account_id=None):
+        """
+        Creates and funds new accounts for the base customer.
+
+        Args:
+            count (int): Number of accounts to create.
+            funding (float): Balance each new account should start with.
+            source_account_id (int): Account the initial $100 transfer is taken from (defaults to
+                FUNDING_ACCOUNT_ID).
+
+        Returns:
+            list: IDs of the new accounts.
+
+        Raises:
+            RuntimeError: If Parabank refuses to create an account.
+        """
+        log = self.get_logger()
+        customer_id = self.CUSTOMER_ID[0][0]
+        source_account_id = source_account_id or self.FUNDING_ACCOUNT_ID
+
+        account_ids = []
+        for _ in range(count):
+            account_id = self.create_new_account(customer_id, self.CHECKING, source_account_id)
+            if isinstance(account_id, dict):
+                raise RuntimeError(f"Could not provision an account for worker {self.worker_id()}: {account_id}")
+            if funding > self.NEW_ACCOUNT_TRANSFER:
+                self.deposit_to_account(account_id, funding - self.NEW_ACCOUNT_TRANSFER)
+            account_ids.append(account_id)
+
+        log.info(f"Worker {self.worker_id()} provisioned accounts {account_ids} with {funding} each")
+        return account_ids
+
+    def isolate(self, count=1, funding=10000, source_account_id=None):
+        """
+        Provisions accounts and makes the first one this process's BASE_ACCOUNT_ID.
+
+        The shared ACCOUNT_ID_LIST and CUSTOMER_ID are kept, so read-only fan-outs still see every test account.
+
+        Returns:
+            list: IDs of the provisioned accounts.
+        """
+        account_ids = self.provision(count, funding, source_account_id)
+        self.bind_test_data(self.ACCOUNT_ID_LIST, self.CUSTOMER_ID, base_account_id=account_ids[0])
+        return account_ids
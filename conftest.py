@@ -1,4 +1,5 @@
 import os
+import json
 import time
 from datetime import datetime
 import pytest
@@ -10,6 +11,21 @@ from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
+from Utils.HTTPClient import HTTPClient
+from Utils.AsyncBankAPIBase import AsyncBankAPIBase
+from Utils.BaseClass import BaseClass
+from Utils.WorkerAccounts import WorkerAccounts
+from Utils.AccountPool import AccountPool
+from Utils.BankAPIBase import BankAPIBase
+from Utils.BalanceLedger import BalanceLedger
+from Utils.LatencyStats import LatencyStats
+from Utils.LatencyHistogram import LatencyHistogram
+from Utils.PayloadPool import PayloadPool
+from Utils.PerfBaseline import PerfBaseline, PerfBaselineMissingError
+from Utils.DBStateManager import DBStateManager
+from Utils.Warmup import Warmup
+from Simulators.ParabankMock import ParabankMock
+from Simulators.FaultProxy import FaultProxy
 
 # Global driver instance
 driver = None
@@ -26,6 +42,50 @@ def pytest_addoption(parser):
     parser.addoption(
         "--run_env", action="store", default="local", help="Specify the environment: local or docker"
     )
+    parser.addoption(
+        "--isolate_accounts", action="store_true", default=False,
+        help="Give this test process its own funded base account (always on under pytest-xdist)"
+    )
+    parser.addoption(
+        "--worker_account_funding", action="store", type=float, default=10000,
+        help="Starting balance of each account provisioned for an isolated test process"
+    )
+    parser.addoption(
+        "--account_pool_size", action="store", type=int, default=AccountPool.POOL_SIZE,
+        help="Number of funded accounts pre-provisioned per test process for the pooled_account fixture"
+    )
+    parser.addoption(
+        "--ledger_verify", action="store", default=BalanceLedger.EVERY_N, choices=BalanceLedger.POLICIES,
+        help="When the balance_ledger fixture reads balances back: every_op, every_n or at_end"
+    )
+    parser.addoption(
+        "--ledger_verify_every", action="store", type=int, default=10,
+        help="Operations between balance verifications for --ledger_verify=every_n"
+    )
+    parser.addoption(
+        "--update_baseline", action="store_true", default=False,
+        help="Record the performance scenarios' results as their new baselines instead of checking them"
+    )
+    parser.addoption(
+        "--perf_threshold", action="append", default=[], metavar="METRIC=FRACTION", type=PerfBaseline.parse_threshold,
+        help="Override a regression threshold, e.g. --perf_threshold p95_ms=0.5 (repeatable)"
+    )
+    parser.addoption(
+        "--warmup_burst", action="store", type=int, default=Warmup.BURST,
+        help="Rounds of read-only API calls sent before the first test, excluded from the latency statistics"
+    )
+    parser.addoption(
+        "--no_warmup", action="store_true", default=False,
+        help="Skip the session-start readiness checks and warmup burst"
+    )
+    parser.addoption(
+        "--mock_parabank", action="store_true", default=False,
+        help="Run the API tests against the in-memory Parabank mock instead of a Parabank server"
+    )
+    parser.addoption(
+        "--mock_latency_ms", action="store", type=float, default=0.0,
+        help="Artificial latency of every mock response (with --mock_parabank)"
+    )
 
 
 # Browser Options
@@ -100,6 +160,166 @@ def setup_browser(request):
     driver.quit()
 
 
+@pytest.fixture(scope='class')
+def async_bank_api(request):
+    """
+    Class-scoped AsyncBankAPIBase running on its own event loop.
+
+    Sync test methods drive it with `async_bank_api.run(coro)`; the client is also exposed as `self.async_api`
+    on the requesting test class.
+    """
+    api = AsyncBankAPIBase().start()
+    if request.cls is not None:
+        request.cls.async_api = api
+    yield api
+    api.stop()
+
+
+@pytest.fixture
+def fault_proxy():
+    """Routes this process's API calls through a FaultProxy in front of the current Parabank base URL."""
+    upstream = BankAPIBase.base_url
+    proxy = FaultProxy(upstream, seed=1).start()
+    BankAPIBase.use_base_url(proxy.base_url)
+    try:
+        yield proxy
+    finally:
+        BankAPIBase.use_base_url(upstream)
+        proxy.stop()
+
+
+@pytest.fixture
+def http_client_settings():
+    """Settings of the shared HTTPClient; the client is rebuilt from them after a test that reconfigures it."""
+    previous = HTTPClient.shared().settings()
+    yield previous
+    HTTPClient.configure(**previous)
+
+
+@pytest.fixture(scope='session', autouse=True)
+def warmup(request):
+    """
+    Waits for Parabank and HSQLDB with backoff and warms every endpoint before the first test.
+
+    The warmup calls are tagged as warmup traffic and kept out of the session and per-test latency statistics.
+    """
+    if request.config.getoption('no_warmup'):
+        return None
+    return Warmup().run(burst=request.config.getoption('warmup_burst'),
+                        database=not request.config.getoption('mock_parabank'))
+
+
+@pytest.fixture(scope='session', autouse=True)
+def worker_accounts(request, warmup):
+    """
+    Provisions isolated accounts for this process when running in parallel.
+
+    Under pytest-xdist (`pytest -n auto`) or with --isolate_accounts, the worker gets its own funded account and
+    BASE_ACCOUNT_ID points at it for the whole session, so balance assertions never race with other workers.
+    """
+    if not (WorkerAccounts.is_xdist_worker() or request.config.getoption('isolate_accounts')):
+        yield []
+        return
+    funding = request.config.getoption('worker_account_funding')
+    with LatencyStats.unattributed():  # Session setup, not part of the first test's latencies
+        account_ids = WorkerAccounts().isolate(count=1, funding=funding)
+    yield account_ids
+
+
+@pytest.fixture(scope='session')
+def account_pool(request, worker_accounts):
+    """Per-process pool of pre-funded accounts, provisioned in bulk the first time a test needs one."""
+    pool = AccountPool(size=request.config.getoption('account_pool_size'))
+    pool.fill()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def pooled_account(account_pool):
+    """
+    Leases a funded account with a locally known balance for one test and recycles it afterwards.
+
+    The account's balance is re-read (and topped up) by the pool's background recycler, not by the test.
+    """
+    lease = account_pool.lease()
+    yield lease
+    account_pool.release(lease, lease.verified_balance)
+
+
+@pytest.fixture
+def balance_ledger(request):
+    """
+    BalanceLedger that tracks expected balances locally and verifies them per --ledger_verify.
+
+    Any remaining unverified accounts are verified at teardown. When the test also leases a pooled account,
+    the ledger starts from the lease's known balance and hands a verified final balance back to the pool.
+    """
+    ledger = BalanceLedger(BankAPIBase(), policy=request.config.getoption('ledger_verify'),
+                           every_n=request.config.getoption('ledger_verify_every'))
+    lease = request.getfixturevalue('pooled_account') if 'pooled_account' in request.fixturenames else None
+    if lease is not None:
+        ledger.track(lease.account_id, lease.balance)
+
+    yield ledger
+
+    ledger.verify_all()
+    if lease is not None:
+        lease.verified_balance = ledger.verified_balance(lease.account_id)
+
+
+@pytest.fixture(scope='session')
+def billpay_payloads():
+    """Process-wide ring of pre-generated, pre-serialized billpay payees (seed with PARABANK_PAYLOAD_SEED)."""
+    return PayloadPool.shared()
+
+
+@pytest.fixture
+def perf_baseline(request):
+    """
+    Returns check(scenario, results): compares results with the scenario's stored baseline (see PerfBaseline).
+
+    Baselines are kept per target: "mock" with --mock_parabank, otherwise the Parabank host. Fails the test with a
+    per-endpoint diff on a regression and skips it when the target has no baseline yet; --update_baseline (or
+    PARABANK_UPDATE_BASELINE=1) records one. --perf_threshold overrides the stored thresholds.
+    """
+    thresholds = dict(request.config.getoption('perf_threshold'))
+    update = request.config.getoption('update_baseline') or None
+    mock = request.config.getoption('mock_parabank')
+    target = "mock" if mock else PerfBaseline.target_of(BankAPIBase.base_url)
+
+    def check(scenario, results):
+        try:
+            return PerfBaseline(scenario, target, thresholds=thresholds).check(results, update=update)
+        except PerfBaselineMissingError as e:
+            pytest.skip(f"{e} or --update_baseline")
+
+    return check
+
+
+@pytest.fixture(scope='module')
+def restore_db(request):
+    """
+    For modules that reset or rewrite the database: has the dataset the session started with restored at the end.
+
+    The restore runs once, after every test of the session (under xdist on the controller, once all workers have
+    finished), never between modules, where it would delete the accounts the other tests and workers provisioned.
+    Tests using this fixture run after all other tests of their process; under xdist they may still overlap with
+    other workers' tests, so run them separately (e.g. -m reset) when that matters.
+    """
+    request.config._db_restore_needed = True
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_collection(session):
+    """Keeps collection from bootstrapping the DB test data; it loads on first use inside a test instead."""
+    BaseClass._defer_test_data = True
+    try:
+        yield
+    finally:
+        BaseClass._defer_test_data = False
+
+
 def pytest_configure(config):
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     report_dir = 'Reports'
@@ -107,6 +327,59 @@ def pytest_configure(config):
     report_filename = os.path.join(report_dir, f"Report_{timestamp}.html")
     config.option.htmlpath = report_filename
 
+    # The controller starts one mock and hands its URL and test data to the xdist workers through the environment
+    if config.getoption("mock_parabank") and not hasattr(config, "workerinput"):
+        config._parabank_mock = ParabankMock(latency_ms=config.getoption("mock_latency_ms")).start()
+        os.environ["PARABANK_BASE_URL"] = config._parabank_mock.base_url
+        os.environ[BaseClass.TEST_DATA_ENV] = config._parabank_mock.test_data_env()
+        logger.info(f"Running against the Parabank mock at {config._parabank_mock.base_url}")
+    if config.getoption("mock_parabank"):
+        BankAPIBase.use_base_url(os.environ["PARABANK_BASE_URL"])
+
+
+def pytest_sessionstart(session):
+    """Snapshots the database on the controller before any test runs, for the end-of-session restore."""
+    config = session.config
+    if hasattr(config, "workerinput"):
+        return
+    config._db_state = DBStateManager()
+    if config.getoption("mock_parabank"):
+        return  # The mock has no HSQLDB; a restore resets it through /initializeDB
+    try:
+        config._db_state.snapshot()
+    except Exception as e:
+        logger.warning(f"No DB snapshot taken, a database restore will fall back to /initializeDB: {e}")
+
+
+def pytest_collection_modifyitems(items):
+    """Runs the tests that reset the database (restore_db fixture) after all other tests of this process."""
+    items.sort(key=lambda item: "restore_db" in item.fixturenames)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collects on the xdist controller whether a worker ran tests that need the database restored."""
+    if getattr(node, "workeroutput", {}).get("db_restore_needed"):
+        node.config._db_restore_needed = True
+
+
+def _restore_db_after_session(config):
+    if hasattr(config, "workerinput"):
+        # Reported to the controller with the worker's output (pytest_testnodedown)
+        config.workeroutput["db_restore_needed"] = getattr(config, "_db_restore_needed", False)
+        return
+    if getattr(config, "_db_restore_needed", False):
+        try:
+            config._db_state.restore()
+        except Exception as e:
+            logger.error(f"The database was not restored after the session: {e}")
+
+
+def pytest_unconfigure(config):
+    mock = getattr(config, "_parabank_mock", None)
+    if mock is not None:
+        mock.stop()
+
 
 def _capture_screenshot(file_path):
     try:
@@ -146,3 +419,71 @@ def pytest_runtest_makereport(item):
                 )
                 extra.append(pytest_html.extras.html(html))
             report.extra = extra
+
+    # Per-test API latency table, attached once the whole test (setup, call and teardown) has run
+    if report.when == 'teardown' and pytest_html is not None:
+        stats = LatencyStats.test_stats(item.nodeid)
+        if stats:
+            extra.append(pytest_html.extras.html(LatencyStats.html_table(stats)))
+            report.extra = extra
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item):
+    """Groups the API latencies recorded while a test runs under its node ID."""
+    LatencyStats.set_current_test(item.nodeid)
+    try:
+        yield
+    finally:
+        LatencyStats.set_current_test(None)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix):
+    """Adds the session-wide API latency table to the pytest-html summary."""
+    stats = LatencyStats.session_stats()
+    if stats:
+        prefix.append("<h2>API latency per endpoint</h2>" + LatencyStats.html_table(stats))
+
+
+def pytest_sessionfinish(session):
+    """
+    Writes the per-endpoint and per-test latency summary and the mergeable histograms next to the HTML report.
+
+    The file names carry the xdist worker ID ("master" without xdist), so workers that start within the same
+    second do not overwrite each other's files. Also restores the database if tests reset it (restore_db).
+    """
+    _restore_db_after_session(session.config)
+    htmlpath = getattr(session.config.option, 'htmlpath', None)
+    if not htmlpath or not LatencyStats.session_stats():
+        return
+    worker_id = WorkerAccounts.worker_id()
+    prefix = f"{os.path.splitext(htmlpath)[0]}_{worker_id}"
+    with open(prefix + "_latency.json", "w") as f:
+        json.dump(LatencyStats.to_dict(), f, indent=2)
+    # Mergeable total-time histograms of this process (merge xdist workers/runs with Tools.merge_latency_histograms)
+    LatencyHistogram.dump_endpoints(prefix + "_histograms.json", LatencyStats.histograms(), [f"pytest:{worker_id}"])
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Prints HTTP and JDBC connection pool statistics at the end of the run."""
+    if BaseClass._db_pool is not None:
+        db = BaseClass._db_pool.metrics()
+        terminalreporter.write_sep("-", "JDBC connection pool")
+        terminalreporter.write_line(
+            f"queries: {db['executes']}, connects: {db['connects']}, reuses: {db['reuses']}, "
+            f"avg connect: {db['avg_connect_time'] * 1000:.1f} ms, avg execute: {db['avg_execute_time'] * 1000:.1f} ms"
+        )
+
+    stats = HTTPClient.shared().stats()
+    if not stats["requests"]:
+        return
+    terminalreporter.write_sep("-", "HTTP connection pool")
+    terminalreporter.write_line(
+        f"requests: {stats['requests']}, errors: {stats['errors']}, "
+        f"connections opened: {stats['connections_opened']}, reuse rate: {stats['reuse_rate']:.1%}"
+    )
+    for host, pool in stats["pools"].items():
+        terminalreporter.write_line(
+            f"  {host} - requests: {pool['requests']}, opened: {pool['connections_opened']}, idle: {pool['idle']}"
+        )